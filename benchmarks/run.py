@@ -0,0 +1,96 @@
+# benchmarks/run.py
+"""
+Standalone benchmark runner:
+
+    python -m benchmarks.run --scales 1 10 --solvers random greedy --out bench.json
+
+For every (scale, solver) it generates a synthetic institute (benchmarks.synthetic),
+runs generate_timetable() and records wall time, peak traced memory, the share of
+required sessions left unscheduled and the scheduler's stats (placement probes,
+rejections by reason, ...; see TimetableScheduler.enable_stats). Results are written
+as JSON so runs can be compared for regressions.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from src.csv_import import feed_courses
+from src.scheduler import TimetableScheduler
+
+from .synthetic import make_institute
+
+
+def _build(scale, seed):
+    courses, rooms = make_institute(scale, seed)
+    scheduler = TimetableScheduler()
+    scheduler.set_rooms(rooms)
+    feed_courses(scheduler, courses)
+    return scheduler
+
+
+def run_case(scale, solver, seed=0, time_budget=10.0, memory=True):
+    """Benchmark one (scale, solver) pair; returns a JSON-ready dict."""
+    scheduler = _build(scale, seed)
+    scheduler.enable_stats()
+    start = time.perf_counter()
+    timetable, unscheduled = scheduler.generate_timetable(
+        notify=False, solver=solver, seed=seed, time_budget=time_budget)
+    wall = time.perf_counter() - start
+
+    report = scheduler.validate()
+    missing = sum(needed - placed for *_, needed, placed in report.shortfall)
+    required = report.sessions + missing
+    result = {
+        "scale": scale,
+        "solver": solver,
+        "seed": seed,
+        "courses": sum(len(c) for sems in scheduler.courses.values() for c in sems.values()),
+        "rooms": len(scheduler.room_pool),
+        "sessions_required": required,
+        "sessions_placed": report.sessions,
+        "unscheduled_rate": missing / required if required else 0.0,
+        "conflicts": len(report.room) + len(report.faculty) + len(report.cohort),
+        "probes": scheduler.stats.probes,
+        "wall_seconds": wall,
+        "stats": scheduler.stats.as_dict(),
+    }
+    if memory:
+        # a second run under tracemalloc, which would distort the timing above
+        scheduler = _build(scale, seed)
+        tracemalloc.start()
+        try:
+            scheduler.generate_timetable(notify=False, solver=solver, seed=seed, time_budget=time_budget)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="institute sizes (1 = IIIT Dharwad)")
+    parser.add_argument("--solvers", nargs="+", choices=TimetableScheduler.SOLVERS, default=["random", "greedy"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-budget", type=float, default=10.0, help="seconds for the exact solver")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--out", default="bench.json", help="JSON file for the results")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scales:
+        for solver in args.solvers:
+            result = run_case(scale, solver, args.seed, args.time_budget, memory=not args.no_memory)
+            results.append(result)
+            print(f"scale {scale:>4} {solver:<7} {result['wall_seconds']:8.3f}s "
+                  f"unscheduled {result['unscheduled_rate']:6.1%} probes {result['probes']}", file=sys.stderr)
+
+    with open(args.out, "w") as f:
+        json.dump({"python": platform.python_version(), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
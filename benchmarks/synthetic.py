@@ -0,0 +1,58 @@
+# benchmarks/synthetic.py
+"""
+Seeded synthetic institutes for benchmarking. Scale 1 is roughly IIIT Dharwad
+(3 branches x 4 semesters, ~7 courses per semester, ~36 rooms); scale k has k times
+the branches, faculty and rooms, so the load per room and per faculty stays similar.
+"""
+import random
+
+BASE_BRANCHES = ("CSE", "DSAI", "ECE")
+SEMESTERS = ("1", "3", "5", "7")
+COURSES_PER_SEMESTER = 7
+FACULTY_PER_BRANCH = 16
+# (room type, capacity, rooms per branch)
+ROOM_MIX = (("Large classroom", 180, 2), ("Classroom", 120, 4), ("Small classroom", 60, 3), ("Lab", 90, 3))
+# (lecture, tutorial, lab) hours, as in the L-T-P-S-C column of the registrar export
+LTP_CHOICES = ((3, 0, 0), (3, 1, 0), (2, 1, 0), (3, 0, 2), (2, 0, 2), (3, 1, 2), (1, 0, 4))
+
+
+def make_institute(scale=1, seed=0):
+    """
+    Returns (course rows, rooms) in the formats of csv_import.iter_courses() and
+    csv_import.iter_classrooms(); the same (scale, seed) always gives the same data.
+    """
+    rng = random.Random(seed)
+    branches = [b if k == 0 else f"{b}{k}" for k in range(scale) for b in BASE_BRANCHES]
+
+    rooms = []
+    for i, _ in enumerate(branches):
+        for room_type, capacity, count in ROOM_MIX:
+            for j in range(count):
+                prefix = "L" if room_type == "Lab" else "C"
+                rooms.append({"room_no": f"{prefix}{i:03d}{j}{capacity}", "room_type": room_type.lower(),
+                              "capacity": capacity})
+
+    faculty = [f"Dr. Faculty {i}" for i in range(FACULTY_PER_BRANCH * len(branches))]
+    courses = []
+    for b, branch in enumerate(branches):
+        # mostly faculty of the own department, sometimes someone from another one
+        own = faculty[b * FACULTY_PER_BRANCH:(b + 1) * FACULTY_PER_BRANCH]
+        for sem in SEMESTERS:
+            students = rng.choice((60, 90, 120, 170))
+            for c in range(COURSES_PER_SEMESTER):
+                lecture, tutorial, lab = rng.choice(LTP_CHOICES)
+                names = [rng.choice(own) if rng.random() < 0.9 else rng.choice(faculty)]
+                if rng.random() < 0.15:
+                    names.append(rng.choice(own))
+                courses.append({
+                    "code": f"{branch}{sem}{c:02d}",
+                    "name": f"{branch} Course {sem}.{c}",
+                    "faculty": names,
+                    "lecture_hours": lecture,
+                    "tutorial_hours": tutorial,
+                    "lab_hours": lab,
+                    "students": students,
+                    "semester": sem,
+                    "branch": branch,
+                })
+    return courses, rooms
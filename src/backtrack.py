@@ -0,0 +1,275 @@
+# src/backtrack.py
+import time
+from collections import deque
+from .utils import DAYS
+
+
+class _Level:
+    """One decision on the search stack."""
+    __slots__ = ("var", "values", "pos", "conf", "prunes")
+
+    def __init__(self, var, values):
+        self.var = var
+        self.values = values
+        self.pos = 0
+        # earlier levels responsible for failures below this one
+        self.conf = set()
+        # (var, removed values) pruned by forward checking for the current value
+        self.prunes = []
+
+
+class BacktrackingEngine:
+    """
+    Exact search over the sessions produced by TimetableScheduler._build_sessions().
+
+    Every session is a variable whose domain is the (day, slot, room) triples it could
+    take given what is already placed on the scheduler. The search uses:
+      - arc consistency (AC-3) on the initial domains, plus a pigeonhole check on the
+        one-session-per-day rule of each course,
+      - forward checking after every assignment,
+      - smallest-domain-first variable ordering (ties: most neighbours),
+      - conflict-directed backjumping (FC-CBJ) on dead ends,
+    and stops when time_budget seconds run out. The budget covers setup and AC-3 too:
+    if it runs out before the search starts, nothing is placed and every session goes
+    back to the caller.
+
+    solve() places the best assignment found onto the scheduler and returns the
+    sessions it could not place, so the caller can fall back to greedy placement.
+    """
+
+    # pool-assigned sessions only consider this many of their best-fitting rooms
+    MAX_ROOMS = 4
+
+    def __init__(self, scheduler, sessions, rng, time_budget=10.0):
+        self.scheduler = scheduler
+        self.sessions = sessions
+        self.rng = rng
+        self.time_budget = time_budget
+        # stats of the last solve()
+        self.nodes = 0
+        self.backjumps = 0
+        self.timed_out = False
+        self.complete = False
+        self.deadline = None
+
+    def _out_of_time(self):
+        if time.monotonic() > self.deadline:
+            self.timed_out = True
+        return self.timed_out
+
+    # --- problem setup ---
+    def _initial_domain(self, s):
+        sched = self.scheduler
+        can_place, _ = sched._probes()
+        values = [
+            (day, slot, room)
+            for day in DAYS
+            for slot in sched.TYPE_POOLS[s.ctype]
+            for room in s.rooms[:self.MAX_ROOMS]
+            if can_place(s.branch, s.sem, s.code, room, day, slot, s.faculty)
+        ]
+        self.rng.shuffle(values)
+        return values
+
+    def _setup(self):
+        n = len(self.sessions)
+        self.overlaps = self.scheduler.catalogue.overlaps
+        self.course_key = [s.course_id for s in self.sessions]
+        self.shared_keys = [self.scheduler._shared_keys(s) for s in self.sessions]
+        self.students = [(s.cohorts, s.enroll_id) for s in self.sessions]
+        self.domain = []
+        for s in self.sessions:
+            if self._out_of_time():
+                return
+            self.domain.append(self._initial_domain(s))
+
+        # vars sharing a cohort, a static resource or any room they might use are neighbours
+        groups = {}
+        for i, s in enumerate(self.sessions):
+            keys = set(self.shared_keys[i])
+            keys.update(("cohort", *cohort) for cohort in s.cohorts)
+            keys.update(("room", v[2]) for v in self.domain[i])
+            for key in keys:
+                groups.setdefault(key, []).append(i)
+        neighbours = [set() for _ in range(n)]
+        for members in groups.values():
+            if self._out_of_time():
+                return
+            for i in members:
+                neighbours[i].update(members)
+        # ... and so are sessions of enrolled courses sharing a student
+        enrollment = self.scheduler.enrollment
+        if enrollment is not None:
+            by_course = {}
+            for i, s in enumerate(self.sessions):
+                if s.enroll_id >= 0:
+                    by_course.setdefault(s.enroll_id, []).append(i)
+            for gid, members in by_course.items():
+                adj = enrollment.adjacency[gid]
+                linked = [j for other, js in by_course.items() if adj >> other & 1 for j in js]
+                for i in members:
+                    neighbours[i].update(linked)
+        for i in range(n):
+            neighbours[i].discard(i)
+        self.neighbours = [sorted(nb) for nb in neighbours]
+
+    def _clash(self, i, vi, j, vj):
+        di, si, ri = vi
+        dj, sj, rj = vj
+        if di != dj:
+            return False
+        # same course never twice in one day
+        if self.course_key[i] == self.course_key[j]:
+            return True
+        if not self.overlaps(si, sj):
+            return False
+        if ri == rj:
+            return True
+        if not self.shared_keys[i].isdisjoint(self.shared_keys[j]):
+            return True
+        return self.scheduler._share_students(*self.students[i], *self.students[j])
+
+    def _drop_day_surplus(self, active):
+        """
+        Sessions of one course need pairwise different days; a course with more sessions
+        than available days can never be completed, so drop its least constrained surplus
+        up front instead of letting the search prove it the hard way.
+        """
+        by_course = {}
+        for i in active:
+            by_course.setdefault(self.course_key[i], []).append(i)
+        for members in by_course.values():
+            days = {v[0] for i in members for v in self.domain[i]}
+            surplus = len(members) - len(days)
+            if surplus > 0:
+                for i in sorted(members, key=lambda i: (-len(self.domain[i]), i))[:surplus]:
+                    active.discard(i)
+
+    def _arc_consistency(self, active):
+        """
+        AC-3 over the active vars; vars wiped out here can never be placed and are dropped.
+        Stopping early (out of time) leaves domains that are still safe, just less pruned.
+        """
+        queue = deque((i, j) for i in active for j in self.neighbours[i] if j in active)
+        while queue:
+            self.scheduler._check_cancel()
+            if self._out_of_time():
+                return
+            i, j = queue.popleft()
+            if i not in active or j not in active:
+                continue
+            dj = self.domain[j]
+            kept = [a for a in self.domain[i] if any(not self._clash(i, a, j, b) for b in dj)]
+            if len(kept) == len(self.domain[i]):
+                continue
+            self.domain[i] = kept
+            if not kept:
+                active.discard(i)
+                continue
+            queue.extend((k, i) for k in self.neighbours[i] if k in active and k != j)
+
+    # --- search ---
+    def _select(self):
+        return min(self.unassigned, key=lambda v: (len(self.domain[v]), -len(self.neighbours[v]), v))
+
+    def _forward_check(self, k, v, val):
+        level = self.stack[k]
+        for j in self.neighbours[v]:
+            if j not in self.unassigned:
+                continue
+            keep, removed = [], []
+            for w in self.domain[j]:
+                (removed if self._clash(v, val, j, w) else keep).append(w)
+            if removed:
+                self.domain[j] = keep
+                level.prunes.append((j, removed))
+                self.past_fc[j].append(k)
+                if not keep:
+                    return j
+        return None
+
+    def _undo_prunes(self, level):
+        while level.prunes:
+            j, removed = level.prunes.pop()
+            self.domain[j].extend(removed)
+            self.past_fc[j].pop()
+
+    def _push(self):
+        v = self._select()
+        self.unassigned.discard(v)
+        self.stack.append(_Level(v, list(self.domain[v])))
+
+    def solve(self):
+        self.deadline = time.monotonic() + self.time_budget
+        self._setup()
+        if self.timed_out:
+            return list(self.sessions)
+        active = {i for i, d in enumerate(self.domain) if d}
+        self._drop_day_surplus(active)
+        self._arc_consistency(active)
+
+        self.assigned = {}
+        self.unassigned = set(active)
+        self.past_fc = [[] for _ in self.sessions]
+        self.stack = []
+        best = {}
+
+        if self.unassigned:
+            self._push()
+        else:
+            self.complete = True
+        while self.stack:
+            self.scheduler._check_cancel()
+            if self._out_of_time():
+                break
+            k = len(self.stack) - 1
+            level = self.stack[k]
+            v = level.var
+            consistent = False
+            while level.pos < len(level.values):
+                val = level.values[level.pos]
+                level.pos += 1
+                self.nodes += 1
+                self.assigned[v] = val
+                wiped = self._forward_check(k, v, val)
+                if wiped is None:
+                    consistent = True
+                    break
+                level.conf.update(l for l in self.past_fc[wiped] if l != k)
+                self._undo_prunes(level)
+                del self.assigned[v]
+
+            if consistent:
+                if len(self.assigned) > len(best):
+                    best = dict(self.assigned)
+                if not self.unassigned:
+                    self.complete = True
+                    break
+                self._push()
+                continue
+
+            # dead end: jump back to the most recent level responsible for it
+            conf = level.conf | set(self.past_fc[v])
+            conf.discard(k)
+            self.stack.pop()
+            self.unassigned.add(v)
+            if not conf:
+                break
+            h = max(conf)
+            self.backjumps += 1
+            while len(self.stack) - 1 > h:
+                skipped = self.stack.pop()
+                self._undo_prunes(skipped)
+                del self.assigned[skipped.var]
+                self.unassigned.add(skipped.var)
+            target = self.stack[h]
+            self._undo_prunes(target)
+            del self.assigned[target.var]
+            target.conf |= conf - {h}
+
+        solution = self.assigned if self.complete else best
+        sched = self.scheduler
+        for i, (day, slot, room) in solution.items():
+            s = self.sessions[i]
+            sched._place(s.branch, s.sem, s.code, s.info, s.ctype, room, day, slot)
+        return [s for i, s in enumerate(self.sessions) if i not in solution]
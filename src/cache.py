@@ -0,0 +1,148 @@
+# src/cache.py
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from .utils import split_faculty
+
+# bump when the stored payload or the fingerprinted inputs change meaning
+CACHE_VERSION = 3
+
+
+def fingerprint(scheduler, solver, seed, **options):
+    """
+    sha256 of everything a generation depends on, in canonical form: courses, room pool,
+    slot grid, session durations, faculty unavailability, enrollment conflicts, solver,
+    seed and options.
+    Str/int branch and semester keys and faculty spelling ("A; B" vs ["A", "B"]) don't
+    change the hash. Dict order doesn't either, except for the course order where the
+    result depends on it: the "random" and "exact" solvers draw from the seeded rng
+    course by course, and with enrollments a shared elective is led by the first
+    branch+sem listing it.
+    """
+    courses = sorted(
+        [str(b), str(s), code, info.get("name"), list(split_faculty(info.get("faculty"))),
+         info.get("class_room") or "", info.get("lab_room") or "",
+         int(info.get("lecture_hours") or 0), int(info.get("tutorial_hours") or 0),
+         int(info.get("lab_hours") or 0), int(info.get("students") or 0)]
+        for b, sems in scheduler.courses.items()
+        for s, by_code in sems.items()
+        for code, info in by_code.items())
+    rooms = [] if scheduler.room_pool is None else sorted(
+        (r["room_no"], r["room_type"], r["capacity"]) for r in scheduler.room_pool.as_rows())
+    graph = scheduler.enrollment
+    enrollment = None if graph is None else sorted(
+        [code, sorted(graph.neighbours(code))] for code in graph.courses.values)
+    payload = {
+        "version": CACHE_VERSION,
+        "courses": courses,
+        "rooms": rooms,
+        "slots": {ctype: list(pool) for ctype, pool in sorted(scheduler.TYPE_POOLS.items())},
+        "durations": sorted(scheduler.TYPE_DURATION.items()),
+        "unavailable": sorted([n, d, str(m)] for (n, d), m in scheduler.faculty_unavailable.items()),
+        "enrollment": enrollment,
+        "order": [[str(b), str(s), code] for b, sems in scheduler.courses.items()
+                  for s, by_code in sems.items() for code in by_code]
+        if solver in ("random", "exact") or graph is not None else None,
+        "solver": solver,
+        "seed": seed,
+        "options": sorted(options.items()),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _encode(timetable, unscheduled):
+    rows = [[branch, sem, day, slot, *entry]
+            for branch, sems in timetable.items()
+            for sem, table in sems.items()
+            for (day, slot, *_), entry in table.items()]
+    cohorts = [[branch, sem] for branch, sems in timetable.items() for sem in sems]
+    return json.dumps({"cohorts": cohorts, "sessions": rows, "unscheduled": [list(u) for u in unscheduled]},
+                      separators=(",", ":")).encode("utf-8")
+
+
+def _decode(blob):
+    data = json.loads(blob)
+    timetable = {}
+    for branch, sem in data["cohorts"]:
+        timetable.setdefault(branch, {})[sem] = {}
+    for branch, sem, day, slot, code, name, faculty, ctype, room in data["sessions"]:
+        timetable[branch][sem][(day, slot, code)] = (code, name, faculty, ctype, room)
+    return timetable, [tuple(u) for u in data["unscheduled"]]
+
+
+class TimetableCache:
+    """
+    Content-addressed store of generated (timetable, unscheduled) results keyed by
+    fingerprint(). Keeps up to max_entries results in memory (least recently used
+    evicted first) and, when `directory` is given, also as <key>.json files there
+    (up to max_disk_entries, oldest-used removed first), so hits survive restarts and
+    can be shared between machines.
+    """
+
+    def __init__(self, max_entries=64, directory=None, max_disk_entries=1024):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """(timetable, unscheduled) stored under key (a fresh copy), or None."""
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+        elif self.directory:
+            try:
+                with open(self._path(key), "rb") as f:
+                    blob = f.read()
+                os.utime(self._path(key))
+            except OSError:
+                blob = None
+            if blob is not None:
+                self._remember(key, blob)
+        if blob is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _decode(blob)
+
+    def put(self, key, timetable, unscheduled):
+        blob = _encode(timetable, unscheduled)
+        self._remember(key, blob)
+        if self.directory:
+            tmp = self._path(key) + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, self._path(key))
+            self._evict_disk()
+
+    def _remember(self, key, blob):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        files = [os.path.join(self.directory, f) for f in os.listdir(self.directory) if f.endswith(".json")]
+        if len(files) <= self.max_disk_entries:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.max_disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def __contains__(self, key):
+        return key in self._memory or bool(self.directory and os.path.exists(self._path(key)))
+
+    def __len__(self):
+        return len(self._memory)
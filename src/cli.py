@@ -0,0 +1,190 @@
+# src/cli.py
+"""
+Headless batch mode:
+
+    python -m src.cli generate --courses test_cases/routine.csv --rooms test_cases/room.csv \
+        --out timetables/ --seed 1 --restarts 8 --workers 4
+
+Exit status: 0 when every session was scheduled, 1 when some were not, the result
+failed validation or the output could not be written, 2 on bad arguments or
+unreadable input.
+
+    python -m src.cli serve --port 8765
+
+runs the local HTTP/JSON job service (service.py) until interrupted.
+"""
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+
+from .cache import TimetableCache
+from .csv_import import feed_courses, iter_classrooms, iter_courses, iter_enrollments
+from .enrollment import ConflictGraph
+from .scheduler import TimetableScheduler
+from .slots import SlotCatalogue
+from .store import ScheduleStore
+from .export import FORMATS, VIEWS, export_timetable
+
+
+@contextmanager
+def _phase(name):
+    """Print how long a phase took ("load: 0.012s") to stderr."""
+    start = time.perf_counter()
+    yield
+    print(f"{name}: {time.perf_counter() - start:.3f}s", file=sys.stderr)
+
+
+def build_scheduler(course_rows, rooms=None, slots=None):
+    """
+    Feed course rows (e.g. csv_import.iter_courses()) and optional rooms into a new
+    scheduler; `slots` is an optional SlotCatalogue replacing the built-in slot grid.
+    """
+    scheduler = TimetableScheduler(slots=slots)
+    if rooms:
+        scheduler.set_rooms(rooms)
+    feed_courses(scheduler, course_rows)
+    return scheduler
+
+
+def _generate(args):
+    errors = []
+    if not args.courses and not args.db:
+        print("error: --courses is required unless --db holds a saved state", file=sys.stderr)
+        return 2
+    try:
+        with _phase("load"):
+            rooms = list(iter_classrooms(args.rooms, errors)) if args.rooms else None
+            slots = SlotCatalogue.from_csv(args.slots) if args.slots else None
+            if args.courses:
+                # courses are streamed straight into the scheduler
+                scheduler = build_scheduler(iter_courses(args.courses, errors, args.branch), rooms, slots)
+            else:
+                with ScheduleStore(args.db) as store:
+                    scheduler = store.load(TimetableScheduler(slots=slots))
+                if rooms:
+                    scheduler.set_rooms(rooms)
+            if args.enrollment:
+                scheduler.set_enrollment(ConflictGraph.from_enrollments(iter_enrollments(args.enrollment, errors)))
+    except (ValueError, OSError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    for error in errors:
+        print(f"skipped row: {error}", file=sys.stderr)
+
+    if args.stats or args.profile:
+        scheduler.enable_stats(profile=args.profile)
+
+    with _phase("schedule"):
+        if args.restarts > 1:
+            if args.cache:
+                print("warning: --cache is not used with --restarts", file=sys.stderr)
+            timetable, unscheduled = scheduler.generate_best(
+                n_restarts=args.restarts, workers=args.workers, seed=args.seed,
+                solver=args.solver, time_budget=args.time_budget)
+        else:
+            cache = TimetableCache(directory=args.cache) if args.cache else None
+            timetable, unscheduled = scheduler.generate_timetable(
+                notify=False, solver=args.solver, seed=args.seed, time_budget=args.time_budget, cache=cache,
+                decompose=args.decompose, workers=args.workers)
+
+    if args.stats:
+        print(json.dumps(scheduler.stats.as_dict(), indent=2), file=sys.stderr)
+
+    if args.optimize:
+        with _phase("optimize"):
+            scheduler.optimize(time_budget=args.optimize, seed=args.seed)
+
+    with _phase("validate"):
+        problems = scheduler.validate().lines()
+    for line in problems:
+        print(line, file=sys.stderr)
+
+    try:
+        with _phase("export"):
+            paths = export_timetable(timetable, args.out, formats=args.format or ["csv"],
+                                     views=args.views or ["cohort"], zip_path=args.zip, catalogue=scheduler.catalogue)
+            if args.db:
+                with ScheduleStore(args.db) as store:
+                    store.save(scheduler)
+                    if args.snapshot:
+                        store.snapshot(args.snapshot, scheduler)
+    except (OSError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    sessions = sum(len(table) for sems in timetable.values() for table in sems.values())
+    print(f"{sessions} sessions scheduled, {len(paths)} files written to {args.zip or args.out}", file=sys.stderr)
+    for e in scheduler.explain_unscheduled():
+        print(f"unscheduled: {e.branch} Sem-{e.sem}: {e.name} ({e.ctype}) - {e.summary}", file=sys.stderr)
+    return 1 if unscheduled or problems else 0
+
+
+def _serve(args):
+    import asyncio
+    from .service import SchedulingService
+    service = SchedulingService(workers=args.workers, max_pending=args.max_pending)
+    print(f"serving on http://{args.host}:{args.port}/jobs", file=sys.stderr)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Automated timetable generator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="generate and export timetables from CSV input")
+    gen.add_argument("--courses", help="course CSV (see csv_import.load_courses); optional with --db")
+    gen.add_argument("--rooms", help="classroom CSV used as the room pool")
+    gen.add_argument("--slots", help="CSV with a custom slot grid (columns: type, slot)")
+    gen.add_argument("--enrollment", metavar="CSV",
+                     help="student,course code CSV; student clashes then follow enrollments, not branch+sem")
+    gen.add_argument("--branch", default="", help="branch for course files without a branch column")
+    gen.add_argument("--out", default=".", help="directory for the exported CSV files")
+    gen.add_argument("--format", action="append", choices=FORMATS,
+                     help="export format, repeatable (default: csv)")
+    gen.add_argument("--views", nargs="+", choices=VIEWS,
+                     help="what to export: per branch+sem, per faculty, per room, master sheet (default: cohort)")
+    gen.add_argument("--zip", metavar="PATH", help="write all exported files into this zip instead of --out")
+    gen.add_argument("--seed", type=int, default=None, help="seed for reproducible runs")
+    gen.add_argument("--solver", choices=TimetableScheduler.SOLVERS, default="greedy")
+    gen.add_argument("--restarts", type=int, default=1, help="independent attempts, best one kept")
+    gen.add_argument("--workers", type=int, default=None, help="processes used for restarts (or components with --decompose)")
+    gen.add_argument("--decompose", action="store_true",
+                     help="solve groups of cohorts sharing no room, faculty or student separately, in parallel")
+    gen.add_argument("--time-budget", type=float, default=10.0, help="seconds for the exact solver")
+    gen.add_argument("--optimize", type=float, default=0.0, metavar="SECONDS",
+                     help="run the soft-constraint optimizer for this long")
+    gen.add_argument("--cache", metavar="DIR",
+                     help="reuse results of identical earlier runs (same inputs, solver and seed) stored in DIR")
+    gen.add_argument("--db", help="SQLite file the state is saved to (and loaded from without --courses)")
+    gen.add_argument("--snapshot", metavar="NAME", help="also keep the timetable as a named snapshot in --db")
+    gen.add_argument("--stats", action="store_true",
+                     help="print probe / rejection / timing counters as JSON to stderr")
+    gen.add_argument("--profile", metavar="PATH", help="write a cProfile profile of the scheduling run")
+    gen.set_defaults(func=_generate)
+
+    serve = sub.add_parser("serve", help="run the local HTTP/JSON scheduling service (see service.py)")
+    serve.add_argument("--host", default="127.0.0.1", help="address to bind (default: localhost only)")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", type=int, default=2, help="jobs solved at the same time")
+    serve.add_argument("--max-pending", type=int, default=32, help="queued + running jobs accepted")
+    serve.set_defaults(func=_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,56 +1,244 @@
 import csv
-from tkinter import messagebox
+import re
+from itertools import islice
 
-def load_classrooms(csv_path):
-    """Reads classroom CSV and returns a list of dicts."""
-    classrooms = []
-    try:
-        with open(csv_path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            required_cols = {"room no", "room type", "room capacity"}
-            if not required_cols.issubset({c.strip().lower() for c in reader.fieldnames}):
-                messagebox.showerror("Error", "Invalid Classroom CSV format!")
-                return []
-            for row in reader:
-                classrooms.append({
-                    "room_no": row.get("room no", "").strip(),
-                    "room_type": row.get("room type", "").strip().lower(),
-                    "capacity": int(row.get("room capacity", 0)),
-                })
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read classrooms CSV: {e}")
-    return classrooms
 
+class CSVImportError(ValueError):
+    """Raised when a classroom/course CSV can't be read or has the wrong format."""
+
+
+class CSVRowError(CSVImportError):
+    """A single unusable row; `line` is its line number in the file."""
+
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+# field -> accepted (lower-cased) header spellings, first match wins
+COURSE_HEADER_ALIASES = {
+    "code": ("course code", "code"),
+    "name": ("course name", "course title", "title"),
+    "faculty": ("faculty name", "faculty", "instructor"),
+    "ltpsc": ("l-t-p-s-c", "credits (l-t-p-s-c)", "ltpsc", "credits"),
+    "students": ("no. of students registered", "no. of students", "no of students",
+                 "no of student", "students", "strength"),
+    "semester": ("semester", "sem"),
+    "branch": ("branch", "program", "programme"),
+}
+COURSE_REQUIRED = ("code", "ltpsc", "semester")
+
+ROOM_HEADER_ALIASES = {
+    "room_no": ("room no", "room", "room number"),
+    "room_type": ("room type", "description", "type"),
+    "capacity": ("room capacity", "seating capacity", "capacity"),
+}
+ROOM_REQUIRED = ("room_no", "capacity")
+
+ENROLLMENT_HEADER_ALIASES = {
+    "student": ("student", "student id", "roll no", "roll no.", "roll number"),
+    "courses": ("course code", "courses", "course", "code"),
+}
+ENROLLMENT_REQUIRED = ("student", "courses")
+
+# capacities given as text for rooms that can't be used
+_NO_CAPACITY = {"", "nil", "na", "n/a", "-"}
 
-def load_courses(csv_path):
-    """Reads course CSV and returns a list of dicts."""
-    courses = []
+
+def _report(on_error, message):
+    """Hand an import error to the caller's callback, or raise it when there is none."""
+    if on_error is None:
+        raise message if isinstance(message, CSVImportError) else CSVImportError(message)
+    on_error(str(message))
+
+
+def _row_error(errors, line, message):
+    """Collect a bad row's error in `errors`, or raise it when no list was given."""
+    error = CSVRowError(line, message)
+    if errors is None:
+        raise error
+    errors.append(error)
+
+
+def _map_headers(fieldnames, aliases, required, kind):
+    """Map each known field to the column it is read from; raises if a required one is missing."""
+    present = {c.strip().lower(): c for c in fieldnames or [] if c}
+    columns = {}
+    for field, names in aliases.items():
+        for name in names:
+            if name in present:
+                columns[field] = present[name]
+                break
+    missing = [f for f in required if f not in columns]
+    if missing:
+        raise CSVImportError(f"Invalid {kind} CSV format! Missing column(s): {', '.join(missing)}")
+    return columns
+
+
+def _parse_ltpsc(value):
+    """
+    "3-1-2-0-4" / "2+1" / "2" -> (lecture, tutorial, lab) hours per week. Short forms
+    list the leading L, T, P values; a bare number such as "2" (what the registrar's
+    "Credits" column holds for theory courses, where C = L) is read as lecture hours.
+    """
+    parts = [p for p in re.split(r"[-+/\s]+", (value or "").strip()) if p]
+    hours = []
+    for p in parts[:3]:
+        if not p.isdigit():
+            raise ValueError(f"bad L-T-P-S-C value '{value}'")
+        hours.append(int(p))
+    return tuple(hours + [0] * (3 - len(hours)))
+
+
+def _parse_count(value, field):
+    value = (value or "").strip()
+    if value.lower() in _NO_CAPACITY:
+        return 0
     try:
-        with open(csv_path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            required_cols = {
-                "course code", "course name", "faculty name",
-                "l-t-p-s-c", "no. of students registered",
-                "semester", "branch"
+        return int(value)
+    except ValueError:
+        raise ValueError(f"bad {field} '{value}'") from None
+
+
+def _iter_rows(csv_path, aliases, required, kind):
+    """
+    Yield (line number, {field: raw value}) for each data row, streaming the file.
+    csv_path may also be an open text file (e.g. io.StringIO of uploaded CSV text).
+    """
+    if hasattr(csv_path, "read"):
+        yield from _iter_reader(csv_path, aliases, required, kind)
+        return
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        yield from _iter_reader(f, aliases, required, kind)
+
+
+def _iter_reader(f, aliases, required, kind):
+    reader = csv.DictReader(f)
+    columns = _map_headers(reader.fieldnames, aliases, required, kind)
+    for row in reader:
+        if not any((v or "").strip() for v in row.values() if isinstance(v, str)):
+            continue
+        yield reader.line_num, {field: row.get(col) or "" for field, col in columns.items()}
+
+
+def iter_classrooms(csv_path, errors=None):
+    """
+    Stream classrooms as dicts {"room_no", "room_type", "capacity"}.
+    Header aliases from ROOM_HEADER_ALIASES are accepted (e.g. room.csv's
+    "Room, Description, Seating capacity"); capacities like "nil" read as 0.
+    Bad rows are skipped and appended to `errors` as CSVRowError when a list is given,
+    else the first one is raised.
+    """
+    for line, row in _iter_rows(csv_path, ROOM_HEADER_ALIASES, ROOM_REQUIRED, "Classroom"):
+        try:
+            yield {
+                "room_no": row["room_no"].strip(),
+                "room_type": row.get("room_type", "").strip().lower(),
+                "capacity": _parse_count(row["capacity"], "capacity"),
             }
-            if not required_cols.issubset({c.strip().lower() for c in reader.fieldnames}):
-                messagebox.showerror("Error", "Invalid Course CSV format!")
-                return []
-            for row in reader:
-                ltp = row.get("l-t-p-s-c", "0-0-0-0-0").split("-")
-                ltp = [int(x) if x.isdigit() else 0 for x in ltp]
-                faculty = [f.strip() for f in row.get("faculty name", "").split(",")]
-                courses.append({
-                    "code": row.get("course code", "").strip(),
-                    "name": row.get("course name", "").strip(),
-                    "faculty": faculty,
-                    "lecture_hours": ltp[0],
-                    "tutorial_hours": ltp[1],
-                    "lab_hours": ltp[2],
-                    "students": int(row.get("no. of students registered", 0)),
-                    "semester": row.get("semester", "").strip(),
-                    "branch": row.get("branch", "").strip().upper()
-                })
+        except ValueError as e:
+            _row_error(errors, line, str(e))
+
+
+def iter_courses(csv_path, errors=None, default_branch=""):
+    """
+    Stream courses as dicts (code, name, faculty, lecture/tutorial/lab hours, students,
+    semester, branch). Header aliases from COURSE_HEADER_ALIASES are accepted, so the
+    registrar exports in test_cases/ load as-is; files without a branch column use
+    `default_branch`. Bad rows are handled as in iter_classrooms(); a missing
+    required column raises CSVImportError.
+    """
+    for line, row in _iter_rows(csv_path, COURSE_HEADER_ALIASES, COURSE_REQUIRED, "Course"):
+        try:
+            code = row["code"].strip()
+            if not code:
+                raise ValueError("missing course code")
+            lecture, tutorial, lab = _parse_ltpsc(row["ltpsc"])
+            yield {
+                "code": code,
+                "name": row.get("name", "").strip() or code,
+                "faculty": [f.strip() for f in row.get("faculty", "").split(",")],
+                "lecture_hours": lecture,
+                "tutorial_hours": tutorial,
+                "lab_hours": lab,
+                "students": _parse_count(row.get("students"), "student count"),
+                "semester": row["semester"].strip(),
+                "branch": (row.get("branch", "").strip() or default_branch).upper()
+            }
+        except ValueError as e:
+            _row_error(errors, line, str(e))
+
+
+def iter_enrollments(csv_path, errors=None):
+    """
+    Stream (student, [course codes]) pairs for enrollment.ConflictGraph. A row holds one
+    course code or several separated by ";" / ","; a student may span several rows.
+    Bad rows are handled as in iter_courses().
+    """
+    for line, row in _iter_rows(csv_path, ENROLLMENT_HEADER_ALIASES, ENROLLMENT_REQUIRED, "Enrollment"):
+        student = row["student"].strip()
+        codes = [c.strip() for c in re.split(r"[;,]", row["courses"]) if c.strip()]
+        if not student or not codes:
+            _row_error(errors, line, "missing student or course code")
+            continue
+        yield student, codes
+
+
+def _load(rows_iter, on_error):
+    errors = []
+    rows = []
+    try:
+        for row in rows_iter(errors):
+            rows.append(row)
+            while errors:
+                _report(on_error, errors.pop(0))
+        for error in errors:
+            _report(on_error, error)
+    except CSVImportError as e:
+        _report(on_error, e)
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to read courses CSV: {e}")
-    return courses
+        _report(on_error, f"Failed to read CSV: {e}")
+    return rows
+
+
+def load_classrooms(csv_path, on_error=None):
+    """
+    Reads classroom CSV and returns a list of dicts.
+    Errors raise CSVImportError unless an on_error(message) callback is given,
+    in which case it is called for each problem and the readable rows are returned.
+    """
+    return _load(lambda errors: iter_classrooms(csv_path, errors), on_error)
+
+
+def load_courses(csv_path, on_error=None, default_branch=""):
+    """
+    Reads course CSV and returns a list of dicts.
+    Errors are handled as in load_classrooms().
+    """
+    return _load(lambda errors: iter_courses(csv_path, errors, default_branch), on_error)
+
+
+def feed_courses(scheduler, rows, chunk_size=1000, on_chunk=None):
+    """
+    Add course rows (e.g. from iter_courses) to a TimetableScheduler chunk by chunk, so
+    large files are never held in memory. on_chunk(total_so_far) is called after each
+    chunk. Returns the number of courses added.
+    """
+    rows = iter(rows)
+    total = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return total
+        for row in chunk:
+            faculty = row.get("faculty") or ""
+            if isinstance(faculty, (list, tuple)):
+                faculty = ", ".join(f for f in faculty if f)
+            scheduler.add_course(
+                row.get("branch") or "", row.get("semester") or "", row["code"], row.get("name") or row["code"],
+                faculty, row.get("class_room") or "",
+                lecture_hours=row.get("lecture_hours", 0), tutorial_hours=row.get("tutorial_hours", 0),
+                lab_hours=row.get("lab_hours", 0), lab_room=row.get("lab_room"), students=row.get("students", 0))
+        total += len(chunk)
+        if on_chunk is not None:
+            on_chunk(total)
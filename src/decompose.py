@@ -0,0 +1,124 @@
+# src/decompose.py
+"""
+Split a scheduling problem into independent parts. Two branch+sem cohorts depend on
+each other only through a resource they might both use: a room (fixed or from the
+room pool), a faculty member, or - with enrollments - courses sharing students.
+Cohorts linked by nothing can be solved separately and the timetables merged.
+"""
+from .slots import DEFAULT_CATALOGUE
+from .utils import split_faculty
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        parent = self.parent
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+
+def components(scheduler):
+    """
+    Groups of (branch, sem) cohorts that share no room, faculty member or enrolled
+    student with any other group, largest group first (ties in course order).
+    Each course links its cohort to every room it could be given and to its faculty.
+    Cohorts are given as the keys used in scheduler.courses (not necessarily strings).
+    """
+    uf = _UnionFind()
+    enrollment = scheduler.enrollment
+    cohorts = []
+    for branch, sems in scheduler.courses.items():
+        for sem, by_code in sems.items():
+            # union-find works on the string form the timetable uses
+            cohort = (str(branch), str(sem))
+            cohorts.append(((branch, sem), cohort))
+            uf.find(cohort)
+            for code, info in by_code.items():
+                for ctype, need in scheduler._type_needs(info).items():
+                    if need > 0:
+                        for room in scheduler._session_rooms(info, ctype):
+                            uf.union(cohort, ("room", room))
+                for name in split_faculty(info.get("faculty")):
+                    uf.union(cohort, ("faculty", name))
+                if enrollment is not None and code in enrollment:
+                    uf.union(cohort, ("course", code))
+    if enrollment is not None:
+        for code in enrollment.courses.values:
+            for other in enrollment.neighbours(code):
+                uf.union(("course", code), ("course", other))
+
+    groups = {}
+    for keys, cohort in cohorts:
+        groups.setdefault(uf.find(cohort), []).append(keys)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def _sub_scheduler(scheduler, cohorts):
+    """A scheduler with only `cohorts`' courses and the parent's rooms, grid and constraints."""
+    courses = {}
+    for branch, sem in cohorts:
+        courses.setdefault(branch, {})[sem] = scheduler.courses[branch][sem]
+    custom = scheduler.catalogue is not DEFAULT_CATALOGUE
+    sub = type(scheduler)(courses, slots=scheduler.catalogue if custom else None)
+    sub.room_pool = scheduler.room_pool
+    sub.faculty_unavailable = dict(scheduler.faculty_unavailable)
+    if scheduler.enrollment is not None:
+        sub.set_enrollment(scheduler.enrollment)
+    return sub
+
+
+def _solve(sub, solver, seed, time_budget, cancel=None):
+    """Solve one component; module-level so it can run in a worker process."""
+    return sub.generate_timetable(notify=False, solver=solver, seed=seed, time_budget=time_budget, cancel=cancel)
+
+
+def solve_decomposed(scheduler, solver, seed, time_budget, workers=None):
+    """
+    Solve each component of `scheduler` on its own sub-scheduler (same solver and seed)
+    and install the merged result with scheduler._adopt(). Components run on a process
+    pool of `workers` processes (None = all cores); with workers=1, or a single
+    component, they run in-process. The scheduler's progress callback hears about each
+    cohort as its component finishes; its cancel event is checked between components
+    (and inside them when run in-process).
+    """
+    groups = components(scheduler)
+    subs = [_sub_scheduler(scheduler, cohorts) for cohorts in groups]
+    results = [None] * len(subs)
+
+    def finished(i, result):
+        results[i] = result
+        for branch, sem in groups[i]:
+            scheduler._cohort_done(str(branch), str(sem))
+
+    if workers == 1 or len(subs) <= 1:
+        for i, sub in enumerate(subs):
+            scheduler._check_cancel()
+            finished(i, _solve(sub, solver, seed, time_budget, scheduler._cancel))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(_solve, sub, solver, seed, time_budget): i for i, sub in enumerate(subs)}
+            for future in as_completed(futures):
+                scheduler._check_cancel()
+                finished(futures[future], future.result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    # merged in component order, so the result doesn't depend on which worker finished first
+    timetable, unscheduled = {}, []
+    for table, missing in results:
+        for branch, sems in table.items():
+            timetable.setdefault(branch, {}).update(sems)
+        unscheduled.extend(missing)
+    scheduler._adopt(timetable, unscheduled)
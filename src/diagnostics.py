@@ -0,0 +1,158 @@
+# src/diagnostics.py
+from .occupancy import slot_mask
+from .utils import DAYS, split_faculty
+
+
+class Explanation:
+    """
+    Why one unscheduled (course, type) could not be placed.
+      - candidates: (day, slot) pairs the type may use
+      - reasons:    reason -> number of candidates it blocks ("same_day", "cohort",
+                    "students", "faculty", "room"; one candidate can have several)
+      - blocking:   small set of blockers that together account for every candidate,
+                    as (label, candidates blocked) pairs, biggest first
+      - summary:    one line for messages and logs
+    """
+
+    def __init__(self, branch, sem, name, ctype, code=None):
+        self.branch = branch
+        self.sem = sem
+        self.name = name
+        self.ctype = ctype
+        self.code = code
+        self.candidates = 0
+        self.reasons = {}
+        self.blocking = []
+        self.summary = ""
+
+    def as_dict(self):
+        return {"branch": self.branch, "sem": self.sem, "name": self.name, "code": self.code,
+                "type": self.ctype, "candidates": self.candidates, "reasons": dict(self.reasons),
+                "blocking": list(self.blocking), "summary": self.summary}
+
+    def __repr__(self):
+        return f"Explanation({self.branch} Sem-{self.sem}: {self.name} ({self.ctype}): {self.summary})"
+
+
+def _owner_index(scheduler):
+    """(kind, key, day) -> [(mask, blocker label)] for every placed session and unavailability."""
+    enrollment = scheduler.enrollment
+    index = {}
+    for branch, sems in scheduler.timetable.items():
+        for sem, table in sems.items():
+            for (day, slot, *_), (code, _, faculty, ctype, room) in table.items():
+                mask = slot_mask(slot)
+                # a shared elective's session is one blocker, named after its lead cohort
+                lead = scheduler._cohorts(branch, sem, code)[0]
+                label = f"{code} ({lead[0]} Sem-{lead[1]} {ctype}, {room})"
+                index.setdefault(("cohort", (branch, sem), day), []).append((mask, label))
+                index.setdefault(("room", room, day), []).append((mask, label))
+                index.setdefault(("course", (branch, sem, code), day), []).append((mask, label))
+                # with enrollments: courses without enrollment data bind the whole branch+sem,
+                # enrolled ones only the courses sharing their students
+                if enrollment is not None and code in enrollment:
+                    index.setdefault(("enrolled", code, day), []).append((mask, label))
+                else:
+                    index.setdefault(("core", (branch, sem), day), []).append((mask, label))
+                for name in split_faculty(faculty):
+                    index.setdefault(("faculty", name, day), []).append((mask, label))
+    for (name, day), mask in scheduler.faculty_unavailable.items():
+        index.setdefault(("faculty", name, day), []).append((mask, f"{name} unavailable"))
+    return index
+
+
+def _blockers(index, kind, key, day, mask):
+    return {label for m, label in index.get((kind, key, day), ()) if m & mask}
+
+
+def _find_course(scheduler, branch, sem, name):
+    for code, info in scheduler.courses.get(branch, {}).get(sem, {}).items():
+        if info.get("name", code) == name:
+            return code, info
+    return None, None
+
+
+def explain_unscheduled(scheduler):
+    """
+    For each entry of scheduler.unscheduled, work out from the current occupancy which
+    constraints block every candidate (day, slot, room) of its type, and pick a small
+    set of blockers (greedy set cover) that explains all of them. Nothing is re-run.
+    Returns a list of Explanation.
+    """
+    index = None
+    explanations = []
+    for branch, sem, name, ctype in scheduler.unscheduled:
+        code, info = _find_course(scheduler, branch, sem, name)
+        exp = Explanation(branch, sem, name, ctype, code)
+        explanations.append(exp)
+        if info is None:
+            exp.summary = "course no longer exists"
+            continue
+        rooms = scheduler._session_rooms(info, ctype)
+        if not rooms:
+            kind = "lab room" if ctype == "Lab" else "class room"
+            exp.summary = f"no {kind} given and no suitable room in the room pool"
+            continue
+        if index is None:
+            index = _owner_index(scheduler)
+
+        faculty = split_faculty(info.get("faculty"))
+        enrolled = scheduler.enrollment is not None and code in scheduler.enrollment
+        peers = scheduler.enrollment.neighbours(code) if enrolled else ()
+        cohorts = scheduler._cohorts(branch, sem, code)
+        own_prefix = f"{code} ({cohorts[0][0]} Sem-{cohorts[0][1]} "
+        own_label = f"{code}'s own sessions (one per day)"
+        covers = {}
+        uncovered = []
+        pool = scheduler.TYPE_POOLS[ctype]
+        for day in DAYS:
+            for slot in pool:
+                exp.candidates += 1
+                mask = slot_mask(slot)
+                blockers = set()
+                found = {
+                    "same_day": {lbl for _, lbl in index.get(("course", (branch, sem, code), day), ())},
+                    "cohort": set().union(*(_blockers(index, "core" if enrolled else "cohort", c, day, mask)
+                                            for c in cohorts)),
+                    "students": set().union(*(_blockers(index, "enrolled", c, day, mask) for c in peers)),
+                    "faculty": set().union(*(_blockers(index, "faculty", f, day, mask) for f in faculty)),
+                }
+                # a candidate is blocked by rooms only when every candidate room is taken;
+                # blame the occupants of the least busy one
+                busy = [_blockers(index, "room", r, day, mask) for r in rooms]
+                found["room"] = min(busy, key=len) if all(busy) else set()
+                for reason, labels in found.items():
+                    if labels:
+                        exp.reasons[reason] = exp.reasons.get(reason, 0) + 1
+                        blockers |= labels
+                if not blockers:
+                    # free now (e.g. freed after generation); nothing to explain
+                    continue
+                candidate = len(uncovered)
+                uncovered.append(candidate)
+                for label in blockers:
+                    if label.startswith(own_prefix):
+                        label = own_label
+                    covers.setdefault(label, set()).add(candidate)
+
+        # greedy set cover: the blocker involved in most still-unexplained candidates first
+        left = set(uncovered)
+        while left and covers:
+            label, hit = max(covers.items(), key=lambda kv: (len(kv[1] & left), kv[0]))
+            gained = hit & left
+            if not gained:
+                break
+            exp.blocking.append((label, len(gained)))
+            left -= gained
+            del covers[label]
+
+        blocked = len(uncovered)
+        if not blocked:
+            exp.summary = "a slot is free now; regenerate or re-add the course to place it"
+        else:
+            reasons = ", ".join(f"{r} {n}" for r, n in sorted(exp.reasons.items(), key=lambda kv: -kv[1]))
+            who = "; ".join(f"{label} x{n}" for label, n in exp.blocking[:3])
+            more = f" and {len(exp.blocking) - 3} more" if len(exp.blocking) > 3 else ""
+            scope = f"all {blocked}" if blocked == exp.candidates else f"{blocked} of {exp.candidates}"
+            exp.summary = f"{scope} {ctype} slots blocked ({reasons}) mainly by {who}{more}"
+    return explanations
@@ -0,0 +1,133 @@
+# src/enrollment.py
+from .models import Interner
+from .utils import DAYS
+
+
+class ConflictGraph:
+    """
+    Which courses share at least one student, compiled from student -> courses
+    enrollments. Courses get small int ids and each course's neighbours are one int
+    bitset, so "do courses a and b clash?" is a single AND.
+
+    Students are grouped by their exact course set first; each distinct set costs one
+    OR over its courses, so building is linear in the number of enrollments.
+    """
+
+    def __init__(self):
+        self.courses = Interner()
+        # adjacency[id]: bitset of the ids of courses sharing a student with it
+        self.adjacency = []
+        self.students = 0
+
+    @classmethod
+    def from_enrollments(cls, enrollments):
+        """
+        enrollments: {student: [course codes]} or an iterable of (student, course code
+        or list of codes) pairs, e.g. csv_import.iter_enrollments(); a student may
+        appear on several rows.
+        """
+        items = enrollments.items() if isinstance(enrollments, dict) else enrollments
+        by_student = {}
+        for student, codes in items:
+            if isinstance(codes, str):
+                codes = (codes,)
+            by_student.setdefault(student, set()).update(c for c in codes if c)
+
+        graph = cls()
+        graph.students = len(by_student)
+        course_sets = {frozenset(codes) for codes in by_student.values()}
+        for codes in course_sets:
+            ids = [graph._add(code) for code in sorted(codes)]
+            mask = 0
+            for i in ids:
+                mask |= 1 << i
+            for i in ids:
+                graph.adjacency[i] |= mask
+        for i in range(len(graph.adjacency)):
+            graph.adjacency[i] &= ~(1 << i)
+        return graph
+
+    def _add(self, code):
+        i = self.courses.id(code)
+        if i == len(self.adjacency):
+            self.adjacency.append(0)
+        return i
+
+    def course_id(self, code):
+        """Id of an enrolled course, or None for courses without enrollment data."""
+        return self.courses.get(code)
+
+    def conflicts(self, a, b):
+        """Whether courses a and b (codes) share a student."""
+        i, j = self.courses.get(a), self.courses.get(b)
+        return i is not None and j is not None and bool(self.adjacency[i] >> j & 1)
+
+    def neighbours(self, code):
+        """Codes of the courses sharing a student with `code`."""
+        i = self.courses.get(code)
+        if i is None:
+            return []
+        adj = self.adjacency[i]
+        return [self.courses[j] for j in range(adj.bit_length()) if adj >> j & 1]
+
+    def edges(self):
+        return sum(bin(adj).count("1") for adj in self.adjacency) // 2
+
+    def __contains__(self, code):
+        return code in self.courses
+
+    def __len__(self):
+        return len(self.courses)
+
+
+class StudentOccupancy:
+    """
+    Which enrolled courses hold a session at each (day, grid slot): busy[day_id *
+    len(catalogue) + slot_id] is a bitset of ConflictGraph course ids whose sessions
+    overlap that slot. A probe for course g is then busy[...] & adjacency[g] - one
+    AND however many students or courses there are. Placing or removing a session
+    touches only the grid slots it overlaps; counts let one course hold several
+    overlapping sessions (e.g. once per branch).
+
+    Probes for slots outside the grid are answered from the grid slots they overlap,
+    which can only err towards reporting a conflict.
+    """
+
+    def __init__(self, graph, catalogue, n_days=len(DAYS)):
+        self.graph = graph
+        self.catalogue = catalogue
+        self.n_slots = len(catalogue)
+        self.busy = [0] * (n_days * self.n_slots)
+        self._counts = {}
+
+    def conflicts(self, gid, day_id, slot):
+        adj = self.graph.adjacency[gid]
+        base = day_id * self.n_slots
+        i = self.catalogue.ids.get(slot)
+        if i is not None:
+            return bool(self.busy[base + i] & adj)
+        return any(self.busy[base + j] & adj for j in self.catalogue.overlapping_ids(slot))
+
+    def mark(self, gid, day_id, slot):
+        base = day_id * self.n_slots
+        for j in self.catalogue.overlapping_ids(slot):
+            cell = (base + j, gid)
+            n = self._counts.get(cell, 0)
+            self._counts[cell] = n + 1
+            if not n:
+                self.busy[base + j] |= 1 << gid
+
+    def unmark(self, gid, day_id, slot):
+        base = day_id * self.n_slots
+        for j in self.catalogue.overlapping_ids(slot):
+            cell = (base + j, gid)
+            n = self._counts.get(cell, 0) - 1
+            if n > 0:
+                self._counts[cell] = n
+            else:
+                self._counts.pop(cell, None)
+                self.busy[base + j] &= ~(1 << gid)
+
+    def clear(self):
+        self.busy[:] = [0] * len(self.busy)
+        self._counts.clear()
@@ -0,0 +1,166 @@
+# src/export.py
+import csv
+import datetime
+import hashlib
+import io
+import json
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from .slots import DEFAULT_CATALOGUE
+from .utils import DAYS
+from .views import ROW_FIELDS, TimetableViews
+
+FORMATS = ("csv", "json", "ics")
+VIEWS = ("cohort", "faculty", "room", "master")
+
+CSV_HEADER = ["Day", "Slot", "Course Code", "Course Name", "Faculty", "Type", "Room"]
+MASTER_HEADER = ["Branch", "Semester"] + CSV_HEADER
+
+
+def _safe(name):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(name)).strip("_") or "unnamed"
+
+
+def _unique(base, key, taken):
+    """
+    base, or base plus a short hash of key when a file of the same directory already
+    has that name (ignoring case), e.g. "Dr. A/B" and "Dr. A B" both sanitized to Dr._A_B.
+    """
+    if base.lower() in taken:
+        base = f"{base}_{hashlib.sha1(str(key).encode('utf-8')).hexdigest()[:8]}"
+    taken.add(base.lower())
+    return base
+
+
+def _render_csv(rows, master=False):
+    out = io.StringIO(newline="")
+    writer = csv.writer(out)
+    writer.writerow(MASTER_HEADER if master else CSV_HEADER)
+    for branch, sem, *rest in rows:
+        writer.writerow([branch, sem, *rest] if master else rest)
+    return out.getvalue()
+
+
+def _render_json(rows, master=False):
+    return json.dumps([dict(zip(ROW_FIELDS, row)) for row in rows], indent=1, ensure_ascii=False)
+
+
+def _ics_text(value):
+    return str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _render_ics(rows, term_start, catalogue, name):
+    """Weekly recurring VEVENTs (floating local time) starting in the week of term_start."""
+    monday = term_start - datetime.timedelta(days=term_start.weekday())
+    day_offset = {d: i for i, d in enumerate(DAYS)}
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//AutomatedTimeTable//EN",
+             f"X-WR-CALNAME:{_ics_text(name)}"]
+    for branch, sem, day, slot, code, cname, faculty, ctype, room in rows:
+        date = monday + datetime.timedelta(days=day_offset.get(day, 0))
+        start, end = catalogue.interval(slot)
+        uid = hashlib.sha1(f"{branch}|{sem}|{day}|{slot}|{code}|{ctype}".encode("utf-8")).hexdigest()
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}@automatedtimetable",
+            f"DTSTAMP:{term_start:%Y%m%d}T000000Z",
+            f"DTSTART:{date:%Y%m%d}T{start // 60:02d}{start % 60:02d}00",
+            f"DTEND:{date:%Y%m%d}T{end // 60:02d}{end % 60:02d}00",
+            "RRULE:FREQ=WEEKLY",
+            f"SUMMARY:{_ics_text(f'{code} {ctype} ({branch} Sem-{sem})')}",
+            f"LOCATION:{_ics_text(room)}",
+            f"DESCRIPTION:{_ics_text(f'{cname} - {faculty}')}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _jobs(views, which):
+    """(relative path without extension, rows, title, is master) for each file to write."""
+    if "cohort" in which:
+        taken = {"timetable_master"}
+        for (branch, sem), rows in views.by_cohort.items():
+            base = _unique(f"timetable_{_safe(branch)}_Sem{_safe(sem)}", (branch, sem), taken)
+            yield base, rows, f"{branch} Sem-{sem}", False
+    if "faculty" in which:
+        taken = set()
+        for name, rows in views.by_faculty.items():
+            yield os.path.join("faculty", _unique(_safe(name), name, taken)), rows, name, True
+    if "room" in which:
+        taken = set()
+        for room, rows in views.by_room.items():
+            yield os.path.join("rooms", _unique(_safe(room), room, taken)), rows, room, True
+    if "master" in which:
+        yield "timetable_master", views.master, "All timetables", True
+
+
+def _tasks(timetable, formats, views, catalogue):
+    """(file name, rows, title, is master, format) for every file of an export."""
+    unknown = [f for f in formats if f not in FORMATS] + [v for v in views if v not in VIEWS]
+    if unknown:
+        raise ValueError(f"Unknown export format/view: {', '.join(unknown)}")
+    index = TimetableViews(timetable, catalogue)
+    return [(f"{base}.{fmt}", rows, title, master, fmt)
+            for base, rows, title, master in _jobs(index, views) for fmt in formats]
+
+
+def _render(task, term_start, catalogue):
+    name, rows, title, master, fmt = task
+    if fmt == "ics":
+        return name, _render_ics(rows, term_start, catalogue, title)
+    return name, (_render_json if fmt == "json" else _render_csv)(rows, master)
+
+
+def render_timetable(timetable, formats=("csv",), views=("cohort",), term_start=None,
+                     catalogue=DEFAULT_CATALOGUE):
+    """
+    The files export_timetable() would write, rendered in memory: {name: text} with
+    "/"-separated names (e.g. "faculty/Prof_A.csv"), for callers that serve them.
+    """
+    term_start = term_start or datetime.date.today()
+    rendered = (_render(task, term_start, catalogue) for task in _tasks(timetable, formats, views, catalogue))
+    return {name.replace(os.sep, "/"): text for name, text in rendered}
+
+
+def export_timetable(timetable, out_dir=".", formats=("csv",), views=("cohort",), workers=None,
+                     zip_path=None, term_start=None, catalogue=DEFAULT_CATALOGUE):
+    """
+    Write timetable views to out_dir:
+      views:   any of VIEWS - per branch+sem (timetable_<branch>_Sem<sem>), per faculty
+               (faculty/), per room (rooms/) and one master sheet
+      formats: any of FORMATS - csv, json, ics (weekly recurring events from the week
+               of term_start, default: this week)
+    All views come from one TimetableViews pass and rows are sorted by day and time.
+    Files are rendered and written by a pool of `workers` threads. With zip_path, the
+    files go into that single zip archive instead. Returns the paths (or archive
+    member names) written.
+    """
+    tasks = _tasks(timetable, formats, views, catalogue)
+    term_start = term_start or datetime.date.today()
+
+    def render(task):
+        return _render(task, term_start, catalogue)
+
+    def write(task):
+        name, text = render(task)
+        path = os.path.join(out_dir, name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if zip_path is None:
+            return list(pool.map(write, tasks))
+        if os.path.dirname(zip_path):
+            os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+        names = []
+        # zipfile isn't safe for concurrent writes: render in the pool, write here in order
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, text in pool.map(render, tasks):
+                arcname = name.replace(os.sep, "/")
+                archive.writestr(arcname, text)
+                names.append(arcname)
+        return names
@@ -11,6 +11,9 @@ class Course:
       - class_room (preferred for Lecture/Tutorial)
       - lab_room   (preferred for Lab sessions)
     """
+    __slots__ = ("code", "name", "faculty", "room", "lecture_hours", "tutorial_hours", "lab_hours",
+                 "hours_per_week", "branch", "semester", "class_room", "lab_room")
+
     def __init__(self, code, name, faculty, room, *args, **kwargs):
         self.code = code
         self.name = name
@@ -72,3 +75,72 @@ class Course:
 
     def __repr__(self):
         return f"{self.code} - {self.name} ({self.faculty})"
+
+
+class Interner:
+    """
+    Maps hashable values (room names, faculty names, (branch, sem) keys, ...) to small
+    consecutive ints and back, so hot structures can be plain lists indexed by id.
+    """
+    __slots__ = ("_ids", "values")
+
+    def __init__(self, values=()):
+        self._ids = {}
+        self.values = []
+        for value in values:
+            self.id(value)
+
+    def id(self, value):
+        """Id of value, assigning the next free one on first sight."""
+        i = self._ids.get(value)
+        if i is None:
+            i = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+    def get(self, value, default=None):
+        return self._ids.get(value, default)
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def __contains__(self, value):
+        return value in self._ids
+
+    def __len__(self):
+        return len(self.values)
+
+
+class Session:
+    """
+    One session (lecture, tutorial or lab) a course needs placed. Besides the readable
+    fields it carries the interned ids the scheduler's hot checks use:
+    cohort_id (branch+sem), course_id, room_ids (parallel to rooms), faculty_ids and
+    enroll_id (the course's ConflictGraph id, -1 without enrollment data).
+    cohorts are the (branch, sem) timetables the session goes into: several for an
+    elective shared by branches, else just its own.
+    """
+    __slots__ = ("branch", "sem", "code", "info", "ctype", "rooms", "room", "need", "faculty",
+                 "cohort_id", "cohorts", "course_id", "room_ids", "faculty_ids", "enroll_id")
+
+    def __init__(self, branch, sem, code, info, ctype, rooms, room, need, faculty,
+                 cohort_id=-1, cohorts=(), course_id=-1, room_ids=(), faculty_ids=(), enroll_id=-1):
+        self.branch = branch
+        self.sem = sem
+        self.code = code
+        self.info = info
+        self.ctype = ctype
+        # candidate rooms in order of preference; room is the fixed room or None (pool)
+        self.rooms = rooms
+        self.room = room
+        self.need = need
+        self.faculty = faculty
+        self.cohort_id = cohort_id
+        self.cohorts = cohorts or ((branch, sem),)
+        self.course_id = course_id
+        self.room_ids = room_ids
+        self.faculty_ids = faculty_ids
+        self.enroll_id = enroll_id
+
+    def __repr__(self):
+        return f"Session({self.branch} Sem-{self.sem} {self.code} {self.ctype})"
@@ -0,0 +1,80 @@
+# src/occupancy.py
+from functools import lru_cache
+from .models import Interner
+from .utils import DAYS, parse_slot_to_minutes
+
+# each day is discretized into ticks of this many minutes; bit i of a day mask
+# covers minutes [i * TICK_MINUTES, (i + 1) * TICK_MINUTES)
+TICK_MINUTES = 5
+
+
+@lru_cache(maxsize=None)
+def slot_mask(slot):
+    """
+    Compile a "HH:MM-HH:MM" slot string into an integer bitmask of the ticks it covers.
+    Results are cached, so every slot string is parsed only once per process.
+    """
+    start, end = parse_slot_to_minutes(slot)
+    first = start // TICK_MINUTES
+    # a partially covered tick still counts as occupied
+    last = -(-end // TICK_MINUTES)
+    return ((1 << (last - first)) - 1) << first
+
+
+class OccupancyIndex:
+    """
+    Per-day occupancy bitmasks for arbitrary resource keys (a room, a branch+sem, ...).
+    Two sessions on the same day overlap iff their slot masks share a bit, so a conflict
+    check is a single AND and marking a session is a single OR.
+
+    Keys and days are interned to small ints and the masks live in one flat list at
+    key_id * len(days) + day_id. Hot paths resolve ids once (key_id(), day_ids) and
+    index `masks` directly; the (key, day) methods are the convenient form.
+    """
+
+    def __init__(self, days=DAYS):
+        self.keys = Interner()
+        self.day_ids = {d: i for i, d in enumerate(days)}
+        self.n_days = len(days)
+        self.masks = []
+
+    def key_id(self, key):
+        """Intern key, growing the mask array for a new one."""
+        kid = self.keys.id(key)
+        missing = (kid + 1) * self.n_days - len(self.masks)
+        if missing > 0:
+            self.masks.extend([0] * missing)
+        return kid
+
+    def _cell(self, key, day):
+        kid = self.keys.get(key)
+        if kid is None:
+            return None
+        return kid * self.n_days + self.day_ids[day]
+
+    def conflicts(self, key, day, mask):
+        cell = self._cell(key, day)
+        return cell is not None and bool(self.masks[cell] & mask)
+
+    def mark(self, key, day, mask):
+        self.masks[self.key_id(key) * self.n_days + self.day_ids[day]] |= mask
+
+    def unmark(self, key, day, mask):
+        cell = self._cell(key, day)
+        if cell is not None:
+            self.masks[cell] &= ~mask
+
+    def mask(self, key, day):
+        cell = self._cell(key, day)
+        return 0 if cell is None else self.masks[cell]
+
+    def clear(self):
+        """Free every cell; interned ids stay valid."""
+        self.masks[:] = [0] * len(self.masks)
+
+    def __contains__(self, key_day):
+        return bool(self.mask(*key_day))
+
+    def __len__(self):
+        """Number of occupied (key, day) cells."""
+        return sum(1 for m in self.masks if m)
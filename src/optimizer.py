@@ -0,0 +1,207 @@
+# src/optimizer.py
+import math
+import random
+import time
+from .utils import DAYS, split_faculty
+
+
+class LocalSearchOptimizer:
+    """
+    Post-pass that improves a generated timetable on soft constraints:
+      - "gap":          idle hours between sessions of a branch+sem on a day,
+      - "back_to_back": pairs of a faculty member's sessions with less than
+                        BREAK_MINUTES between them on a day,
+      - "spread":       sessions of a course on adjacent days.
+    The objective is the weighted sum. Moves relocate one session to another (day, slot)
+    of its type or swap two same-type sessions of a branch+sem; every move is checked
+    against the scheduler's occupancy structures first, so hard constraints (room,
+    branch+sem, faculty, one session of a course per day) are never broken.
+
+    Each group (branch+sem/day, faculty/day, course) keeps its own interval list, so a
+    move is scored by recomputing only the handful of groups it touches. Acceptance is
+    simulated annealing with a short tabu list of (session, position it just left), so a
+    session is not moved straight back; other sessions may still take that position.
+    """
+
+    DEFAULT_WEIGHTS = {"gap": 1.0, "back_to_back": 2.0, "spread": 1.0}
+    BREAK_MINUTES = 10
+
+    def __init__(self, scheduler, weights=None, time_budget=2.0, seed=None,
+                 initial_temperature=2.0, cooling=0.9995, tabu_tenure=20):
+        self.scheduler = scheduler
+        self.weights = dict(self.DEFAULT_WEIGHTS, **(weights or {}))
+        self.time_budget = time_budget
+        self.rng = random.Random(seed)
+        self.initial_temperature = initial_temperature
+        self.cooling = cooling
+        self.tabu_tenure = tabu_tenure
+
+    # --- group costs ---
+    def _group_cost(self, group):
+        kind = group[0]
+        if kind == "cohort":
+            intervals = sorted(self._lists.get(group, ()))
+            idle = sum(max(0, s - e) for (_, e), (s, _) in zip(intervals, intervals[1:]))
+            return self.weights["gap"] * idle / 60.0
+        if kind == "faculty":
+            intervals = sorted(self._lists.get(group, ()))
+            tight = sum(1 for (_, e), (s, _) in zip(intervals, intervals[1:]) if s - e < self.BREAK_MINUTES)
+            return self.weights["back_to_back"] * tight
+        days = sorted(self._lists.get(group, ()))
+        adjacent = sum(1 for a, b in zip(days, days[1:]) if b - a <= 1)
+        return self.weights["spread"] * adjacent
+
+    def _groups(self, branch, sem, code, faculty, day):
+        groups = [("cohort", branch, sem, day), ("course", branch, sem, code)]
+        groups.extend(("faculty", f, day) for f in split_faculty(faculty))
+        return groups
+
+    def _members(self, branch, sem, code, faculty, day, slot):
+        """(group, item) pairs a session contributes to the per-group lists."""
+        interval = self.scheduler.catalogue.interval(slot)
+        items = []
+        for group in self._groups(branch, sem, code, faculty, day):
+            items.append((group, DAYS.index(day) if group[0] == "course" else interval))
+        return items
+
+    def _add(self, members):
+        for group, item in members:
+            self._lists.setdefault(group, []).append(item)
+
+    def _remove(self, members):
+        for group, item in members:
+            self._lists[group].remove(item)
+
+    def objective(self):
+        return sum(self._group_cost(g) for g in self._lists)
+
+    # --- moves ---
+    def _info(self, branch, sem, code, entry):
+        return self.scheduler.courses.get(branch, {}).get(sem, {}).get(code) or {"name": entry[1], "faculty": entry[2]}
+
+    def _try_move(self, moves, temperature):
+        """
+        moves: list of (branch, sem, code, (day, slot) now, (day, slot) target). Applies
+        all of them if the result is feasible and accepted; returns the delta or None.
+        """
+        sched = self.scheduler
+        entries = [sched._unplace(b, s, day, slot, code) for b, s, code, (day, slot), _ in moves]
+
+        def restore(placed):
+            for (b, s, code, _, (day, slot)), entry in zip(moves[:placed], entries):
+                sched._unplace(b, s, day, slot, code)
+            for (b, s, code, (day, slot), _), entry in zip(moves, entries):
+                _, _, _, ctype, room = entry
+                sched._place(b, s, code, self._info(b, s, code, entry), ctype, room, day, slot)
+
+        placed = 0
+        for (b, s, _, _, (day, slot)), entry in zip(moves, entries):
+            code, _, faculty, ctype, room = entry
+            if not sched._can_place(b, s, code, room, day, slot, split_faculty(faculty)):
+                restore(placed)
+                return None
+            sched._place(b, s, code, self._info(b, s, code, entry), ctype, room, day, slot)
+            placed += 1
+
+        old_members, new_members, groups = [], [], set()
+        for (b, s, _, (d0, s0), (d1, s1)), entry in zip(moves, entries):
+            code, faculty = entry[0], entry[2]
+            old_members += self._members(b, s, code, faculty, d0, s0)
+            new_members += self._members(b, s, code, faculty, d1, s1)
+        groups.update(g for g, _ in old_members + new_members)
+        before = sum(self._group_cost(g) for g in groups)
+        self._remove(old_members)
+        self._add(new_members)
+        delta = sum(self._group_cost(g) for g in groups) - before
+
+        if delta <= 0 or (temperature > 0 and self.rng.random() < math.exp(-delta / temperature)):
+            return delta
+        self._remove(new_members)
+        self._add(old_members)
+        restore(placed)
+        return None
+
+    def run(self):
+        """Optimize scheduler.timetable in place; returns a report with the objective before/after."""
+        sched = self.scheduler
+        self._lists = {}
+        positions = []
+        # per position: the session's identity (branch, sem, code, type, index), which moves don't change
+        keys, seen = [], {}
+        for branch, sems in sched.timetable.items():
+            for sem, table in sems.items():
+                for (day, slot, code), (_, _, faculty, ctype, _) in table.items():
+                    self._add(self._members(branch, sem, code, faculty, day, slot))
+                    if len(sched._cohorts(branch, sem, code)) > 1:
+                        continue  # a shared elective stays put: moving it shifts several cohorts
+                    positions.append([branch, sem, day, slot])
+                    course = (branch, sem, code, ctype)
+                    seen[course] = seen.get(course, -1) + 1
+                    keys.append((*course, seen[course]))
+
+        before = current = best = self.objective()
+        best_state = None
+        tabu = []
+        temperature = self.initial_temperature
+        iterations = accepted = 0
+        deadline = time.monotonic() + self.time_budget
+
+        while positions and time.monotonic() < deadline:
+            iterations += 1
+            temperature *= self.cooling
+            i = self.rng.randrange(len(positions))
+            branch, sem, day, slot = positions[i]
+            code, ctype = keys[i][2], keys[i][3]
+
+            if self.rng.random() < 0.5:
+                # swap with another same-type session of this branch+sem
+                j = self.rng.randrange(len(positions))
+                b2, s2, day2, slot2 = positions[j]
+                if j == i or (b2, s2) != (branch, sem) or keys[j][3] != ctype:
+                    continue
+                moves = [(branch, sem, code, (day, slot), (day2, slot2)),
+                         (b2, s2, keys[j][2], (day2, slot2), (day, slot))]
+                targets = {i: (day2, slot2), j: (day, slot)}
+            else:
+                target = (self.rng.choice(DAYS), self.rng.choice(sched.TYPE_POOLS[ctype]))
+                if target == (day, slot) or (keys[i], target) in tabu:
+                    continue
+                moves = [(branch, sem, code, (day, slot), target)]
+                targets = {i: target}
+
+            delta = self._try_move(moves, temperature)
+            if delta is None:
+                continue
+            accepted += 1
+            current += delta
+            for k, (d, s) in targets.items():
+                tabu.append((keys[k], (positions[k][2], positions[k][3])))
+                positions[k][2], positions[k][3] = d, s
+            del tabu[:-self.tabu_tenure]
+            if current < best - 1e-9:
+                best = current
+                best_state = [list(p) for p in positions]
+
+        if best_state is not None and current > best + 1e-9:
+            self._restore(positions, keys, best_state)
+            current = best
+
+        return {"before": before, "after": self.objective(), "iterations": iterations,
+                "accepted": accepted}
+
+    def _restore(self, positions, keys, state):
+        """Move every movable session back to the best positions seen (all unplaced first, then re-placed)."""
+        sched = self.scheduler
+        entries = []
+        for (branch, sem, day, slot), key in zip(positions, keys):
+            entries.append(sched._unplace(branch, sem, day, slot, key[2]))
+        for (branch, sem, day, slot), entry in zip(state, entries):
+            code = entry[0]
+            sched._place(branch, sem, code, self._info(branch, sem, code, entry), entry[3], entry[4], day, slot)
+        # the group lists also hold the sessions that never move: rebuild them from the timetable
+        self._lists = {}
+        for branch, sems in sched.timetable.items():
+            for sem, table in sems.items():
+                for (day, slot, code), entry in table.items():
+                    self._add(self._members(branch, sem, code, entry[2], day, slot))
+        positions[:] = state
@@ -0,0 +1,41 @@
+# src/quality.py
+from .slots import DEFAULT_CATALOGUE
+
+
+def cohort_gaps(timetable, catalogue=DEFAULT_CATALOGUE):
+    """Total idle minutes between consecutive sessions of each branch+sem on each day."""
+    interval = catalogue.interval
+    total = 0
+    for sems in timetable.values():
+        for table in sems.values():
+            by_day = {}
+            for day, slot, *_ in table:
+                by_day.setdefault(day, []).append(interval(slot))
+            for intervals in by_day.values():
+                intervals.sort()
+                for (_, prev_end), (start, _) in zip(intervals, intervals[1:]):
+                    if start > prev_end:
+                        total += start - prev_end
+    return total
+
+
+def room_spread(timetable):
+    """How scattered courses are: sum over courses of (distinct rooms used - 1)."""
+    rooms = {}
+    for branch, sems in timetable.items():
+        for sem, table in sems.items():
+            for (code, _, _, _, room) in table.values():
+                rooms.setdefault((branch, sem, code), set()).add(room)
+    return sum(len(r) - 1 for r in rooms.values())
+
+
+def score_timetable(timetable, unscheduled, catalogue=DEFAULT_CATALOGUE, missing=None):
+    """
+    Lexicographic score, lower is better: (unscheduled sessions, idle gaps, room spread).
+    missing: number of required sessions left unplaced when the caller knows it
+    (an unscheduled entry stands for a course's whole type); otherwise each
+    unscheduled entry counts as one. Gaps are measured on `catalogue`'s slots.
+    """
+    if missing is None:
+        missing = len(unscheduled)
+    return (missing, cohort_gaps(timetable, catalogue), room_spread(timetable))
@@ -0,0 +1,69 @@
+# src/rooms.py
+from bisect import bisect_left
+
+# room types from the classroom CSV that can't host scheduled sessions
+UNUSABLE_ROOM_TYPES = {"recreation", "library", "empty", "examination hall"}
+
+
+def room_kind(room_type):
+    """Map a classroom-CSV room type to the pool it serves: "lab", "class" or None."""
+    room_type = (room_type or "").strip().lower()
+    if not room_type or room_type in UNUSABLE_ROOM_TYPES:
+        return None
+    return "lab" if "lab" in room_type else "class"
+
+
+class RoomPool:
+    """
+    Rooms bucketed by kind ("class" for lectures/tutorials, "lab" for labs), each bucket
+    sorted by capacity, so the rooms that fit a cohort are found with one bisect.
+
+    rooms: dicts as returned by csv_import.load_classrooms()
+           ({"room_no", "room_type", "capacity"}); rooms without a usable type or a
+           positive capacity are ignored.
+    """
+
+    def __init__(self, rooms=()):
+        buckets = {}
+        for room in rooms:
+            kind = room_kind(room.get("room_type"))
+            try:
+                capacity = int(room.get("capacity") or 0)
+            except (TypeError, ValueError):
+                capacity = 0
+            if kind is None or capacity <= 0 or not room.get("room_no"):
+                continue
+            buckets.setdefault(kind, []).append((capacity, room["room_no"]))
+        self._rooms = {}
+        self._capacities = {}
+        for kind, entries in buckets.items():
+            entries.sort()
+            self._capacities[kind] = [c for c, _ in entries]
+            self._rooms[kind] = tuple(r for _, r in entries)
+        self.capacity = {r: c for entries in buckets.values() for c, r in entries}
+        self._cache = {}
+
+    def candidates(self, kind, students=0):
+        """
+        Rooms of `kind` that seat `students`, smallest first. Cohorts larger than every
+        room of the kind fall back to all its rooms, largest first.
+        """
+        key = (kind, students)
+        if key not in self._cache:
+            rooms = self._rooms.get(kind, ())
+            start = bisect_left(self._capacities.get(kind, []), students)
+            fitting = rooms[start:]
+            self._cache[key] = fitting if fitting else tuple(reversed(rooms))
+        return self._cache[key]
+
+    def as_rows(self):
+        """The pooled rooms as load_classrooms()-style dicts, with the kind as room_type."""
+        return [{"room_no": room, "room_type": kind, "capacity": self.capacity[room]}
+                for kind, rooms in self._rooms.items() for room in rooms]
+
+    def sizes(self):
+        """Number of rooms per kind."""
+        return {kind: len(rooms) for kind, rooms in self._rooms.items()}
+
+    def __len__(self):
+        return len(self.capacity)
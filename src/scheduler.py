@@ -1,18 +1,28 @@
 # src/scheduler.py
 import random
 import math
-from tkinter import messagebox
-from .utils import DAYS, LECTURE_SLOTS, TUTORIAL_SLOTS, LAB_SLOTS
+import copy
+import time
+from .utils import DAYS, LECTURE_SLOTS, TUTORIAL_SLOTS, LAB_SLOTS, parse_slot_to_minutes, split_faculty
+from .models import Interner, Session
+from .occupancy import OccupancyIndex, slot_mask
+from .backtrack import BacktrackingEngine
+from .cache import fingerprint
+from .decompose import solve_decomposed
+from .diagnostics import explain_unscheduled
+from .enrollment import ConflictGraph, StudentOccupancy
+from .quality import score_timetable
+from .optimizer import LocalSearchOptimizer
+from .rooms import RoomPool
+from .slots import DEFAULT_CATALOGUE
+from .stats import SchedulerStats
 
 # --- helpers to work with time intervals ---
 def _parse_slot_to_minutes(slot):
     """
     slot: "HH:MM-HH:MM" -> (start_minutes, end_minutes)
     """
-    start, end = slot.split("-")
-    sh, sm = map(int, start.split(":"))
-    eh, em = map(int, end.split(":"))
-    return sh * 60 + sm, eh * 60 + em
+    return parse_slot_to_minutes(slot)
 
 def _intervals_overlap(a_start, a_end, b_start, b_end):
     """
@@ -20,16 +30,25 @@ def _intervals_overlap(a_start, a_end, b_start, b_end):
     """
     return not (a_end <= b_start or b_end <= a_start)
 
+# day name -> small int id used by the internal bitmask structures
+_DAY_IDS = {day: i for i, day in enumerate(DAYS)}
+
+
+class GenerationCancelled(Exception):
+    """Raised by generate_timetable() when its `cancel` event is set during a run."""
+
+
 class TimetableScheduler:
     """
     Scheduler that:
       - uses typed slot pools (lecture/tutorial/lab),
-      - enforces no room overlap (checked by real intervals),
-      - enforces no student overlap for same branch+semester (real intervals),
+      - enforces no room overlap (checked on per-day occupancy bitmasks),
+      - enforces no student overlap for same branch+semester (same bitmasks),
+      - enforces no faculty double-booking and per-faculty unavailability windows,
       - converts hours-per-week into number-of-slots using per-type slot durations.
     """
 
-    # durations in hours for each type of slot
+    # durations in hours for each type of slot (a custom slot grid brings its own)
     TYPE_DURATION = {
         "Lecture": 1.5,
         "Tutorial": 1.0,
@@ -42,28 +61,79 @@ class TimetableScheduler:
         "Lab": LAB_SLOTS
     }
 
-    def __init__(self, courses=None):
+    SOLVERS = ("random", "greedy", "exact")
+
+    # random picks tried per required session by the "random" solver
+    MAX_ATTEMPTS = 300
+
+    def __init__(self, courses=None, slots=None):
         # courses[branch][sem][code] = {
         #   name, faculty, class_room, lab_room, lecture_hours, tutorial_hours, lab_hours
         # }
         self.courses = courses or {}
-        # timetable[branch][sem] -> {(day,slot): (code, name, faculty, type, room_used)}
+        # slot grid (slots.SlotCatalogue); a custom campus grid replaces the typed pools
+        # and the session durations derived from them
+        self.catalogue = slots or DEFAULT_CATALOGUE
+        if slots is not None:
+            self.TYPE_POOLS = slots.pools
+            self.TYPE_DURATION = {**self.TYPE_DURATION, **slots.durations}
+        # timetable[branch][sem] -> {(day, slot, code): (code, name, faculty, type, room_used)}
+        # (keyed by code too: enrolled electives of a branch+sem may share a slot)
         self.timetable = {}
-        # occupied_rooms: (room, day) -> list of (start_min, end_min)
-        self.occupied_rooms = {}
-        # branch_sem_intervals: (branch, sem, day) -> list of (start_min, end_min)
+        # bumped on every change to the timetable, so views can cache what they render
+        self.version = 0
+        # occupied_rooms: (room, day) -> bitmask of occupied ticks
+        self.occupied_rooms = OccupancyIndex()
+        # branch_sem_intervals: ((branch, sem), day) -> bitmask of occupied ticks
         # prevents same students getting overlapping sessions
-        self.branch_sem_intervals = {}
+        self.branch_sem_intervals = OccupancyIndex()
+        # optional enrollment.ConflictGraph (set_enrollment()); sessions of enrolled courses
+        # are checked against the courses sharing their students instead of the whole
+        # branch+sem, and against _core_intervals: the branch+sem's courses without
+        # enrollment data, which every student of the cohort takes
+        self.enrollment = None
+        self._students = None
+        self._core_intervals = OccupancyIndex()
+        # occupied_faculty: (faculty name, day) -> bitmask of ticks taught or unavailable
+        self.occupied_faculty = OccupancyIndex()
+        # faculty_unavailable: (faculty name, day) -> bitmask, re-applied on every generation
+        self.faculty_unavailable = {}
         # list of (branch, sem, course_name, type) that couldn't be fully scheduled
         self.unscheduled = []
+        # (branch, sem, code) -> small int id; _course_days[id] is a bitmask of the
+        # day ids on which the course already has a session
+        self._course_ids = Interner()
+        self._course_days = []
+        # enrolled course code -> cohorts taking it, lead first (_cohorts()); rebuilt lazily
+        self._shared = None
+        # score and seed of the attempt kept by the last generate_best()
+        self.best_score = None
+        self.best_seed = None
+        # True once a timetable exists; course changes are then applied incrementally
+        self._live = False
+        # optional RoomPool used for courses without a fixed class_room / lab_room
+        self.room_pool = None
+        # SchedulerStats of the last generation while enable_stats() is on, else None
+        self.stats = None
+        self._stats_enabled = False
+        self._profile = None
+        # progress callback / cancel event of the generation in flight (generate_timetable)
+        self._progress = None
+        self._cancel = None
+        self._cohorts_done = set()
 
     def add_course(self, branch, sem, code, name, faculty, room,
-                   lecture_hours=0, tutorial_hours=0, lab_hours=0, lab_room=None):
+                   lecture_hours=0, tutorial_hours=0, lab_hours=0, lab_room=None, students=0):
         """
         Backwards-compatible: `room` is treated as the class (lecture/tutorial) room.
-        Optional lab_room can be passed (keyword) for lab sessions.
+        Optional lab_room can be passed (keyword) for lab sessions; `students` sizes the
+        room picked from the room pool when no room is given.
+        Once a timetable has been generated, the course is placed into it incrementally
+        (replacing an existing course with the same code); everything else stays put.
         """
         branch, sem = str(branch), str(sem)
+        if self._live:
+            self._rip_up(branch, sem, code)
         if branch not in self.courses:
             self.courses[branch] = {}
         if sem not in self.courses[branch]:
@@ -75,137 +145,848 @@ class TimetableScheduler:
             "lab_room": (lab_room or ""),            # lab room (may be empty)
             "lecture_hours": int(lecture_hours),
             "tutorial_hours": int(tutorial_hours),
-            "lab_hours": int(lab_hours)
+            "lab_hours": int(lab_hours),
+            "students": int(students or 0)
         }
+        self._shared = None
+        if self._live:
+            # joining an elective placed for other branches re-places it for all of them
+            self._rip_up(branch, sem, code)
+            self._schedule_course(branch, sem, code)
+            self._retry_unscheduled()
+
+    def update_course(self, branch, sem, code, previous_name=None, **changes):
+        """
+        Apply field changes (name, faculty, class_room, lab_room, *_hours, ...) to a course.
+        On a live timetable only this course's sessions are ripped up and re-placed.
+        Also works for a course already written into `courses` by the caller; if that
+        renamed it, pass the old name as previous_name so its unscheduled entries go too.
+        """
+        branch, sem = str(branch), str(sem)
+        info = self.courses[branch][sem][code]
+        if self._live:
+            self._rip_up(branch, sem, code, previous_name)
+        for key, value in changes.items():
+            info[key] = int(value) if key.endswith("_hours") else value
+        if self._live:
+            self._schedule_course(branch, sem, code)
+            self._retry_unscheduled()
+
+    def remove_course(self, branch, sem, code):
+        """Remove a course; on a live timetable its slots are freed and reused for pending sessions."""
+        branch, sem = str(branch), str(sem)
+        others = [c for c in self._cohorts(branch, sem, code) if c != (branch, sem)]
+        if self._live:
+            self._rip_up(branch, sem, code)
+        del self.courses[branch][sem][code]
+        self._shared = None
+        if not self.courses[branch][sem]:
+            del self.courses[branch][sem]
+            self.timetable.get(branch, {}).pop(sem, None)
+        if not self.courses[branch]:
+            del self.courses[branch]
+            self.timetable.pop(branch, None)
+        self.version += 1
+        if self._live:
+            if others:
+                # a shared elective stays for the other branches, led by the next one
+                self._schedule_course(*others[0], code)
+            self._retry_unscheduled()
+
+    def set_faculty_unavailable(self, faculty, days=None, window=None):
+        """
+        Block a faculty member on the given day(s) (default: every day) for the
+        "HH:MM-HH:MM" window (default: the whole day). Applies to the next generation;
+        on a live timetable, sessions of this faculty inside the window are ripped up
+        and placed again elsewhere.
+        """
+        if days is None:
+            days = DAYS
+        elif isinstance(days, str):
+            days = [days]
+        mask = slot_mask(window or "00:00-24:00")
+        blocked = {}
+        for name in split_faculty(faculty):
+            for day in days:
+                key = (name, day)
+                self.faculty_unavailable[key] = self.faculty_unavailable.get(key, 0) | mask
+                self.occupied_faculty.mark(name, day, mask)
+                blocked[key] = mask
+        if self._live:
+            self._move_off_blocked(blocked)
+
+    def set_rooms(self, rooms):
+        """
+        Register the institute's rooms (dicts from csv_import.load_classrooms()).
+        Sessions of courses without a fixed class_room / lab_room then get the smallest
+        free room of the right type that seats the course's "students".
+        """
+        self.room_pool = RoomPool(rooms)
+
+    def set_enrollment(self, enrollment):
+        """
+        Check student clashes from real enrollments instead of "same branch+sem":
+        enrollment is an enrollment.ConflictGraph, anything ConflictGraph.from_enrollments()
+        takes ({student: [course codes]}, csv_import.iter_enrollments()), or None to go
+        back to branch+sem only. Courses are matched by code, so an elective shared by
+        several branches is one course, placed once into each of their timetables (with
+        the first branch+sem's course details); enrolled courses of a branch+sem may share
+        a slot. Courses without enrollment data still clash with everything of their
+        branch+sem. A live timetable is kept and re-indexed.
+        """
+        if enrollment is not None and not isinstance(enrollment, ConflictGraph):
+            enrollment = ConflictGraph.from_enrollments(enrollment)
+        self.enrollment = enrollment
+        self._shared = None
+        self._students = None if enrollment is None else StudentOccupancy(enrollment, self.catalogue)
+        if self._live:
+            timetable = {b: {s: dict(t) for s, t in sems.items()} for b, sems in self.timetable.items()}
+            self._adopt(timetable, list(self.unscheduled))
+
+    def _enroll_id(self, code):
+        if self.enrollment is None:
+            return -1
+        gid = self.enrollment.course_id(code)
+        return -1 if gid is None else gid
+
+    def _cohorts(self, branch, sem, code):
+        """
+        The (branch, sem) timetables a course's sessions go into: for an enrolled course,
+        every cohort listing its code, the lead (whose sessions are built) first; else
+        just its own.
+        """
+        if self._enroll_id(code) < 0:
+            return ((branch, sem),)
+        if self._shared is None:
+            shared = {}
+            for b, sems in self.courses.items():
+                for s, by_code in sems.items():
+                    for c in by_code:
+                        if self._enroll_id(c) >= 0:
+                            shared.setdefault(c, []).append((str(b), str(s)))
+            self._shared = {c: tuple(cohorts) for c, cohorts in shared.items()}
+        cohorts = self._shared.get(code, ())
+        return cohorts if (branch, sem) in cohorts else ((branch, sem),)
+
+    def _is_mirror(self, branch, sem, code):
+        """Whether this cohort only mirrors the sessions of an elective led by another."""
+        return self._cohorts(branch, sem, code)[0] != (branch, sem)
+
+    def enable_stats(self, profile=None):
+        """
+        Collect a SchedulerStats (probes, rejections by reason, time per branch+sem, pool
+        sizes) on every following generation; read it as scheduler.stats.as_dict().
+        profile: optional path; each generation is then run under cProfile and the
+        profile is written there (readable with pstats / snakeviz).
+        """
+        self._stats_enabled = True
+        self._profile = profile
+        self.stats = SchedulerStats()
+
+    def disable_stats(self):
+        self._stats_enabled = False
+        self._profile = None
+        self.stats = None
 
     # --- room overlap helpers ---
     def _room_conflicts(self, room, day, slot):
-        s_min, e_min = _parse_slot_to_minutes(slot)
-        key = (room, day)
-        if key not in self.occupied_rooms:
-            return False
-        for (os, oe) in self.occupied_rooms[key]:
-            if _intervals_overlap(s_min, e_min, os, oe):
-                return True
-        return False
+        return self.occupied_rooms.conflicts(room, day, slot_mask(slot))
 
     def _mark_room(self, room, day, slot):
-        s_min, e_min = _parse_slot_to_minutes(slot)
-        key = (room, day)
-        self.occupied_rooms.setdefault(key, []).append((s_min, e_min))
+        self.occupied_rooms.mark(room, day, slot_mask(slot))
 
     # --- branch+sem student overlap helpers ---
     def _branch_sem_conflicts(self, branch, sem, day, slot):
-        s_min, e_min = _parse_slot_to_minutes(slot)
-        key = (branch, sem, day)
-        if key not in self.branch_sem_intervals:
-            return False
-        for (bs, be) in self.branch_sem_intervals[key]:
-            if _intervals_overlap(s_min, e_min, bs, be):
-                return True
-        return False
+        return self.branch_sem_intervals.conflicts((branch, sem), day, slot_mask(slot))
 
     def _mark_branch_sem(self, branch, sem, day, slot):
-        s_min, e_min = _parse_slot_to_minutes(slot)
-        key = (branch, sem, day)
-        self.branch_sem_intervals.setdefault(key, []).append((s_min, e_min))
+        self.branch_sem_intervals.mark((branch, sem), day, slot_mask(slot))
+
+    # --- faculty overlap helpers ---
+    def _faculty_conflicts(self, faculty, day, slot):
+        mask = slot_mask(slot)
+        return any(self.occupied_faculty.conflicts(name, day, mask) for name in split_faculty(faculty))
 
-    def generate_timetable(self, notify=True):
+    # --- session helpers shared by all solvers ---
+    def _type_needs(self, info):
+        """For each type compute required #slots = ceil(hours / type_duration)."""
+        return {
+            "Lecture": max(0, math.ceil(info.get("lecture_hours", 0) / self.TYPE_DURATION["Lecture"])),
+            "Tutorial": max(0, math.ceil(info.get("tutorial_hours", 0) / self.TYPE_DURATION["Tutorial"])),
+            "Lab": max(0, math.ceil(info.get("lab_hours", 0) / self.TYPE_DURATION["Lab"]))
+        }
+
+    @staticmethod
+    def _session_room(info, ctype):
         """
-        Returns (timetable, unscheduled).
-        If notify is True, messageboxes will be shown (UI). Tests should pass notify=False.
+        Room a session of this type is held in, or "" if the course lacks one.
+        Labs need a lab_room; lectures/tutorials need a class_room.
+        """
+        if ctype == "Lab":
+            return info.get("lab_room") or ""
+        return info.get("class_room") or ""
+
+    def _session_rooms(self, info, ctype):
+        """
+        Candidate rooms for a session, in order of preference: the course's fixed room,
+        else the room pool's rooms that fit the cohort (smallest first), else none.
+        """
+        room = self._session_room(info, ctype)
+        if room:
+            return (room,)
+        if self.room_pool is None:
+            return ()
+        try:
+            students = int(info.get("students") or 0)
+        except (TypeError, ValueError):
+            students = 0
+        return self.room_pool.candidates("lab" if ctype == "Lab" else "class", students)
+
+    def _free_room(self, rooms, day, slot):
+        """First of `rooms` not occupied during (day, slot), or None."""
+        mask = slot_mask(slot)
+        for room in rooms:
+            if not self.occupied_rooms.conflicts(room, day, mask):
+                return room
+        return None
+
+    def _build_sessions(self):
+        """
+        Expand every course into one Session per required session.
+        Course types that can't get a room are recorded as unscheduled straight away.
+        """
+        sessions = []
+        for branch, sems in self.courses.items():
+            branch = str(branch)
+            for sem, courses in sems.items():
+                sem = str(sem)
+                for code, info in courses.items():
+                    if not self._is_mirror(branch, sem, code):
+                        sessions.extend(self._course_sessions(branch, sem, code, info))
+        return sessions
+
+    def _course_sessions(self, branch, sem, code, info, needs=None):
+        """Sessions for one course (`needs` overrides the per-type counts)."""
+        sessions = []
+        for ctype, need in (needs or self._type_needs(info)).items():
+            if need <= 0:
+                continue
+            rooms = self._session_rooms(info, ctype)
+            if not rooms:
+                if self.stats is not None:
+                    self.stats.rejections["no_room"] += need
+                self.unscheduled.append((branch, sem, info.get("name", code), ctype))
+                continue
+            for _ in range(need):
+                sessions.append(self._make_session(
+                    branch, sem, code, info, ctype, rooms,
+                    # fixed room, or None when the room comes from the pool
+                    self._session_room(info, ctype) or None,
+                    need, split_faculty(info.get("faculty"))))
+        return sessions
+
+    def _make_session(self, branch, sem, code, info, ctype, rooms, room, need, faculty):
+        """Build a Session with its cohort, course, room and faculty ids interned."""
+        return Session(
+            branch, sem, code, info, ctype, rooms, room, need, faculty,
+            cohort_id=self.branch_sem_intervals.key_id((branch, sem)),
+            cohorts=self._cohorts(branch, sem, code),
+            course_id=self._course_id(branch, sem, code),
+            room_ids=tuple(self.occupied_rooms.key_id(r) for r in rooms),
+            faculty_ids=tuple(self.occupied_faculty.key_id(f) for f in faculty),
+            enroll_id=self._enroll_id(code))
+
+    def _course_id(self, branch, sem, code):
+        cid = self._course_ids.id((branch, sem, code))
+        if cid == len(self._course_days):
+            self._course_days.append(0)
+        return cid
+
+    @staticmethod
+    def _shared_keys(session):
+        """
+        Resources other than the room and the students that two overlapping sessions
+        must not share (students: _share_students()).
+        """
+        return frozenset(("faculty", name) for name in session.faculty)
+
+    def _share_students(self, cohorts_a, gid_a, cohorts_b, gid_b):
         """
+        Whether two sessions, given as (their _cohorts(), enroll id), may have a student
+        in common: enrolled courses by the conflict graph, others by branch+sem.
+        """
+        if gid_a < 0 or gid_b < 0:
+            return not set(cohorts_a).isdisjoint(cohorts_b)
+        return bool(self.enrollment.adjacency[gid_a] >> gid_b & 1)
+
+    def _can_place(self, branch, sem, code, room, day, slot, faculty=()):
+        """faculty: the session's faculty names, as returned by split_faculty()."""
+        return self._rejection(branch, sem, code, room, day, slot, faculty) is None
+
+    def _rejection(self, branch, sem, code, room, day, slot, faculty=()):
+        """Why a session can't take (day, slot) in room (a SchedulerStats reason), or None."""
+        # 1) same course not twice in same day
+        cid = self._course_ids.get((branch, sem, code))
+        if cid is not None and self._course_days[cid] >> _DAY_IDS[day] & 1:
+            return "same_day"
+        mask = slot_mask(slot)
+        # 2) room conflict
+        if self.occupied_rooms.conflicts(room, day, mask):
+            return "room"
+        # 3) student conflict for this branch+sem, or with courses sharing enrolled students
+        gid = self._enroll_id(code)
+        if gid < 0:
+            if self.branch_sem_intervals.conflicts((branch, sem), day, mask):
+                return "cohort"
+        elif any(self._core_intervals.conflicts(cohort, day, mask)
+                 for cohort in self._cohorts(branch, sem, code)):
+            return "cohort"
+        elif self._students.conflicts(gid, _DAY_IDS[day], slot):
+            return "students"
+        # 4) faculty already teaching (or unavailable) at this time
+        for name in faculty:
+            if self.occupied_faculty.conflicts(name, day, mask):
+                return "faculty"
+        return None
+
+    def _can_place_counted(self, branch, sem, code, room, day, slot, faculty=()):
+        reason = self._rejection(branch, sem, code, room, day, slot, faculty)
+        self.stats.probe(reason)
+        return reason is None
+
+    def _probes(self):
+        """
+        The (can_place, fit_room) checks solvers should use: the plain ones, or the
+        counting variants while stats are collected, so disabled stats cost nothing
+        inside the probe loops.
+        """
+        if self.stats is None:
+            return self._can_place, self._fit_room
+        return self._can_place_counted, self._fit_room_counted
+
+    def _fit_room(self, session, day_id, mask, slot):
+        """
+        Id-based fast path of _free_room() + _can_place() for a Session: the first of its
+        rooms free at (day, mask) if the session may take that time, else None.
+        slot is the slot string of mask (enrolled courses are checked by slot).
+        """
+        if self._course_days[session.course_id] >> day_id & 1:
+            return None
+        n = len(DAYS)
+        if session.enroll_id < 0:
+            if self.branch_sem_intervals.masks[session.cohort_id * n + day_id] & mask:
+                return None
+        elif self._student_clash(session, day_id, mask, slot):
+            return None
+        faculty = self.occupied_faculty.masks
+        for f in session.faculty_ids:
+            if faculty[f * n + day_id] & mask:
+                return None
+        rooms = self.occupied_rooms.masks
+        for k, r in enumerate(session.room_ids):
+            if not rooms[r * n + day_id] & mask:
+                return session.rooms[k]
+        return None
+
+    def _student_clash(self, session, day_id, mask, slot):
+        """For an enrolled session: "cohort", "students" or None (see set_enrollment())."""
+        core = self._core_intervals
+        for cohort in session.cohorts:
+            if core.masks[core.key_id(cohort) * core.n_days + day_id] & mask:
+                return "cohort"
+        if self._students.conflicts(session.enroll_id, day_id, slot):
+            return "students"
+        return None
+
+    def _fit_room_counted(self, session, day_id, mask, slot):
+        """_fit_room() that records the probe and its rejection reason on self.stats."""
+        n = len(DAYS)
+        room = reason = None
+        if session.enroll_id < 0:
+            clash = "cohort" if self.branch_sem_intervals.masks[session.cohort_id * n + day_id] & mask else None
+        else:
+            clash = self._student_clash(session, day_id, mask, slot)
+        if self._course_days[session.course_id] >> day_id & 1:
+            reason = "same_day"
+        elif clash:
+            reason = clash
+        elif any(self.occupied_faculty.masks[f * n + day_id] & mask for f in session.faculty_ids):
+            reason = "faculty"
+        else:
+            room = self._fit_room(session, day_id, mask, slot)
+            if room is None:
+                reason = "room"
+        self.stats.probe(reason)
+        return room
+
+    def _place(self, branch, sem, code, info, ctype, room, day, slot):
+        # store the room actually used for this session, in every cohort taking the course
+        entry = (code, info.get("name"), info.get("faculty"), ctype, room)
+        mask = slot_mask(slot)
+        for b, s in self._cohorts(branch, sem, code):
+            self.timetable.setdefault(b, {}).setdefault(s, {})[(day, slot, code)] = entry
+            self._course_days[self._course_id(b, s, code)] |= 1 << _DAY_IDS[day]
+            self.branch_sem_intervals.mark((b, s), day, mask)
+        self.version += 1
+        self.occupied_rooms.mark(room, day, mask)
+        gid = self._enroll_id(code)
+        if gid < 0:
+            self._core_intervals.mark((branch, sem), day, mask)
+        else:
+            self._students.mark(gid, _DAY_IDS[day], slot)
+        for name in split_faculty(info.get("faculty")):
+            self.occupied_faculty.mark(name, day, mask)
+
+    def _unplace(self, branch, sem, day, slot, code):
+        """Remove a placed session and release everything it occupied; returns its entry."""
+        entry = self.timetable[branch][sem].pop((day, slot, code))
+        self.version += 1
+        _, _, faculty, _, room = entry
+        mask = slot_mask(slot)
+        for b, s in self._cohorts(branch, sem, code):
+            self.timetable.get(b, {}).get(s, {}).pop((day, slot, code), None)
+            self._course_days[self._course_id(b, s, code)] &= ~(1 << _DAY_IDS[day])
+            if self.enrollment is not None:
+                # enrolled sessions of one branch+sem may overlap each other, so the
+                # cleared ticks can still be held by another session: rebuild the day
+                self._rebuild_branch_sem_day(b, s, day)
+            else:
+                self.branch_sem_intervals.unmark((b, s), day, mask)
+                self._core_intervals.unmark((b, s), day, mask)
+        self.occupied_rooms.unmark(room, day, mask)
+        gid = self._enroll_id(code)
+        if gid >= 0:
+            self._students.unmark(gid, _DAY_IDS[day], slot)
+        for name in split_faculty(faculty):
+            self.occupied_faculty.unmark(name, day, mask)
+            # the session may have sat in a window blocked after it was placed
+            self.occupied_faculty.mark(name, day, self.faculty_unavailable.get((name, day), 0))
+        return entry
+
+    def _rebuild_branch_sem_day(self, branch, sem, day):
+        """Recompute a branch+sem's masks for one day from the sessions still placed."""
+        every = core = 0
+        for (d, slot, _), entry in self.timetable[branch][sem].items():
+            if d == day:
+                mask = slot_mask(slot)
+                every |= mask
+                if self._enroll_id(entry[0]) < 0:
+                    core |= mask
+        day_id = _DAY_IDS[day]
+        for index, mask in ((self.branch_sem_intervals, every), (self._core_intervals, core)):
+            index.masks[index.key_id((branch, sem)) * index.n_days + day_id] = mask
+
+    def _reset(self):
         self.timetable.clear()
+        self.version += 1
         self.occupied_rooms.clear()
         self.branch_sem_intervals.clear()
+        self._core_intervals.clear()
+        if self._students is not None:
+            self._students.clear()
+        self.occupied_faculty.clear()
+        for (name, day), mask in self.faculty_unavailable.items():
+            self.occupied_faculty.mark(name, day, mask)
         self.unscheduled.clear()
+        self._course_days = [0] * len(self._course_ids)
+        self._shared = None
+        for branch, sems in self.courses.items():
+            for sem in sems:
+                self.timetable.setdefault(str(branch), {})[str(sem)] = {}
 
+    # --- incremental rescheduling ---
+    def _rip_up(self, branch, sem, code, previous_name=None):
+        """
+        Remove every placed session and unscheduled entry of one course (of all branches
+        sharing it). Unscheduled entries are found by the course's name now, previous_name
+        and the name its placed sessions were recorded under (the info may already hold a
+        new name).
+        """
+        names = {previous_name} if previous_name is not None else set()
+        cohorts = self._cohorts(branch, sem, code)
+        for b, s in cohorts:
+            table = self.timetable.get(b, {}).get(s, {})
+            for (day, slot, _), entry in [(k, e) for k, e in table.items() if e[0] == code]:
+                names.add(entry[1])
+                self._unplace(b, s, day, slot, code)
+            info = self.courses.get(b, {}).get(s, {}).get(code)
+            if info is not None:
+                names.add(info.get("name", code))
+        for b, s in cohorts:
+            for name in names:
+                self._drop_unscheduled(b, s, name)
+
+    def _missing_needs(self, branch, sem, code, info):
+        """Per-type session counts still missing from the timetable for this course."""
+        needs = self._type_needs(info)
+        for entry in self.timetable.get(branch, {}).get(sem, {}).values():
+            if entry[0] == code:
+                needs[entry[3]] -= 1
+        return needs
+
+    def _missing_sessions(self):
+        """Number of required sessions of all courses not in the timetable."""
+        return sum(max(0, n) for branch, sems in self.courses.items() for sem, by_code in sems.items()
+                   for code, info in by_code.items() if not self._is_mirror(str(branch), str(sem), code)
+                   for n in self._missing_needs(str(branch), str(sem), code, info).values())
+
+    def _schedule_course(self, branch, sem, code, rng=None):
+        """Place a course's missing sessions, moving at most one other session per placement."""
+        rng = rng or random.Random(0)
+        branch, sem = self._cohorts(branch, sem, code)[0]
+        info = self.courses[branch][sem][code]
+        self.timetable.setdefault(branch, {}).setdefault(sem, {})
+        sessions = self._course_sessions(branch, sem, code, info, self._missing_needs(branch, sem, code, info))
+        failed = [s for s in self._place_greedily(sessions, rng, record=False) if not self._repair(s, rng)]
+        self._record_unscheduled(failed)
+
+    def _move_off_blocked(self, blocked):
+        """Rip up placed sessions inside blocked {(faculty, day): mask} windows and re-place their courses."""
+        moved = []
+        for branch, sems in self.timetable.items():
+            for sem, table in sems.items():
+                for (day, slot, code), entry in list(table.items()):
+                    mask = slot_mask(slot)
+                    if any(blocked.get((name, day), 0) & mask for name in split_faculty(entry[2])):
+                        self._unplace(branch, sem, day, slot, code)
+                        moved.append((*self._cohorts(branch, sem, code)[0], code))
+        for branch, sem, code in dict.fromkeys(moved):
+            info = self.courses.get(branch, {}).get(sem, {}).get(code)
+            if info is not None:
+                self._drop_unscheduled(branch, sem, info.get("name", code))
+                self._schedule_course(branch, sem, code)
+
+    def _retry_unscheduled(self):
+        """Try again to place courses listed as unscheduled, e.g. after slots were freed."""
+        pending = {(b, s, name) for b, s, name, _ in self.unscheduled}
+        for branch, sem, name in sorted(pending):
+            for code, info in self.courses.get(branch, {}).get(sem, {}).items():
+                if info.get("name", code) == name:
+                    self._drop_unscheduled(branch, sem, name)
+                    self._schedule_course(branch, sem, code)
+
+    def _drop_unscheduled(self, branch, sem, name):
+        self.unscheduled[:] = [u for u in self.unscheduled if u[:3] != (branch, sem, name)]
+
+    def _record_unscheduled(self, sessions):
+        for s in sessions:
+            entry = (s.branch, s.sem, s.info.get("name", s.code), s.ctype)
+            if entry not in self.unscheduled:
+                self.unscheduled.append(entry)
+
+    def _entry_session(self, branch, sem, entry):
+        code, name, faculty, ctype, room = entry
+        info = self.courses.get(branch, {}).get(sem, {}).get(code) or {"name": name, "faculty": faculty}
+        fixed = self._session_room(info, ctype)
+        return self._make_session(branch, sem, code, info, ctype, self._session_rooms(info, ctype) or (room,),
+                                  fixed or None, 1, split_faculty(faculty))
+
+    def _blockers(self, session, day, slot):
+        """
+        Placed sessions (branch, sem, day, slot, code) that stop `session` from taking
+        (day, slot); a shared elective's session is listed once, under its lead cohort.
+        """
+        overlaps = self.catalogue.overlaps
+        faculty = set(session.faculty)
+        blockers = {}
+        for branch, sems in self.timetable.items():
+            for sem, table in sems.items():
+                for (d, sl, code), entry in table.items():
+                    if d != day:
+                        continue
+                    cohorts = self._cohorts(branch, sem, code)
+                    blocker = (*cohorts[0], d, sl, code)
+                    if code == session.code and (branch, sem) in session.cohorts:
+                        blockers[blocker] = None
+                        continue
+                    if not overlaps(sl, slot):
+                        continue
+                    if (entry[4] == session.room or faculty & set(split_faculty(entry[2]))
+                            or self._share_students(session.cohorts, session.enroll_id, cohorts,
+                                                    self._enroll_id(code))):
+                        blockers[blocker] = None
+        return list(blockers)
+
+    def _repair(self, session, rng):
+        """
+        Local repair for a session with no free slot: take a (day, slot) held by exactly one
+        other session and move that session elsewhere. Returns True on success.
+        """
+        b, s, code = session.branch, session.sem, session.code
+        _, fit_room = self._probes()
+        for day in DAYS:
+            for slot in self.TYPE_POOLS[session.ctype]:
+                blockers = self._blockers(session, day, slot)
+                if len(blockers) != 1:
+                    continue
+                bb, bs, bday, bslot, bcode = blockers[0]
+                entry = self._unplace(bb, bs, bday, bslot, bcode)
+                room = fit_room(session, _DAY_IDS[day], slot_mask(slot), slot)
+                if room is not None:
+                    self._place(b, s, code, session.info, session.ctype, room, day, slot)
+                    if not self._place_greedily([self._entry_session(bb, bs, entry)], rng, record=False):
+                        return True
+                    self._unplace(b, s, day, slot, code)
+                code_b, _, _, ctype_b, room_b = entry
+                self._place(bb, bs, code_b, self._entry_session(bb, bs, entry).info, ctype_b, room_b, bday, bslot)
+        return False
+
+    def generate_timetable(self, notify=True, solver="random", seed=None, time_budget=10.0, cache=None,
+                           progress=None, cancel=None, decompose=False, workers=None):
+        """
+        Returns (timetable, unscheduled).
+        notify: a callable notify(level, title, message) with level "info" or "warning",
+        or True to show Tk messageboxes (imports the UI lazily). Headless callers and
+        tests pass notify=False.
+
+        solver:
+          - "random": randomized probing of shuffled slot pools (original behaviour)
+          - "greedy": deterministic constructive placement, most-constrained session first
+          - "exact": backtracking search with constraint propagation (see backtrack.py),
+                     bounded by time_budget seconds
+        seed makes every solver reproducible; "greedy" and "exact" use seed 0 when none is given.
+
+        cache: optional cache.TimetableCache. Reproducible runs (any seed, or "greedy" /
+        "exact") are looked up by a fingerprint of the inputs and options first and
+        stored after solving; an unseeded "random" run is never cached.
+
+        progress: optional callable progress(done, total, "branch Sem-sem") called from the
+        solving thread each time a branch+sem is finished.
+        cancel: optional threading.Event (anything with is_set()); the solvers check it
+        between placements and raise GenerationCancelled once it is set, leaving a partial
+        timetable behind (regenerate, or run on a copy).
+
+        decompose: split the cohorts into groups sharing no room, faculty member or
+        enrolled student (decompose.components) and solve each group separately, on a
+        process pool of `workers` processes (None = all cores, 1 = in-process), then
+        merge. Hard constraints hold across groups by construction.
+        """
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}', expected one of {', '.join(self.SOLVERS)}")
+        key = hit = None
+        if cache is not None and (seed is not None or solver != "random"):
+            # only the exact solver's result depends on its time budget
+            options = {"time_budget": time_budget} if solver == "exact" else {}
+            if decompose:
+                options["decompose"] = True
+            key = fingerprint(self, solver, 0 if seed is None else seed, **options)
+            hit = cache.get(key)
+        self._progress, self._cancel = progress, cancel
+        self._cohorts_done = set()
+        try:
+            if hit is not None:
+                self._adopt(*hit)
+            else:
+                self._generate(solver, seed, time_budget, decompose, workers)
+                if key is not None:
+                    cache.put(key, self.timetable, self.unscheduled)
+            # cohorts without sessions (or restored from the cache) count as done too
+            for branch, sems in self.courses.items():
+                for sem in sems:
+                    self._cohort_done(str(branch), str(sem))
+        finally:
+            self._progress = self._cancel = None
+
+        # notifications
+        if notify:
+            if notify is True:
+                # Tk is only needed (and only imported) when messageboxes are requested
+                from .ui import messagebox_notify as notify
+            if self.unscheduled:
+                warn_list = "\n".join(f"{e.branch} Sem-{e.sem}: {e.name} ({e.ctype}) - {e.summary}"
+                                      for e in self.explain_unscheduled())
+                notify("warning", "Unscheduled Courses",
+                       f"⚠ Some sessions couldn’t be scheduled:\n\n{warn_list}")
+            else:
+                notify("info", "Done", "✅ All timetables generated (no student or room overlaps)!")
+
+        return self.timetable, self.unscheduled
+
+    def _generate(self, solver, seed, time_budget, decompose=False, workers=None):
+        """Solve from scratch with the chosen solver (collecting stats when enabled)."""
+        self._reset()
+        profiler = None
+        if self._stats_enabled:
+            self.stats = SchedulerStats()
+            self.stats.pool_sizes = {
+                "slots": {ctype: len(DAYS) * len(pool) for ctype, pool in self.TYPE_POOLS.items()},
+                "rooms": {} if self.room_pool is None else self.room_pool.sizes(),
+            }
+            if self._profile:
+                import cProfile
+                profiler = cProfile.Profile()
+                profiler.enable()
+
+        if decompose:
+            solve_decomposed(self, solver, seed, time_budget, workers)
+        elif solver == "greedy":
+            self._solve_greedy(random.Random(0 if seed is None else seed))
+        elif solver == "exact":
+            self._solve_exact(random.Random(0 if seed is None else seed), time_budget)
+        else:
+            self._solve_random(random.Random(seed))
+        self._live = True
+
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(self._profile)
+        if self.stats is not None:
+            self.stats.placed = sum(len(t) for sems in self.timetable.values() for t in sems.values())
+            self.stats.seconds = time.perf_counter() - self.stats.started
+
+    def _check_cancel(self):
+        """Raise GenerationCancelled if the running generation's cancel event is set."""
+        if self._cancel is not None and self._cancel.is_set():
+            raise GenerationCancelled()
+
+    def _cohort_done(self, branch, sem):
+        """Report a finished branch+sem to the progress callback (once per generation)."""
+        if self._progress is None or (branch, sem) in self._cohorts_done:
+            return
+        self._cohorts_done.add((branch, sem))
+        total = sum(len(sems) for sems in self.courses.values())
+        self._progress(len(self._cohorts_done), total, f"{branch} Sem-{sem}")
+
+    def _adopt(self, timetable, unscheduled):
+        """Install a timetable produced elsewhere and rebuild the occupancy structures from it."""
+        self._reset()
+        for branch, sems in timetable.items():
+            for sem, table in sems.items():
+                self.timetable.setdefault(branch, {}).setdefault(sem, {})
+                for (day, slot, *_), (code, name, faculty, ctype, room) in table.items():
+                    if self._is_mirror(branch, sem, code):
+                        continue  # placed with its lead cohort
+                    info = self.courses.get(branch, {}).get(sem, {}).get(code, {"name": name, "faculty": faculty})
+                    self._place(branch, sem, code, info, ctype, room, day, slot)
+        self.unscheduled.extend(unscheduled)
+        self._live = True
+
+    def generate_best(self, n_restarts=8, workers=None, seed=None, solver="random", time_budget=10.0):
+        """
+        Run n_restarts independently seeded attempts (attempt i uses seed + i) across a
+        process pool of `workers` processes (None = all cores, 1 = in-process) and keep the
+        best by quality.score_timetable. Stops as soon as an attempt schedules everything.
+        Returns (timetable, unscheduled) like generate_timetable; the winning score and
+        seed are left on best_score / best_seed, and with stats enabled the winning
+        attempt's stats on `stats`.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        seeds = [seed + i for i in range(n_restarts)]
+        best = None
+
+        def consider(result):
+            nonlocal best
+            if best is None or result[:2] < best[:2]:
+                best = result
+            return best[0][0] == 0
+
+        if workers == 1:
+            for attempt_seed in seeds:
+                if consider(_run_attempt(self, solver, attempt_seed, time_budget)):
+                    break
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = [pool.submit(_run_attempt, self, solver, s, time_budget) for s in seeds]
+                for future in as_completed(futures):
+                    if consider(future.result()):
+                        break
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        if best is None:
+            return self.generate_timetable(notify=False, solver=solver, seed=seed, time_budget=time_budget)
+        score, attempt_seed, timetable, unscheduled, stats = best
+        self._adopt(timetable, unscheduled)
+        self.best_score, self.best_seed = score, attempt_seed
+        if self._stats_enabled:
+            self.stats = stats
+        return self.timetable, self.unscheduled
+
+    def optimize(self, time_budget=2.0, weights=None, seed=None):
+        """
+        Improve soft-constraint quality (idle gaps, faculty back-to-back load, course spread)
+        of the current timetable in place; returns the optimizer report (objective before/after).
+        """
+        return LocalSearchOptimizer(self, weights=weights, time_budget=time_budget, seed=seed).run()
+
+    def explain_unscheduled(self):
+        """Why each unscheduled entry could not be placed (diagnostics.Explanation list)."""
+        return explain_unscheduled(self)
+
+    def validate(self):
+        """Independent check of the current timetable; returns a validation.ValidationReport."""
+        from .validation import validate_timetable
+        return validate_timetable(self.timetable, self.courses, self.catalogue, self.TYPE_DURATION,
+                                  self.enrollment)
+
+    def _solve_random(self, rng):
+        can_place, _ = self._probes()
         for branch, sems in self.courses.items():
             branch = str(branch)
             for sem, courses in sems.items():
                 sem = str(sem)
-                timetable_branch_sem = {}
-                # used_today prevents same course twice in a day (for student convenience)
-                used_today = {d: set() for d in DAYS}
+                self._check_cancel()
+                started = time.perf_counter() if self.stats is not None else None
 
                 # Make fresh slot pools for this branch+sem (we'll remove assigned slots)
                 slot_pools = {
                     ctype: [(d, s) for d in DAYS for s in pool]
-                    for ctype, pool in TimetableScheduler.TYPE_POOLS.items()
+                    for ctype, pool in self.TYPE_POOLS.items()
                 }
                 # shuffle each pool
                 for pool in slot_pools.values():
-                    random.shuffle(pool)
+                    rng.shuffle(pool)
 
-                # Go over courses
+                # Go over courses (a shared elective is placed with its lead cohort)
                 for code, info in courses.items():
-                    # for each type compute required #slots = ceil(hours / type_duration)
-                    type_needs = {
-                        "Lecture": max(0, math.ceil(info.get("lecture_hours", 0) / self.TYPE_DURATION["Lecture"])),
-                        "Tutorial": max(0, math.ceil(info.get("tutorial_hours", 0) / self.TYPE_DURATION["Tutorial"])),
-                        "Lab": max(0, math.ceil(info.get("lab_hours", 0) / self.TYPE_DURATION["Lab"]))
-                    }
-
+                    if self._is_mirror(branch, sem, code):
+                        continue
                     # assign for each type separately
-                    for ctype, need in type_needs.items():
+                    for ctype, need in self._type_needs(info).items():
                         if need <= 0:
                             continue
 
-                        # Quick validation: can't schedule labs if lab_room not provided
-                        if ctype == "Lab" and not info.get("lab_room"):
+                        # Quick validation: can't schedule without the room for this type
+                        rooms = self._session_rooms(info, ctype)
+                        if not rooms:
                             # record unscheduled for this course/type
-                            self.unscheduled.append((branch, sem, info.get("name", code), ctype))
-                            continue
-                        # Also ensure class_room exists for Lecture/Tutorial
-                        if ctype in ("Lecture", "Tutorial") and not info.get("class_room"):
+                            if self.stats is not None:
+                                self.stats.rejections["no_room"] += need
                             self.unscheduled.append((branch, sem, info.get("name", code), ctype))
                             continue
 
                         pool = slot_pools[ctype]
+                        faculty = split_faculty(info.get("faculty"))
                         count = 0
-                        # We'll attempt up to `max_attempts` picks per required session
-                        max_attempts = 300
 
                         while count < need and pool:
                             assigned = False
                             # try several random picks (bounded)
-                            for _ in range(max_attempts):
+                            for _ in range(self.MAX_ATTEMPTS):
                                 if not pool:
                                     break
-                                day, slot = random.choice(pool)
-
-                                # choose room depending on session type
-                                if ctype == "Lab":
-                                    room = info.get("lab_room") or info.get("class_room") or ""
-                                else:
-                                    room = info.get("class_room") or info.get("room") or ""
-
-                                # 1) same course not twice in same day
-                                if code in used_today[day]:
-                                    continue
-                                # 2) room conflict (check real overlap)
-                                if not room:
-                                    # no available room -> can't assign here
-                                    continue
-                                if self._room_conflicts(room, day, slot):
+                                day, slot = rng.choice(pool)
+                                room = self._free_room(rooms, day, slot)
+                                if room is None:
+                                    if self.stats is not None:
+                                        self.stats.probe("room")
                                     continue
-                                # 3) student conflict for this branch+sem (check real overlap)
-                                if self._branch_sem_conflicts(branch, sem, day, slot):
+                                if not can_place(branch, sem, code, room, day, slot, faculty):
                                     continue
 
-                                # All clear → assign (store the room actually used for this session)
-                                timetable_branch_sem[(day, slot)] = (
-                                    code, info.get("name"), info.get("faculty"), ctype, room
-                                )
-                                used_today[day].add(code)
-                                self._mark_room(room, day, slot)
-                                self._mark_branch_sem(branch, sem, day, slot)
+                                # All clear → assign
+                                self._place(branch, sem, code, info, ctype, room, day, slot)
 
                                 # remove this specific (day,slot) from pool so we don't reuse it for same sem/type
-                                try:
-                                    pool.remove((day, slot))
-                                except ValueError:
-                                    pass
+                                # (other enrolled courses may still share it)
+                                if self._enroll_id(code) < 0:
+                                    try:
+                                        pool.remove((day, slot))
+                                    except ValueError:
+                                        pass
 
                                 count += 1
                                 assigned = True
@@ -218,17 +999,114 @@ class TimetableScheduler:
                         # if we failed to place all needed slots, record unscheduled
                         if count < need:
                             self.unscheduled.append((branch, sem, info.get("name", code), ctype))
+                if started is not None:
+                    self.stats.add_time(branch, sem, time.perf_counter() - started)
+                self._cohort_done(branch, sem)
 
-                # save timetable for branch/sem
-                self.timetable.setdefault(branch, {})[sem] = timetable_branch_sem
+    def _constraint_order(self, sessions):
+        """
+        Most-constrained-first ordering: smallest slot pool (tutorials, labs), then rooms
+        shared by the most sessions, then biggest cohorts, then courses needing most days.
+        """
+        room_demand = {}
+        for s in sessions:
+            room_demand[s.rooms] = room_demand.get(s.rooms, 0) + 1
 
-        # notifications
-        if notify:
-            if self.unscheduled:
-                warn_list = "\n".join([f"{b} Sem-{s}: {c} ({t})" for b, s, c, t in self.unscheduled])
-                messagebox.showwarning("Unscheduled Courses",
-                                       f"⚠ Some sessions couldn’t be scheduled:\n\n{warn_list}")
+        def key(s):
+            try:
+                students = int(s.info.get("students") or 0)
+            except (TypeError, ValueError):
+                students = 0
+            return (len(self.TYPE_POOLS[s.ctype]), -room_demand[s.rooms], -students,
+                    -s.need, s.branch, s.sem, s.code, s.ctype)
+
+        return sorted(sessions, key=key)
+
+    def _solve_greedy(self, rng):
+        self._place_greedily(self._build_sessions(), rng)
+
+    def _place_greedily(self, sessions, rng, record=True):
+        """
+        Place sessions one by one, most-constrained first, on the feasible (day, slot)
+        whose day is least loaded for the cohort. Returns the sessions left unplaced
+        (also recorded as unscheduled when `record` is set).
+        """
+        sessions = self._constraint_order(sessions)
+        # precomputed (day, day id, slot, mask) candidates per type, each with a seeded
+        # tie-break priority
+        candidates = {
+            ctype: sorted(((d, _DAY_IDS[d], s, slot_mask(s)) for d in DAYS for s in pool),
+                          key=lambda c: rng.random())
+            for ctype, pool in self.TYPE_POOLS.items()
+        }
+        # sessions per cohort id and day id: prefer the lightest day to spread the week
+        n_days = len(DAYS)
+        day_load = {}
+        for s in sessions:
+            if s.cohort_id not in day_load:
+                load = day_load[s.cohort_id] = [0] * n_days
+                for day, *_ in self.timetable.get(s.branch, {}).get(s.sem, {}):
+                    load[_DAY_IDS[day]] += 1
+        failed = []
+        recorded = set()
+        _, fit_room = self._probes()
+        stats = self.stats
+        # sessions left per cohort, kept only while a generation reports progress / can be cancelled
+        left = None
+        if self._progress is not None or self._cancel is not None:
+            left = {}
+            for s in sessions:
+                left[s.cohort_id] = left.get(s.cohort_id, 0) + 1
+
+        for s in sessions:
+            if left is not None:
+                self._check_cancel()
+            started = time.perf_counter() if stats is not None else None
+            load = day_load[s.cohort_id]
+            best, best_load = None, None
+            for day, day_id, slot, mask in candidates[s.ctype]:
+                # smallest free room that fits (the only one for fixed-room courses)
+                room = fit_room(s, day_id, mask, slot)
+                if room is None:
+                    continue
+                if best is None or load[day_id] < best_load:
+                    best, best_load = (day, day_id, slot, room), load[day_id]
+                    if best_load == 0:
+                        break
+            if best is None:
+                failed.append(s)
+                key = (s.branch, s.sem, s.code, s.ctype)
+                if record and key not in recorded:
+                    recorded.add(key)
+                    self.unscheduled.append((s.branch, s.sem, s.info.get("name", s.code), s.ctype))
             else:
-                messagebox.showinfo("Done", "✅ All timetables generated (no student or room overlaps)!")
+                day, day_id, slot, room = best
+                self._place(s.branch, s.sem, s.code, s.info, s.ctype, room, day, slot)
+                load[day_id] += 1
+            if started is not None:
+                stats.add_time(s.branch, s.sem, time.perf_counter() - started)
+            if left is not None:
+                left[s.cohort_id] -= 1
+                if not left[s.cohort_id]:
+                    self._cohort_done(s.branch, s.sem)
+        return failed
 
-        return self.timetable, self.unscheduled
+    def _solve_exact(self, rng, time_budget):
+        sessions = self._build_sessions()
+        engine = BacktrackingEngine(self, sessions, rng, time_budget)
+        remaining = engine.solve()
+        pending = {(s.branch, s.sem) for s in remaining}
+        for branch, sem in dict.fromkeys((s.branch, s.sem) for s in sessions):
+            if (branch, sem) not in pending:
+                self._cohort_done(branch, sem)
+        # whatever the search could not settle within budget is filled in greedily
+        self._place_greedily(remaining, rng)
+
+
+def _run_attempt(scheduler, solver, seed, time_budget):
+    """One generate_best() attempt; module-level so it can run in a worker process."""
+    scheduler = copy.deepcopy(scheduler)
+    timetable, unscheduled = scheduler.generate_timetable(
+        notify=False, solver=solver, seed=seed, time_budget=time_budget)
+    score = score_timetable(timetable, unscheduled, scheduler.catalogue, scheduler._missing_sessions())
+    return score, seed, timetable, unscheduled, scheduler.stats
@@ -0,0 +1,367 @@
+# src/service.py
+"""
+Local HTTP/JSON scheduling service for other tools:
+
+    python -m src.cli serve --port 8765 --workers 2
+
+    POST   /jobs                       submit a job (JSON, see SchedulingService.submit)
+    GET    /jobs                       all jobs, oldest first
+    GET    /jobs/<id>                  status and progress
+    GET    /jobs/<id>/result           timetable rows, unscheduled explanations, validation
+    GET    /jobs/<id>/exports          export file names (?format=csv&view=faculty, repeatable)
+    GET    /jobs/<id>/exports/<name>   one exported file
+    DELETE /jobs/<id>                  cancel a queued/running job, or forget a finished one
+
+Every job gets its own TimetableScheduler, solved on a bounded thread pool outside the
+event loop. Only the standard library is used and it binds to 127.0.0.1 by default.
+"""
+import asyncio
+import io
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .csv_import import feed_courses, iter_classrooms, iter_courses, iter_enrollments
+from .export import render_timetable
+from .scheduler import GenerationCancelled, TimetableScheduler
+from .slots import SlotCatalogue
+from .views import ROW_FIELDS, TimetableViews
+
+# uploads larger than this are refused with 413
+MAX_BODY_BYTES = 32 * 1024 * 1024
+
+_CONTENT_TYPES = {"csv": "text/csv; charset=utf-8", "json": "application/json",
+                  "ics": "text/calendar; charset=utf-8"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Job:
+    """One submitted generation: its request, state and, once done, its scheduler and result."""
+
+    def __init__(self, job_id, request):
+        self.id = job_id
+        self.request = request
+        self.status = "queued"  # queued, running, done, failed, cancelled
+        self.created = time.time()
+        self.started = self.finished = None
+        self.progress = (0, 0, None)
+        self.error = None
+        self.skipped_rows = []
+        self.cancel = threading.Event()
+        self.scheduler = None
+        self.result = None
+        self._exports = {}
+
+    def as_dict(self):
+        done, total, cohort = self.progress
+        return {"id": self.id, "status": self.status, "created": self.created, "started": self.started,
+                "finished": self.finished, "progress": {"done": done, "total": total, "cohort": cohort},
+                "error": self.error, "skipped_rows": self.skipped_rows,
+                "sessions": None if self.result is None else len(self.result["timetable"]),
+                "unscheduled": None if self.result is None else len(self.result["unscheduled"])}
+
+
+class SchedulingService:
+    """
+    Job queue behind the HTTP endpoints. `workers` solves run at once; at most
+    `max_pending` jobs may be queued or running (more get 503), and the `max_jobs`
+    most recent jobs are kept for polling.
+
+    handle() is the whole request API and needs no socket, so tools and tests can
+    drive it in-process (see LocalClient); start() serves it over HTTP.
+    """
+
+    def __init__(self, workers=2, max_pending=32, max_jobs=256):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_jobs = max_jobs
+        self.jobs = {}
+        self._ids = itertools.count(1)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="timetable-job")
+        self._server = None
+
+    # --- jobs ---
+    def submit(self, request):
+        """
+        Queue a job. request (a JSON object):
+          courses_csv / rooms_csv / enrollment_csv: CSV text as read by csv_import, or
+          courses / rooms: lists of csv_import-style dicts, enrollment: {student: [codes]}
+          (course rows are checked here; a bad field is refused with 400)
+          slots: {type: ["HH:MM-HH:MM", ...]} custom grid
+          branch: branch for course files without a branch column
+          solver, seed, time_budget: as for generate_timetable; optimize: optimizer seconds
+        """
+        if not isinstance(request, dict):
+            raise HTTPError(400, "job must be a JSON object")
+        if not (request.get("courses_csv") or request.get("courses")):
+            raise HTTPError(400, "courses_csv or courses is required")
+        if not request.get("courses_csv"):
+            _check_course_rows(request["courses"])
+        solver = request.get("solver", "greedy")
+        if solver not in TimetableScheduler.SOLVERS:
+            raise HTTPError(400, f"unknown solver '{solver}'")
+        for key in ("seed", "time_budget", "optimize"):
+            value = request.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise HTTPError(400, f"{key} must be a number")
+        if sum(job.status in ("queued", "running") for job in self.jobs.values()) >= self.max_pending:
+            raise HTTPError(503, "too many pending jobs, retry later")
+        job = Job(str(next(self._ids)), request)
+        self.jobs[job.id] = job
+        self._forget_old()
+        self._pool.submit(self._run, job)
+        return job
+
+    def _forget_old(self):
+        finished = [j for j in self.jobs.values() if j.status not in ("queued", "running")]
+        for job in finished[:max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[job.id]
+
+    def _run(self, job):
+        """Solve one job on a pool thread; everything it builds belongs to this job only."""
+        if job.cancel.is_set():
+            job.status, job.finished = "cancelled", time.time()
+            return
+        job.status, job.started = "running", time.time()
+        try:
+            scheduler = self._build(job)
+            request = job.request
+            seed = request.get("seed")
+            scheduler.generate_timetable(
+                notify=False, solver=request.get("solver", "greedy"), seed=None if seed is None else int(seed),
+                time_budget=float(request.get("time_budget", 10.0)), cancel=job.cancel,
+                progress=lambda done, total, cohort: setattr(job, "progress", (done, total, cohort)))
+            if request.get("optimize"):
+                scheduler.optimize(time_budget=float(request["optimize"]), seed=seed)
+            views = TimetableViews(scheduler.timetable, scheduler.catalogue)
+            job.result = {
+                "timetable": [dict(zip(ROW_FIELDS, row)) for row in views.master],
+                "unscheduled": [e.as_dict() for e in scheduler.explain_unscheduled()],
+                "validation": scheduler.validate().as_dict(),
+            }
+            job.scheduler = scheduler
+            status = "done"
+        except GenerationCancelled:
+            status = "cancelled"
+        except Exception as e:
+            status, job.error = "failed", f"{type(e).__name__}: {e}"
+        # status last: pollers that see it finished find everything else in place
+        job.finished = time.time()
+        job.status = status
+
+    @staticmethod
+    def _build(job):
+        request = job.request
+        errors = []
+        slots = SlotCatalogue.from_dict(request["slots"]) if request.get("slots") else None
+        scheduler = TimetableScheduler(slots=slots)
+        if request.get("rooms_csv"):
+            scheduler.set_rooms(list(iter_classrooms(io.StringIO(request["rooms_csv"]), errors)))
+        elif request.get("rooms"):
+            scheduler.set_rooms(request["rooms"])
+        if request.get("courses_csv"):
+            rows = iter_courses(io.StringIO(request["courses_csv"]), errors, request.get("branch", ""))
+        else:
+            rows = request["courses"]
+        feed_courses(scheduler, rows)
+        if request.get("enrollment_csv"):
+            scheduler.set_enrollment(iter_enrollments(io.StringIO(request["enrollment_csv"]), errors))
+        elif request.get("enrollment"):
+            scheduler.set_enrollment(request["enrollment"])
+        job.skipped_rows = [str(e) for e in errors]
+        return scheduler
+
+    def _job(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise HTTPError(404, f"no job '{job_id}'")
+        return job
+
+    @staticmethod
+    def _finished(job):
+        if job.status != "done":
+            raise HTTPError(409, f"job {job.id} is {job.status}")
+        return job
+
+    async def _exports(self, job, query):
+        formats = tuple(query.get("format", ["csv"]))
+        views = tuple(query.get("view", ["cohort"]))
+        key = (formats, views)
+        if key not in job._exports:
+            scheduler = job.scheduler
+            try:
+                # rendering is CPU work: keep it off the event loop (and out of the solver pool)
+                job._exports[key] = await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: render_timetable(scheduler.timetable, formats, views,
+                                                         catalogue=scheduler.catalogue))
+            except ValueError as e:
+                raise HTTPError(400, str(e)) from None
+        return job._exports[key]
+
+    # --- requests ---
+    async def handle(self, method, target, body=b""):
+        """Answer one request; returns (status, content type, body bytes)."""
+        try:
+            return await self._route(method.upper(), target, body)
+        except HTTPError as e:
+            return _json(e.status, {"error": str(e)})
+
+    async def _route(self, method, target, body):
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        query = parse_qs(url.query)
+        if not parts or parts[0] != "jobs":
+            raise HTTPError(404, "not found")
+        if len(parts) == 1:
+            if method == "POST":
+                try:
+                    request = json.loads(body or b"null")
+                except ValueError:
+                    raise HTTPError(400, "body is not valid JSON") from None
+                return _json(202, self.submit(request).as_dict())
+            if method == "GET":
+                return _json(200, [job.as_dict() for job in self.jobs.values()])
+            raise HTTPError(405, "method not allowed")
+
+        job = self._job(parts[1])
+        if len(parts) == 2 and method == "DELETE":
+            if job.status in ("queued", "running"):
+                job.cancel.set()
+                return _json(202, job.as_dict())
+            del self.jobs[job.id]
+            return _json(200, {"id": job.id, "status": "forgotten"})
+        if method != "GET":
+            raise HTTPError(405, "method not allowed")
+        if len(parts) == 2:
+            return _json(200, job.as_dict())
+        if parts[2:] == ["result"]:
+            return _json(200, self._finished(job).result)
+        if parts[2] == "exports":
+            files = await self._exports(self._finished(job), query)
+            if len(parts) == 3:
+                return _json(200, sorted(files))
+            name = "/".join(parts[3:])
+            if name not in files:
+                raise HTTPError(404, f"no export '{name}'")
+            return 200, _CONTENT_TYPES[name.rsplit(".", 1)[-1]], files[name].encode("utf-8")
+        raise HTTPError(404, "not found")
+
+    # --- HTTP ---
+    async def start(self, host="127.0.0.1", port=8765):
+        """Listen on host:port (port 0 picks a free one); returns the bound (host, port)."""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self, host="127.0.0.1", port=8765):
+        await self.start(host, port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in self.jobs.values():
+            job.cancel.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _serve(self, reader, writer):
+        """One HTTP/1.1 request per connection (Connection: close)."""
+        try:
+            try:
+                method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    status, ctype, payload = _json(413, {"error": "request body too large"})
+                else:
+                    body = await reader.readexactly(length) if length > 0 else b""
+                    status, ctype, payload = await self.handle(method, target, body)
+            except (ValueError, asyncio.IncompleteReadError):
+                status, ctype, payload = _json(400, {"error": "malformed HTTP request"})
+            head = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\nContent-Type: {ctype}\r\n"
+                    f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n")
+            writer.write(head.encode("latin-1") + payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class LocalClient:
+    """
+    In-process client for a SchedulingService: the same requests as over HTTP,
+    without a socket. Each call returns (status, decoded JSON or raw bytes).
+    """
+
+    def __init__(self, service):
+        self.service = service
+
+    async def request(self, method, path, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        status, ctype, data = await self.service.handle(method, path, body)
+        return status, json.loads(data) if ctype == "application/json" else data
+
+    async def get(self, path):
+        return await self.request("GET", path)
+
+    async def post(self, path, payload):
+        return await self.request("POST", path, payload)
+
+    async def delete(self, path):
+        return await self.request("DELETE", path)
+
+    async def wait(self, job_id, timeout=60.0, interval=0.02):
+        """Poll a job until it leaves queued/running; returns its status dict."""
+        deadline = time.monotonic() + timeout
+        while True:
+            _, job = await self.get(f"/jobs/{job_id}")
+            if job["status"] not in ("queued", "running") or time.monotonic() > deadline:
+                return job
+            await asyncio.sleep(interval)
+
+
+def _check_course_rows(rows):
+    """Raise a 400 naming the first field of `courses` rows that feed_courses() can't add."""
+    if not isinstance(rows, list):
+        raise HTTPError(400, "courses must be a list of objects")
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise HTTPError(400, f"courses[{i}] must be an object")
+        code = row.get("code")
+        if not isinstance(code, str) or not code.strip():
+            raise HTTPError(400, f"courses[{i}].code is required")
+        for key in ("name", "class_room", "lab_room", "branch", "semester"):
+            value = row.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int))):
+                raise HTTPError(400, f"courses[{i}].{key} must be a string")
+        faculty = row.get("faculty")
+        if faculty is not None and not isinstance(faculty, str) and not (
+                isinstance(faculty, list) and all(isinstance(f, str) for f in faculty)):
+            raise HTTPError(400, f"courses[{i}].faculty must be a string or a list of strings")
+        for key in ("lecture_hours", "tutorial_hours", "lab_hours", "students"):
+            value = row.get(key)
+            if value is None or isinstance(value, str) and value.strip().isdigit():
+                continue
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise HTTPError(400, f"courses[{i}].{key} must be a whole number")
+
+
+def _json(status, value):
+    return status, "application/json", json.dumps(value, default=str).encode("utf-8")
@@ -0,0 +1,145 @@
+# src/slots.py
+import csv
+from collections import Counter
+from .occupancy import slot_mask
+from .utils import LECTURE_SLOTS, TUTORIAL_SLOTS, LAB_SLOTS, parse_slot_to_minutes
+
+SESSION_TYPES = ("Lecture", "Tutorial", "Lab")
+
+# grids with at least this many slots build their overlap table with NumPy (if installed)
+NUMPY_MIN_SLOTS = 64
+
+
+class SlotCatalogue:
+    """
+    Every slot of a campus grid parsed once and given a small int id, with a
+    precomputed slot x slot overlap table, so "do these two slots overlap?" is a
+    lookup: overlap[i][j] (a list of lists of bools; a NumPy bool matrix for large
+    grids when NumPy is installed).
+
+    pools: {"Lecture": [...], "Tutorial": [...], "Lab": [...]} of "HH:MM-HH:MM"
+    strings; a slot may appear in several pools and gets a single id.
+    durations: {type: hours} of each non-empty pool's most common slot length (the
+    shortest on ties), which turns weekly hours into a number of sessions.
+    Custom grids load with from_csv() / from_dict().
+    """
+
+    def __init__(self, pools):
+        self.pools = {}
+        for ctype, slots in pools.items():
+            ctype = _session_type(ctype)
+            self.pools[ctype] = tuple(self.pools.get(ctype, ())) + tuple(slots)
+        for ctype in SESSION_TYPES:
+            self.pools.setdefault(ctype, ())
+
+        self.slots = []
+        self.ids = {}
+        for slots in self.pools.values():
+            for slot in slots:
+                if slot not in self.ids:
+                    _check_slot(slot)
+                    self.ids[slot] = len(self.slots)
+                    self.slots.append(slot)
+        self.minutes = [parse_slot_to_minutes(s) for s in self.slots]
+        self.durations = {}
+        for ctype, slots in self.pools.items():
+            if slots:
+                lengths = Counter(end - start for start, end in map(parse_slot_to_minutes, slots))
+                minutes = min(lengths, key=lambda n: (-lengths[n], n))
+                self.durations[ctype] = minutes / 60
+        self.masks = [slot_mask(s) for s in self.slots]
+        self.overlap = self._overlap_table()
+        # per slot id: bitmask of the slot ids it overlaps (itself included)
+        self.overlapping = [sum(1 << j for j, hit in enumerate(row) if hit) for row in self.overlap]
+        self._overlapping_ids = [tuple(j for j, hit in enumerate(row) if hit) for row in self.overlap]
+
+    def _overlap_table(self):
+        np = None
+        if len(self.minutes) >= NUMPY_MIN_SLOTS:
+            try:
+                import numpy as np
+            except ImportError:  # optional: the overlap table falls back to nested lists
+                pass
+        if np is not None:
+            starts = np.array([s for s, _ in self.minutes], dtype=np.int32)
+            ends = np.array([e for _, e in self.minutes], dtype=np.int32)
+            return (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+        return [[a0 < b1 and b0 < a1 for b0, b1 in self.minutes] for a0, a1 in self.minutes]
+
+    @classmethod
+    def from_dict(cls, mapping):
+        """{type: [slots]} (types are matched case-insensitively)."""
+        return cls(mapping)
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        """
+        Read a grid from a CSV with a "type" column (Lecture/Tutorial/Lab) and either a
+        "slot" column ("09:00-10:30") or "start" and "end" columns.
+        """
+        pools = {}
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            fields = {(c or "").strip().lower(): c for c in reader.fieldnames or []}
+            if "type" not in fields or not ("slot" in fields or {"start", "end"} <= set(fields)):
+                raise ValueError("Invalid slot CSV format! Expected columns: type, slot (or start, end)")
+            for row in reader:
+                ctype = (row.get(fields["type"]) or "").strip()
+                if not ctype:
+                    continue
+                if "slot" in fields:
+                    slot = (row.get(fields["slot"]) or "").strip()
+                else:
+                    slot = f"{row[fields['start']].strip()}-{row[fields['end']].strip()}"
+                pools.setdefault(_session_type(ctype), []).append(slot)
+        return cls(pools)
+
+    def slot_id(self, slot):
+        return self.ids[slot]
+
+    def interval(self, slot):
+        """(start, end) minutes of a slot string, parsed only if it is outside the grid."""
+        i = self.ids.get(slot)
+        return parse_slot_to_minutes(slot) if i is None else self.minutes[i]
+
+    def overlaps(self, a, b):
+        """Whether slot strings a and b overlap; slots outside the grid are compared by mask."""
+        i, j = self.ids.get(a), self.ids.get(b)
+        if i is None or j is None:
+            return bool(slot_mask(a) & slot_mask(b))
+        return bool(self.overlap[i][j])
+
+    def overlapping_ids(self, slot):
+        """Ids of the grid slots overlapping slot (any slot string, inside the grid or not)."""
+        i = self.ids.get(slot)
+        if i is not None:
+            return self._overlapping_ids[i]
+        mask = slot_mask(slot)
+        return tuple(j for j, m in enumerate(self.masks) if m & mask)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, slot):
+        return slot in self.ids
+
+
+def _session_type(name):
+    for ctype in SESSION_TYPES:
+        if ctype.lower() == str(name).strip().lower():
+            return ctype
+    raise ValueError(f"Unknown session type '{name}', expected one of {', '.join(SESSION_TYPES)}")
+
+
+def _check_slot(slot):
+    try:
+        start, end = parse_slot_to_minutes(slot)
+    except ValueError:
+        raise ValueError(f"bad slot '{slot}', expected HH:MM-HH:MM") from None
+    if not 0 <= start < end <= 24 * 60:
+        raise ValueError(f"bad slot '{slot}'")
+    return start, end
+
+
+# the built-in grid from utils, parsed once at import
+DEFAULT_CATALOGUE = SlotCatalogue({"Lecture": LECTURE_SLOTS, "Tutorial": TUTORIAL_SLOTS, "Lab": LAB_SLOTS})
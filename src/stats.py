@@ -0,0 +1,45 @@
+# src/stats.py
+import time
+
+
+class SchedulerStats:
+    """
+    Counters collected by a TimetableScheduler while stats are enabled
+    (TimetableScheduler.enable_stats()):
+      - probes:       feasibility checks of a (day, slot[, room]) for a session
+      - rejections:   failed probes by reason (see REASONS)
+      - placed:       sessions placed
+      - cohort_seconds: time spent placing sessions of each "branch Sem-sem"
+      - pool_sizes:   candidate (day, slot) pairs per session type and rooms per pool kind
+    """
+
+    REASONS = ("same_day", "room", "cohort", "students", "faculty", "no_room")
+
+    def __init__(self):
+        self.probes = 0
+        self.placed = 0
+        self.rejections = dict.fromkeys(self.REASONS, 0)
+        self.cohort_seconds = {}
+        self.pool_sizes = {}
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def probe(self, reason=None):
+        """Count one probe; reason is None when it succeeded."""
+        self.probes += 1
+        if reason is not None:
+            self.rejections[reason] += 1
+
+    def add_time(self, branch, sem, seconds):
+        key = f"{branch} Sem-{sem}"
+        self.cohort_seconds[key] = self.cohort_seconds.get(key, 0.0) + seconds
+
+    def as_dict(self):
+        return {
+            "probes": self.probes,
+            "placed": self.placed,
+            "rejections": dict(self.rejections),
+            "cohort_seconds": dict(self.cohort_seconds),
+            "pool_sizes": {k: dict(v) for k, v in self.pool_sizes.items()},
+            "seconds": self.seconds,
+        }
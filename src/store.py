@@ -0,0 +1,215 @@
+# src/store.py
+import json
+import sqlite3
+import time
+from .utils import DAYS, split_faculty
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    branch TEXT NOT NULL, sem TEXT NOT NULL, code TEXT NOT NULL,
+    name TEXT, faculty TEXT, class_room TEXT, lab_room TEXT,
+    lecture_hours INTEGER, tutorial_hours INTEGER, lab_hours INTEGER, students INTEGER,
+    PRIMARY KEY (branch, sem, code)
+);
+CREATE TABLE IF NOT EXISTS rooms (
+    room_no TEXT PRIMARY KEY, room_type TEXT, capacity INTEGER
+);
+CREATE TABLE IF NOT EXISTS faculty_unavailable (
+    name TEXT NOT NULL, day TEXT NOT NULL, mask TEXT NOT NULL,
+    PRIMARY KEY (name, day)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, created REAL, unscheduled TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY, snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    branch TEXT, sem TEXT, day TEXT, slot TEXT, code TEXT, name TEXT, faculty TEXT, type TEXT, room TEXT
+);
+CREATE TABLE IF NOT EXISTS session_faculty (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    snapshot_id INTEGER NOT NULL, name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_cohort ON sessions (snapshot_id, branch, sem);
+CREATE INDEX IF NOT EXISTS sessions_by_room ON sessions (snapshot_id, room, day);
+CREATE INDEX IF NOT EXISTS session_faculty_by_name ON session_faculty (snapshot_id, name);
+"""
+
+_SESSION_COLUMNS = "branch, sem, day, slot, code, name, faculty, type, room"
+
+
+class ScheduleStore:
+    """
+    SQLite persistence for an institute: courses, rooms, faculty unavailability and
+    named timetable snapshots ("current" holds the live one). Sessions are indexed by
+    cohort, room and faculty, so lookups don't load whole timetables.
+
+        store = ScheduleStore("term.db")
+        store.save(scheduler)                 # state + "current" timetable
+        store.snapshot("draft-1", scheduler)  # keep a named copy
+        scheduler = store.load()              # restore everything
+    """
+
+    CURRENT = "current"
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- institute state ---
+    def save(self, scheduler):
+        """Replace the stored courses, rooms and unavailability and the "current" snapshot."""
+        with self.conn:
+            self.conn.execute("DELETE FROM courses")
+            self.conn.executemany(
+                "INSERT INTO courses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(str(b), str(s), code, info.get("name"), _faculty_text(info.get("faculty")),
+                  info.get("class_room") or "", info.get("lab_room") or "",
+                  int(info.get("lecture_hours") or 0), int(info.get("tutorial_hours") or 0),
+                  int(info.get("lab_hours") or 0), int(info.get("students") or 0))
+                 for b, sems in scheduler.courses.items()
+                 for s, courses in sems.items()
+                 for code, info in courses.items()])
+            self.conn.execute("DELETE FROM rooms")
+            if scheduler.room_pool is not None:
+                self.conn.executemany("INSERT INTO rooms VALUES (:room_no, :room_type, :capacity)",
+                                      scheduler.room_pool.as_rows())
+            self.conn.execute("DELETE FROM faculty_unavailable")
+            # masks can exceed SQLite's 64-bit integers, so they are stored as text
+            self.conn.executemany("INSERT INTO faculty_unavailable VALUES (?, ?, ?)",
+                                  [(n, d, str(m)) for (n, d), m in scheduler.faculty_unavailable.items()])
+            self._write_snapshot(self.CURRENT, scheduler.timetable, scheduler.unscheduled)
+
+    def load(self, scheduler=None):
+        """
+        Restore the stored state into `scheduler` (a new TimetableScheduler by default),
+        including the "current" timetable when one was saved; returns the scheduler.
+        """
+        if scheduler is None:
+            from .scheduler import TimetableScheduler
+            scheduler = TimetableScheduler()
+        courses = {}
+        for (b, s, code, name, faculty, class_room, lab_room,
+             lecture, tutorial, lab, students) in self.conn.execute("SELECT * FROM courses"):
+            courses.setdefault(b, {}).setdefault(s, {})[code] = {
+                "name": name, "faculty": faculty, "class_room": class_room, "lab_room": lab_room,
+                "lecture_hours": lecture, "tutorial_hours": tutorial, "lab_hours": lab,
+                "students": students}
+        scheduler.courses = courses
+        rooms = self.rooms()
+        if rooms:
+            scheduler.set_rooms(rooms)
+        scheduler.faculty_unavailable = {}
+        for name, day, mask in self.conn.execute("SELECT name, day, mask FROM faculty_unavailable"):
+            scheduler.faculty_unavailable[(name, day)] = int(mask)
+        current = self.load_snapshot(self.CURRENT)
+        if current is not None:
+            scheduler._adopt(*current)
+        else:
+            scheduler._reset()
+        return scheduler
+
+    def rooms(self):
+        """Stored rooms as csv_import.load_classrooms()-style dicts."""
+        return [{"room_no": r, "room_type": t, "capacity": c}
+                for r, t, c in self.conn.execute("SELECT room_no, room_type, capacity FROM rooms")]
+
+    # --- snapshots ---
+    def snapshot(self, name, scheduler):
+        """Store the scheduler's timetable under `name` (replacing an older one)."""
+        with self.conn:
+            self._write_snapshot(name, scheduler.timetable, scheduler.unscheduled)
+
+    def _write_snapshot(self, name, timetable, unscheduled):
+        self.conn.execute("DELETE FROM snapshots WHERE name = ?", (name,))
+        snapshot_id = self.conn.execute(
+            "INSERT INTO snapshots (name, created, unscheduled) VALUES (?, ?, ?)",
+            (name, time.time(), json.dumps([list(u) for u in unscheduled]))).lastrowid
+        faculty_rows = []
+        for branch, sems in timetable.items():
+            for sem, table in sems.items():
+                for (day, slot, *_), (code, cname, faculty, ctype, room) in table.items():
+                    session_id = self.conn.execute(
+                        f"INSERT INTO sessions (snapshot_id, {_SESSION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (snapshot_id, branch, sem, day, slot, code, cname, _faculty_text(faculty),
+                         ctype, room)).lastrowid
+                    faculty_rows.extend((session_id, snapshot_id, f) for f in dict.fromkeys(split_faculty(faculty)))
+        self.conn.executemany("INSERT INTO session_faculty VALUES (?, ?, ?)", faculty_rows)
+
+    def snapshots(self):
+        """[(name, created timestamp, session count)] oldest first."""
+        return self.conn.execute(
+            "SELECT s.name, s.created, COUNT(x.id) FROM snapshots s LEFT JOIN sessions x ON x.snapshot_id = s.id "
+            "GROUP BY s.id ORDER BY s.created, s.id").fetchall()
+
+    def delete_snapshot(self, name):
+        with self.conn:
+            self.conn.execute("DELETE FROM snapshots WHERE name = ?", (name,))
+
+    def load_snapshot(self, name):
+        """(timetable, unscheduled) stored under `name`, or None."""
+        row = self.conn.execute("SELECT id, unscheduled FROM snapshots WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        snapshot_id, unscheduled = row
+        timetable = {}
+        for branch, sem, day, slot, code, cname, faculty, ctype, room in self.conn.execute(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE snapshot_id = ?", (snapshot_id,)):
+            timetable.setdefault(branch, {}).setdefault(sem, {})[(day, slot, code)] = (
+                code, cname, faculty, ctype, room)
+        return timetable, [tuple(u) for u in json.loads(unscheduled or "[]")]
+
+    # --- queries ---
+    def sessions(self, snapshot=CURRENT, room=None, faculty=None, branch=None, sem=None, day=None):
+        """
+        Sessions of a snapshot matching every given filter, as
+        (branch, sem, day, slot, code, name, faculty, type, room) tuples sorted by cohort, day, slot.
+        """
+        sql = f"SELECT {', '.join('x.' + c.strip() for c in _SESSION_COLUMNS.split(','))} " \
+              "FROM sessions x JOIN snapshots s ON s.id = x.snapshot_id"
+        where, args = ["s.name = ?"], [snapshot]
+        if faculty is not None:
+            sql += " JOIN session_faculty f ON f.session_id = x.id"
+            where.append("f.name = ?")
+            args.append(faculty)
+        for column, value in (("room", room), ("branch", branch), ("sem", sem), ("day", day)):
+            if value is not None:
+                where.append(f"x.{column} = ?")
+                args.append(str(value))
+        sql += " WHERE " + " AND ".join(where) + f" ORDER BY x.branch, x.sem, {_DAY_ORDER}, x.slot"
+        return self.conn.execute(sql, args).fetchall()
+
+    def diff(self, old, new):
+        """
+        Sessions only in snapshot `old` ("removed") and only in `new` ("added"), each a
+        list of (branch, sem, day, slot, code, type, room) sorted by cohort, day, slot.
+        """
+        columns = "x.branch, x.sem, x.day, x.slot, x.code, x.type, x.room"
+        one = (f"SELECT {columns} FROM sessions x JOIN snapshots s ON s.id = x.snapshot_id "
+               "WHERE s.name = ?")
+        def key(row):
+            return row[0], row[1], _DAY_INDEX.get(row[2], len(DAYS)), row[3:]
+        removed = self.conn.execute(f"{one} EXCEPT {one}", (old, new)).fetchall()
+        added = self.conn.execute(f"{one} EXCEPT {one}", (new, old)).fetchall()
+        return {"removed": sorted(removed, key=key), "added": sorted(added, key=key)}
+
+
+# sorts day names in week order instead of alphabetically
+_DAY_ORDER = "CASE x.day " + " ".join(f"WHEN '{d}' THEN {i}" for i, d in enumerate(DAYS)) + " ELSE 99 END"
+_DAY_INDEX = {d: i for i, d in enumerate(DAYS)}
+
+
+def _faculty_text(faculty):
+    if isinstance(faculty, (list, tuple)):
+        return ", ".join(f for f in faculty if f)
+    return faculty or ""
@@ -1,8 +1,28 @@
 # ui.py
+import copy
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from .scheduler import TimetableScheduler
-from .utils import export_to_csv, DAYS
+from .scheduler import GenerationCancelled, TimetableScheduler
+from .slots import DEFAULT_CATALOGUE
+from .utils import export_to_csv
+from .views import TimetableViews, text_widths, week_grid
+
+# what the timetable viewer can show; the first two are per branch+sem
+VIEW_MODES = ("List", "Week grid", "Faculty", "Room")
+LIST_COLUMNS = ("Day", "Slot", "Code", "Course", "Faculty", "Type", "Room")
+
+
+def messagebox_notify(level, title, message):
+    """Notification callback for the headless core (see TimetableScheduler.generate_timetable)."""
+    if level == "warning":
+        messagebox.showwarning(title, message)
+    elif level == "error":
+        messagebox.showerror(title, message)
+    else:
+        messagebox.showinfo(title, message)
+
 
 class TimetableApp:
     def __init__(self, root):
@@ -13,6 +33,17 @@ class TimetableApp:
 
         self.courses = {}
         self.timetable = {}
+        # live scheduler after the first generation; course edits are applied to it incrementally
+        self.scheduler = None
+        # background generation: worker thread, its cancel event and the queue it reports on
+        self._worker = None
+        self._cancel = None
+        self._events = queue.Queue()
+        # viewer: TimetableViews of the shown timetable and (mode, key) -> (columns, rows,
+        # widths), both dropped whenever the timetable version changes
+        self._views = None
+        self._views_version = None
+        self._render_cache = {}
 
         self.setup_styles()
         self.setup_ui()
@@ -103,6 +134,12 @@ class TimetableApp:
         self.styled_button(btn_frame, "⚡ Generate All", self.generate_all, color="#28a745").grid(row=0, column=1, padx=10, pady=10)
         self.styled_button(btn_frame, "📖 Show Timetable", self.show_timetable, color="#6f42c1").grid(row=1, column=0, padx=10, pady=10)
         self.styled_button(btn_frame, "📤 Export CSV", self.export_csv, color="#e83e8c").grid(row=1, column=1, padx=10, pady=10)
+        self.progress = ttk.Progressbar(btn_frame, mode="determinate", length=180)
+        self.progress.grid(row=2, column=0, padx=10, pady=(10, 0))
+        self.styled_button(btn_frame, "✖ Cancel", self.cancel_generation, color="#6c757d").grid(row=2, column=1, padx=10, pady=(10, 0))
+        self.progress_text = tk.StringVar()
+        tk.Label(btn_frame, textvariable=self.progress_text, font=("Segoe UI", 9),
+                 bg="#f0f3f7", fg="#444").grid(row=3, column=0, columnspan=2, sticky="w", padx=10)
 
         # ===== TIMETABLE VIEWER =====
         table_frame = tk.LabelFrame(container, text="📊 Timetable Viewer",
@@ -128,12 +165,26 @@ class TimetableApp:
         display_sem_cb.grid(row=0, column=3, padx=5)
         display_sem_cb.current(0)
 
+        tk.Label(filter_frame, text="View:", font=("Segoe UI", 10, "bold"), bg="#ffffff").grid(row=0, column=4, padx=5)
+        self.view_mode = tk.StringVar(value=VIEW_MODES[0])
+        view_cb = ttk.Combobox(filter_frame, textvariable=self.view_mode,
+                               values=VIEW_MODES, state="readonly", width=10)
+        view_cb.grid(row=0, column=5, padx=5)
+
+        tk.Label(filter_frame, text="Faculty / Room:", font=("Segoe UI", 10, "bold"),
+                 bg="#ffffff").grid(row=1, column=0, columnspan=2, padx=5, pady=(5, 0), sticky="e")
+        self.view_key = tk.StringVar()
+        self.view_key_cb = ttk.Combobox(filter_frame, textvariable=self.view_key, state="readonly", width=30)
+        self.view_key_cb.grid(row=1, column=2, columnspan=4, padx=5, pady=(5, 0), sticky="w")
+
+        # switching cohort / view re-renders from the cache right away
+        for cb in (display_branch_cb, display_sem_cb, view_cb, self.view_key_cb):
+            cb.bind("<<ComboboxSelected>>", lambda e: self.show_timetable(quiet=True))
+
         tree_container = tk.Frame(table_frame)
         tree_container.pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.tree = ttk.Treeview(tree_container,
-                                 columns=("Day", "Slot", "Code", "Course", "Faculty", "Type", "Room"),
-                                 show="headings")
+        self.tree = ttk.Treeview(tree_container, columns=LIST_COLUMNS, show="headings")
         for col in self.tree["columns"]:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=100, anchor="center")
@@ -201,12 +252,21 @@ class TimetableApp:
             room = lab_room if lab > 0 else class_room
 
             self.courses.setdefault(branch, {}).setdefault(sem, {})
+            previous = self.courses[branch][sem].get(code)
             self.courses[branch][sem][code] = {
                 "name": name, "faculty": faculty,
                 "class_room": class_room, "lab_room": lab_room,
                 "lecture_hours": lec, "tutorial_hours": tut, "lab_hours": lab,
                 "room": room
             }
+            if self.scheduler is not None:
+                # re-place only this course in the live timetable
+                self.scheduler.update_course(branch, sem, code,
+                                             previous_name=previous and previous.get("name"))
+                missing = [u for u in self.scheduler.unscheduled if u[:3] == (branch, sem, name)]
+                if missing:
+                    warn_list = "\n".join([f"{c} ({t})" for _, _, c, t in missing])
+                    messagebox.showwarning("Unscheduled Sessions", f"⚠ Some sessions couldn’t be placed:\n\n{warn_list}")
             messagebox.showinfo("Success", f"✅ Added {name} ({lec}/{tut}/{lab}) hrs/week for {branch} Sem-{sem}")
             for e in self.entries.values():
                 e.delete(0, tk.END)
@@ -268,11 +328,15 @@ class TimetableApp:
             return
         try:
             if messagebox.askyesno("Confirm", f"Are you sure you want to remove {code}?"):
-                del self.courses[branch][sem][code]
-                if not self.courses[branch][sem]:
-                    del self.courses[branch][sem]
-                if not self.courses[branch]:
-                    del self.courses[branch]
+                if self.scheduler is not None:
+                    # frees only this course's slots in the live timetable
+                    self.scheduler.remove_course(branch, sem, code)
+                else:
+                    del self.courses[branch][sem][code]
+                    if not self.courses[branch][sem]:
+                        del self.courses[branch][sem]
+                    if not self.courses[branch]:
+                        del self.courses[branch]
                 messagebox.showinfo("Removed", f"🗑 Course {code} removed successfully.")
                 self.refresh_course_list()
         except KeyError:
@@ -282,41 +346,160 @@ class TimetableApp:
 
     # === TIMETABLE ===
     def generate_all(self):
-        scheduler = TimetableScheduler(self.courses)
-        self.timetable, unscheduled = scheduler.generate_timetable(notify=False)
+        """
+        Generate in a worker thread so the window stays responsive. The worker solves a
+        copy of the courses and reports progress and its result on self._events, which
+        the Tk thread drains with root.after(); nothing touches widgets off the Tk thread.
+        """
+        if self._worker is not None:
+            return
+        snapshot = copy.deepcopy(self.courses)
+        scheduler = TimetableScheduler(snapshot)
+        self._cancel = threading.Event()
+        self.progress.configure(value=0, maximum=max(1, sum(len(sems) for sems in snapshot.values())))
+        self.progress_text.set("Generating…")
+
+        def run():
+            try:
+                result = scheduler.generate_timetable(
+                    notify=False, cancel=self._cancel,
+                    progress=lambda done, total, cohort: self._events.put(("progress", done, total, cohort)))
+                self._events.put(("done", scheduler, snapshot, result))
+            except GenerationCancelled:
+                self._events.put(("cancelled",))
+            except Exception as e:
+                self._events.put(("error", e))
+
+        self._worker = threading.Thread(target=run, name="timetable-generation", daemon=True)
+        self._worker.start()
+        self.root.after(50, self._poll_generation)
+
+    def cancel_generation(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self.progress_text.set("Cancelling…")
+
+    def _poll_generation(self):
+        """Apply the worker's events on the Tk thread; reschedules itself until it finishes."""
+        try:
+            while True:
+                event = self._events.get_nowait()
+                kind = event[0]
+                if kind == "progress":
+                    _, done, total, cohort = event
+                    self.progress.configure(value=done, maximum=total)
+                    self.progress_text.set(f"{cohort} done ({done}/{total})")
+                    continue
+                self._worker = self._cancel = None
+                if kind == "done":
+                    self._finish_generation(*event[1:])
+                elif kind == "cancelled":
+                    self.progress.configure(value=0)
+                    self.progress_text.set("Generation cancelled")
+                else:
+                    self.progress_text.set("")
+                    messagebox.showerror("Error", f"❌ Generation failed: {event[1]}")
+                return
+        except queue.Empty:
+            pass
+        self.root.after(50, self._poll_generation)
+
+    def _finish_generation(self, scheduler, snapshot, result):
+        self.timetable, unscheduled = result
+        # courses edited while the worker ran are re-placed incrementally, not lost
+        # (snapshot is scheduler.courses, which remove_course() prunes: collect first)
+        removed = [(branch, sem, code) for branch, sems in snapshot.items() for sem, by_code in sems.items()
+                   for code in by_code if code not in self.courses.get(branch, {}).get(sem, {})]
+        for branch, sem, code in removed:
+            scheduler.remove_course(branch, sem, code)
+        for branch, sems in self.courses.items():
+            for sem, by_code in sems.items():
+                for code, info in by_code.items():
+                    old = snapshot.get(branch, {}).get(sem, {}).get(code)
+                    if old != info:
+                        scheduler.courses.setdefault(branch, {}).setdefault(sem, {})[code] = dict(info)
+                        scheduler.update_course(branch, sem, code, previous_name=old and old.get("name"))
+        unscheduled = scheduler.unscheduled
+        self.progress_text.set("")
+        # share the course dict so later edits go through the live scheduler
+        self.scheduler = scheduler
+        self.courses = scheduler.courses
         if self.timetable:
             b = next(iter(self.timetable))
             s = next(iter(self.timetable[b]))
             self.display_branch.set(b)
             self.display_sem.set(s)
         if unscheduled:
-            warn_list = "\n".join([f"{b} Sem-{s}: {c} ({t})" for b, s, c, t in unscheduled])
+            warn_list = "\n".join(f"{e.branch} Sem-{e.sem}: {e.name} ({e.ctype})\n    {e.summary}"
+                                  for e in scheduler.explain_unscheduled())
             messagebox.showwarning("Unscheduled Courses", f"⚠ Some couldn’t be scheduled:\n\n{warn_list}")
         else:
             messagebox.showinfo("Done", "✅ All timetables generated successfully!")
 
-    def show_timetable(self):
+    def _view_index(self):
+        """TimetableViews of the current timetable; rebuilt, and the render cache dropped, after it changes."""
+        version = (id(self.timetable), self.scheduler.version if self.scheduler is not None else 0)
+        if version != self._views_version:
+            catalogue = self.scheduler.catalogue if self.scheduler is not None else DEFAULT_CATALOGUE
+            self._views = TimetableViews(self.timetable, catalogue)
+            self._views_version = version
+            self._render_cache.clear()
+        return self._views
+
+    def _rendered(self, mode, key):
+        """(columns, rows, column widths) of one view, or None when there is nothing to show."""
+        views = self._view_index()
+        hit = self._render_cache.get((mode, key))
+        if hit is not None:
+            return hit
+        catalogue = self.scheduler.catalogue if self.scheduler is not None else DEFAULT_CATALOGUE
+        if mode in ("Faculty", "Room"):
+            source = views.by_faculty if mode == "Faculty" else views.by_room
+            if key not in source:
+                return None
+            columns, rows = week_grid(source[key], catalogue, with_cohort=True)
+        else:
+            if key not in views.by_cohort:
+                return None
+            if mode == "Week grid":
+                columns, rows = week_grid(views.by_cohort[key], catalogue)
+            else:
+                columns, rows = LIST_COLUMNS, [row[2:] for row in views.by_cohort[key]]
+        widths = [max(100, min(w * 10, 400)) for w in text_widths(columns, rows)]
+        hit = self._render_cache[(mode, key)] = (tuple(columns), rows, widths)
+        return hit
+
+    def show_timetable(self, quiet=False):
+        """Show the chosen view; quiet skips the "select ..." / "not found" messages."""
+        mode = self.view_mode.get()
+        views = self._view_index()
+        if mode in ("Faculty", "Room"):
+            names = sorted(views.by_faculty if mode == "Faculty" else views.by_room)
+            self.view_key_cb["values"] = names
+            if self.view_key.get() not in names:
+                self.view_key.set(names[0] if names else "")
+            key = self.view_key.get()
+        else:
+            key = (self.display_branch.get(), self.display_sem.get())
+            if not all(key):
+                if not quiet:
+                    messagebox.showwarning("Select", "⚠ Please select Branch and Semester first")
+                return
+        rendered = self._rendered(mode, key)
         self.tree.delete(*self.tree.get_children())
-        branch = self.display_branch.get()
-        sem = self.display_sem.get()
-        if not branch or not sem:
-            messagebox.showwarning("Select", "⚠ Please select Branch and Semester first")
+        if rendered is None:
+            if not quiet:
+                messagebox.showwarning("Not Found", "⚠ No timetable found for this selection")
             return
-        if branch in self.timetable and sem in self.timetable[branch]:
-            sorted_items = sorted(
-                self.timetable[branch][sem].items(),
-                key=lambda kv: (DAYS.index(kv[0][0]), kv[0][1])
-            )
-            for idx, ((day, slot), (code, name, faculty, ctype, room)) in enumerate(sorted_items):
-                tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-                self.tree.insert("", "end",
-                                 values=(day, slot, code, name, faculty, ctype, room),
-                                 tags=(tag,))
-            for col in self.tree["columns"]:
-                max_width = max([len(str(self.tree.set(k, col))) for k in self.tree.get_children()] + [len(col)])
-                self.tree.column(col, width=max(100, min(max_width*10, 400)))
-        else:
-            messagebox.showwarning("Not Found", "⚠ No timetable found for this Branch & Semester")
+        columns, rows, widths = rendered
+        if tuple(self.tree["columns"]) != columns:
+            self.tree.configure(columns=columns)
+            for col in columns:
+                self.tree.heading(col, text=col)
+        for col, width in zip(columns, widths):
+            self.tree.column(col, width=width, anchor="center")
+        for idx, row in enumerate(rows):
+            self.tree.insert("", "end", values=row, tags=("evenrow" if idx % 2 == 0 else "oddrow",))
 
     def export_csv(self):
         export_to_csv(self.timetable)
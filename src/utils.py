@@ -1,4 +1,6 @@
-import csv
+import os
+import re
+from functools import lru_cache
 
 DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri"]
 
@@ -31,13 +33,51 @@ LAB_SLOTS = [
 SLOTS = LECTURE_SLOTS + TUTORIAL_SLOTS + LAB_SLOTS
 
 
-def export_to_csv(timetable):
-    """Exports the given timetable dictionary into CSV files per branch and semester."""
-    for branch, sems in timetable.items():
-        for sem, table in sems.items():
-            fname = f"timetable_{branch}_Sem{sem}.csv"
-            with open(fname, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Day", "Slot", "Course Code", "Course Name", "Faculty", "Type", "Room"])
-                for (day, slot), (code, name, faculty, ctype, room) in table.items():
-                    writer.writerow([day, slot, code, name, faculty, ctype, room])
+def parse_slot_to_minutes(slot):
+    """
+    slot: "HH:MM-HH:MM" -> (start_minutes, end_minutes)
+    """
+    start, end = slot.split("-")
+    sh, sm = map(int, start.split(":"))
+    eh, em = map(int, end.split(":"))
+    return sh * 60 + sm, eh * 60 + em
+
+
+# faculty strings that don't name a real person and must not be treated as one
+FACULTY_PLACEHOLDERS = {"", "tbd", "tba", "na", "n/a", "-"}
+
+_SECTION_SUFFIX = re.compile(r"\s*[-–]\s*section\b.*$", re.IGNORECASE)
+
+
+def split_faculty(faculty):
+    """
+    Normalize a faculty field into a tuple of individual names.
+    Accepts a list (as produced by csv_import) or a string such as
+    "Dr. Sunil P V - Section A; Dr. Vivekraj - Section B"; section suffixes and
+    placeholders like "TBD" are dropped.
+    """
+    if not faculty:
+        return ()
+    return _split_faculty(tuple(faculty) if isinstance(faculty, (list, tuple)) else (faculty,))
+
+
+@lru_cache(maxsize=4096)
+def _split_faculty(parts):
+    names = []
+    for part in parts:
+        for name in re.split(r"[;,]", str(part)):
+            name = _SECTION_SUFFIX.sub("", name).strip()
+            if name.lower() not in FACULTY_PLACEHOLDERS and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def export_to_csv(timetable, out_dir="."):
+    """
+    Exports the given timetable dictionary into CSV files per branch and semester,
+    written to out_dir (created if missing), rows sorted by day and time. Returns the
+    paths written. See export.export_timetable() for the other views and formats.
+    """
+    from .export import export_timetable
+    os.makedirs(out_dir, exist_ok=True)
+    return export_timetable(timetable, out_dir, formats=("csv",), views=("cohort",))
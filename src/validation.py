@@ -0,0 +1,222 @@
+# src/validation.py
+import math
+from .models import Interner
+from .slots import DEFAULT_CATALOGUE
+from .utils import split_faculty
+
+# hours per session of each type, as in TimetableScheduler.TYPE_DURATION
+DEFAULT_DURATIONS = {"Lecture": 1.5, "Tutorial": 1.0, "Lab": 2.0}
+
+# resource kinds checked by the column sweep ("students" needs the conflict graph)
+_SWEPT = ("room", "faculty", "cohort")
+
+# end minutes are < _END_SPAN, so (group, end) packs into one int
+_END_SPAN = 2048
+
+# resource kinds with at least this many sessions are swept with NumPy (if installed);
+# below it, importing NumPy and building the arrays costs more than the plain sweep
+NUMPY_MIN_SESSIONS = 4096
+
+
+class ValidationReport:
+    """
+    Result of validate_timetable(); every list is empty for a clean timetable.
+    Sessions are referred to as (branch, sem, day, slot, code).
+
+      - room / faculty / cohort: (key, day, session a, session b) for each session b
+        that overlaps an earlier session a on the same resource
+      - students: ((code a, code b), day, session a, session b) for overlapping sessions
+        of enrolled courses sharing a student (only checked with an enrollment graph)
+      - shortfall: (branch, sem, code, type, needed, placed) for courses with fewer
+        placed sessions of a type than their hours require
+    """
+
+    KINDS = ("room", "faculty", "cohort", "students")
+
+    def __init__(self):
+        self.room = []
+        self.faculty = []
+        self.cohort = []
+        self.students = []
+        self.shortfall = []
+        self.sessions = 0
+
+    @property
+    def ok(self):
+        return not (self.room or self.faculty or self.cohort or self.students or self.shortfall)
+
+    def as_dict(self):
+        return {"sessions": self.sessions, "room": self.room, "faculty": self.faculty,
+                "cohort": self.cohort, "students": self.students, "shortfall": self.shortfall}
+
+    def lines(self):
+        """One human-readable line per problem."""
+        out = []
+        for kind in self.KINDS:
+            for key, day, a, b in getattr(self, kind):
+                if kind != "room" and kind != "faculty":
+                    key = (" Sem-" if kind == "cohort" else " & ").join(key)
+                out.append(f"{kind} overlap: {key} on {day}: {a[4]} {a[3]} / {b[4]} {b[3]}")
+        for branch, sem, code, ctype, needed, placed in self.shortfall:
+            out.append(f"shortfall: {branch} Sem-{sem}: {code} ({ctype}) {placed}/{needed}")
+        return out
+
+
+def validate_timetable(timetable, courses=None, catalogue=DEFAULT_CATALOGUE, durations=None,
+                       enrollment=None):
+    """
+    Independently check a timetable (the scheduler's nested dict, or one edited outside
+    it) for room, faculty and branch+sem overlaps, and, when `courses` is given, for
+    courses missing sessions. Sessions are flattened into columns (resource id, day,
+    start, end) and overlaps are found in one sorted sweep per resource kind, vectorized
+    with NumPy for large timetables when it is installed. Returns a ValidationReport.
+
+    With an enrollment.ConflictGraph, two enrolled courses of a branch+sem may overlap
+    unless they share a student (reported under "students"); courses without
+    enrollment data still clash with their whole branch+sem. An enrolled course in
+    several timetables at the same (day, slot, room) is one shared session.
+    """
+    report = ValidationReport()
+    sessions = []
+    columns = {kind: ([], [], [], [], []) for kind in _SWEPT}
+    ids = {kind: Interner() for kind in _SWEPT}
+    days = Interner()
+    enrolled = []
+
+    def add(kind, key, day_id, start, end, i):
+        res, day, st, en, idx = columns[kind]
+        res.append(ids[kind].id(key))
+        day.append(day_id)
+        st.append(start)
+        en.append(end)
+        idx.append(i)
+
+    placed = {}
+    shared = {}
+    copies = set()
+    for branch, sems in timetable.items():
+        for sem, table in sems.items():
+            for (day, slot, *_), (code, _, faculty, ctype, room) in table.items():
+                i = len(sessions)
+                sessions.append((branch, sem, day, slot, code))
+                key = (branch, sem, code, ctype)
+                placed[key] = placed.get(key, 0) + 1
+                start, end = catalogue.interval(slot)
+                day_id = days.id(day)
+                if enrollment is not None and code in enrollment:
+                    enrolled.append(i)
+                    if shared.setdefault((day, slot, code, room), i) != i:
+                        copies.add(i)
+                else:
+                    add("cohort", (branch, sem), day_id, start, end, i)
+                if i in copies:
+                    continue  # its room and faculty are counted with the first copy
+                if room:
+                    add("room", room, day_id, start, end, i)
+                for name in dict.fromkeys(split_faculty(faculty)):
+                    add("faculty", name, day_id, start, end, i)
+    report.sessions = len(sessions)
+
+    for kind in _SWEPT:
+        res, day, _, _, _ = columns[kind]
+        find = _overlaps_numpy if len(res) >= NUMPY_MIN_SESSIONS and _has_numpy() else _overlaps_sweep
+        found = getattr(report, kind)
+        for row_a, row_b in find(*columns[kind], len(days)):
+            a, b = sessions[columns[kind][4][row_a]], sessions[columns[kind][4][row_b]]
+            found.append((ids[kind][res[row_b]], days[day[row_b]], a, b))
+    if enrolled:
+        _check_enrolled(report, sessions, enrolled, catalogue, enrollment, copies)
+
+    if courses:
+        durations = durations or DEFAULT_DURATIONS
+        for branch, sems in courses.items():
+            for sem, by_code in sems.items():
+                for code, info in by_code.items():
+                    for ctype, hours_key in (("Lecture", "lecture_hours"), ("Tutorial", "tutorial_hours"),
+                                             ("Lab", "lab_hours")):
+                        needed = max(0, math.ceil(int(info.get(hours_key, 0) or 0) / durations[ctype]))
+                        got = placed.get((str(branch), str(sem), code, ctype), 0)
+                        if got < needed:
+                            report.shortfall.append((str(branch), str(sem), code, ctype, needed, got))
+    return report
+
+
+def _check_enrolled(report, sessions, enrolled, catalogue, enrollment, copies=()):
+    """
+    Overlaps involving enrolled sessions: with a session of a course without enrollment
+    data of the same branch+sem ("cohort"), or with an enrolled course sharing a
+    student ("students"; reported once for a shared session, whose other timetables'
+    copies are in `copies`). One start-sorted sweep per day keeps the sessions still
+    running, so only overlapping pairs are compared.
+    """
+    is_enrolled = set(enrolled)
+    by_day = {}
+    for i, (_, _, day, slot, _) in enumerate(sessions):
+        by_day.setdefault(day, []).append((*catalogue.interval(slot), i))
+    for day, rows in by_day.items():
+        rows.sort()
+        running = []
+        for start, end, b in rows:
+            running = [(e, a) for e, a in running if e > start]
+            sb = sessions[b]
+            for _, a in running:
+                if a not in is_enrolled and b not in is_enrolled:
+                    continue  # found by the "cohort" sweep
+                sa = sessions[a]
+                if a in is_enrolled and b in is_enrolled:
+                    if a in copies or b in copies:
+                        continue
+                    if enrollment.conflicts(sa[4], sb[4]):
+                        report.students.append(((sa[4], sb[4]), day, sa, sb))
+                elif sa[:2] == sb[:2]:
+                    report.cohort.append((sa[:2], day, sa, sb))
+            running.append((end, b))
+
+
+def _has_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # optional: overlaps are then found with a plain sort + sweep
+        return False
+    return True
+
+
+def _overlaps_numpy(res, day, start, end, idx, n_days):
+    """
+    (row a, row b) pairs of overlapping rows on the same resource and day: rows are
+    sorted by (resource, day, start) and each row is compared with the running
+    maximum end of the rows before it in its group.
+    """
+    import numpy as np
+    n = len(res)
+    if n < 2:
+        return []
+    group = np.asarray(res, dtype=np.int64) * max(n_days, 1) + np.asarray(day, dtype=np.int64)
+    start = np.asarray(start, dtype=np.int64)
+    end = np.asarray(end, dtype=np.int64)
+    order = np.lexsort((end, start, group))
+    g, s = group[order], start[order]
+    # running max of (group, end, row) packed into one int; groups ascend, so the max
+    # so far always belongs to the current group when the group didn't change
+    running = np.maximum.accumulate((g * _END_SPAN + end[order]) * n + np.arange(n))[:-1]
+    prev_end = (running // n) % _END_SPAN
+    hit = (g[1:] == g[:-1]) & (s[1:] < prev_end)
+    rows_a = order[running[hit] % n]
+    rows_b = order[1:][hit]
+    return list(zip(rows_a.tolist(), rows_b.tolist()))
+
+
+def _overlaps_sweep(res, day, start, end, idx, n_days):
+    """Pure-Python version of _overlaps_numpy()."""
+    order = sorted(range(len(res)), key=lambda r: (res[r], day[r], start[r], end[r]))
+    pairs = []
+    group = latest = None
+    for r in order:
+        if (res[r], day[r]) != group:
+            group, latest = (res[r], day[r]), r
+            continue
+        if start[r] < end[latest]:
+            pairs.append((latest, r))
+        if end[r] >= end[latest]:
+            latest = r
+    return pairs
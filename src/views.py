@@ -0,0 +1,91 @@
+# src/views.py
+from .slots import DEFAULT_CATALOGUE
+from .utils import DAYS, split_faculty
+
+# column order of every view row
+ROW_FIELDS = ("branch", "sem", "day", "slot", "code", "name", "faculty", "type", "room")
+
+
+def faculty_text(faculty):
+    """Faculty field as a display string (csv_import gives lists, the UI strings)."""
+    if isinstance(faculty, (list, tuple)):
+        return ", ".join(f for f in faculty if f)
+    return faculty or ""
+
+
+def cell_text(row, with_cohort=False):
+    """Grid cell for a view row: "CS301 Lecture (C205)", optionally naming the branch+sem."""
+    branch, sem, _, _, code, _, _, ctype, room = row
+    where = f"{branch} Sem-{sem}, {room}" if with_cohort else room
+    return f"{code} {ctype} ({where})"
+
+
+def week_grid(rows, catalogue=DEFAULT_CATALOGUE, with_cohort=False):
+    """
+    Lay view rows out as a week: returns (columns, grid rows) where columns are "Day"
+    followed by the slots in use (by start time) and each grid row is one weekday with
+    the cell_text() of its sessions per slot (several joined by " / ").
+    """
+    slots = sorted({row[3] for row in rows}, key=catalogue.interval)
+    column = {slot: i for i, slot in enumerate(slots, 1)}
+    grid = {day: [day] + [""] * len(slots) for day in DAYS}
+    for row in rows:
+        line = grid.setdefault(row[2], [row[2]] + [""] * len(slots))
+        i = column[row[3]]
+        text = cell_text(row, with_cohort)
+        line[i] = f"{line[i]} / {text}" if line[i] else text
+    return ["Day"] + slots, list(grid.values())
+
+
+def text_widths(columns, rows):
+    """Widest text per column (in characters) over the header and the rows."""
+    widths = [len(str(c)) for c in columns]
+    for row in rows:
+        for i, value in enumerate(row):
+            if len(str(value)) > widths[i]:
+                widths[i] = len(str(value))
+    return widths
+
+
+class TimetableViews:
+    """
+    Every view people ask for, built in one pass over a timetable:
+      - by_cohort:  (branch, sem) -> rows
+      - by_faculty: faculty name -> rows (a co-taught session is listed under each name)
+      - by_room:    room -> rows
+      - master:     all rows
+    Rows are (branch, sem, day, slot, code, name, faculty, type, room) tuples, each list
+    sorted by weekday and slot start time.
+    """
+
+    def __init__(self, timetable, catalogue=DEFAULT_CATALOGUE):
+        day_order = {d: i for i, d in enumerate(DAYS)}
+        interval = catalogue.interval
+        self.by_cohort = {}
+        self.by_faculty = {}
+        self.by_room = {}
+        keyed = []
+        for branch, sems in timetable.items():
+            for sem, table in sems.items():
+                self.by_cohort[(branch, sem)] = []
+                for (day, slot, *_), (code, name, faculty, ctype, room) in table.items():
+                    row = (branch, sem, day, slot, code, name, faculty_text(faculty), ctype, room)
+                    keyed.append(((day_order.get(day, len(DAYS)), day, interval(slot), branch, sem, code), row))
+        # sort once; every per-key list is then filled already in order
+        keyed.sort(key=lambda kr: kr[0])
+        self.master = [row for _, row in keyed]
+        for row in self.master:
+            self.by_cohort[(row[0], row[1])].append(row)
+            if row[8]:
+                self.by_room.setdefault(row[8], []).append(row)
+            for name in dict.fromkeys(split_faculty(row[6])):
+                self.by_faculty.setdefault(name, []).append(row)
+
+    def cohort(self, branch, sem):
+        return self.by_cohort.get((branch, sem), [])
+
+    def faculty(self, name):
+        return self.by_faculty.get(name, [])
+
+    def room(self, room):
+        return self.by_room.get(room, [])
@@ -0,0 +1,26 @@
+import time
+
+from benchmarks.run import _build, run_case
+from benchmarks.synthetic import make_institute
+
+def test_synthetic_institute_is_seeded_and_scales():
+    assert make_institute(1, seed=3) == make_institute(1, seed=3)
+    courses, rooms = make_institute(2, seed=3)
+    small_courses, small_rooms = make_institute(1, seed=3)
+    assert len(courses) == 2 * len(small_courses)
+    assert len(rooms) == 2 * len(small_rooms)
+
+def test_run_case_reports_metrics():
+    result = run_case(1, "greedy", seed=1, memory=False)
+    assert result["sessions_placed"] > 0 and result["probes"] > 0
+    assert result["conflicts"] == 0
+    assert 0.0 <= result["unscheduled_rate"] < 0.2
+
+def test_exact_solver_budget_covers_setup():
+    # domain building and AC-3 on an instance this size take far longer than the budget
+    scheduler = _build(6, 0)
+    start = time.perf_counter()
+    scheduler.generate_timetable(notify=False, solver="exact", seed=0, time_budget=0.3)
+    assert time.perf_counter() - start < 3
+    report = scheduler.validate()
+    assert not (report.room or report.faculty or report.cohort)
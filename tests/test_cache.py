@@ -0,0 +1,45 @@
+from src.cache import TimetableCache, fingerprint
+from src.scheduler import TimetableScheduler
+
+def _scheduler(faculty="Prof A; Prof B"):
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", faculty, "C205", lecture_hours=3, tutorial_hours=1)
+    scheduler.add_course("CSE", 5, "CS501", "Software", "Prof C", "C205", lecture_hours=3)
+    return scheduler
+
+def test_fingerprint_is_canonical():
+    a = fingerprint(_scheduler(), "greedy", 1)
+    assert a == fingerprint(_scheduler(["Prof A", "Prof B"]), "greedy", 1)
+    assert a != fingerprint(_scheduler(), "greedy", 2)
+    assert a != fingerprint(_scheduler("Prof A"), "greedy", 1)
+
+def test_fingerprint_keeps_course_order_where_it_matters():
+    forward, backward = _scheduler(), _scheduler()
+    backward.courses = {"CSE": dict(reversed(backward.courses["CSE"].items()))}
+    assert fingerprint(forward, "greedy", 1) == fingerprint(backward, "greedy", 1)
+    for solver in ("random", "exact"):
+        assert fingerprint(forward, solver, 1) != fingerprint(backward, solver, 1)
+
+def test_hit_restores_result_from_disk(tmp_path):
+    cache = TimetableCache(directory=tmp_path)
+    expected, _ = _scheduler().generate_timetable(notify=False, solver="random", seed=5, cache=cache)
+    expected = {b: {s: dict(t) for s, t in sems.items()} for b, sems in expected.items()}
+    assert cache.misses == 1 and len(list(tmp_path.iterdir())) == 1
+
+    # a new process would start with an empty memory cache
+    fresh = TimetableCache(directory=tmp_path)
+    scheduler = _scheduler()
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="random", seed=5, cache=fresh)
+    assert fresh.hits == 1
+    assert timetable == expected and unscheduled == []
+    # the adopted timetable is live
+    scheduler.remove_course("CSE", "3", "CS301")
+    assert all(e[0] != "CS301" for e in scheduler.timetable["CSE"].get("3", {}).values())
+
+def test_unseeded_random_and_lru():
+    cache = TimetableCache(max_entries=1)
+    _scheduler().generate_timetable(notify=False, solver="random", cache=cache)
+    assert len(cache) == 0
+    _scheduler().generate_timetable(notify=False, solver="greedy", seed=1, cache=cache)
+    _scheduler().generate_timetable(notify=False, solver="greedy", seed=2, cache=cache)
+    assert len(cache) == 1 and fingerprint(_scheduler(), "greedy", 2) in cache
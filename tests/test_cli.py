@@ -0,0 +1,64 @@
+import json
+import os
+from src.cli import main
+
+COURSES = """Course Code,Course Name,Faculty Name,L-T-P-S-C,No. of Students Registered,Semester,Branch
+CS301,Networks,Prof A,3-0-2-0-4,60,3,CSE
+CS302,Compilers,"Prof B, Prof C",3-1-0-0-4,60,3,CSE
+"""
+ROOMS = """Room No,Room Type,Room Capacity
+C101,Classroom,96
+L106,Software lab,60
+"""
+
+def test_generate_end_to_end(tmp_path, capsys):
+    courses = tmp_path / "courses.csv"
+    rooms = tmp_path / "rooms.csv"
+    courses.write_text(COURSES)
+    rooms.write_text(ROOMS)
+    out = tmp_path / "out"
+
+    code = main(["generate", "--courses", str(courses), "--rooms", str(rooms), "--out", str(out), "--seed", "1"])
+
+    assert code == 0
+    assert os.listdir(out) == ["timetable_CSE_Sem3.csv"]
+    err = capsys.readouterr().err
+    for phase in ("load:", "schedule:", "export:"):
+        assert phase in err
+
+def test_generate_exits_non_zero_on_unscheduled(tmp_path):
+    courses = tmp_path / "courses.csv"
+    courses.write_text(COURSES)
+    # no rooms at all -> nothing can be placed
+    assert main(["generate", "--courses", str(courses), "--out", str(tmp_path / "out")]) == 1
+
+def test_workers_without_restarts_is_one_cached_run(tmp_path):
+    courses = tmp_path / "courses.csv"
+    rooms = tmp_path / "rooms.csv"
+    courses.write_text(COURSES)
+    rooms.write_text(ROOMS)
+    args = ["generate", "--courses", str(courses), "--rooms", str(rooms), "--out", str(tmp_path / "out"),
+            "--seed", "1", "--workers", "4", "--cache", str(tmp_path / "cache")]
+    assert main(args) == 0
+    # a single attempt goes through generate_timetable, so the run is cached
+    assert os.listdir(tmp_path / "cache")
+
+def test_restarts_report_stats_and_unwritable_output(tmp_path, capsys):
+    courses = tmp_path / "courses.csv"
+    rooms = tmp_path / "rooms.csv"
+    courses.write_text(COURSES)
+    rooms.write_text(ROOMS)
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    args = ["generate", "--courses", str(courses), "--rooms", str(rooms), "--seed", "1",
+            "--restarts", "2", "--workers", "1", "--stats", "--cache", str(tmp_path / "cache")]
+
+    assert main(args + ["--out", str(tmp_path / "out")]) == 0
+    err = capsys.readouterr().err
+    assert "warning: --cache is not used with --restarts" in err
+    stats = json.loads(err[err.index("{"):err.rindex("}") + 1])
+    assert stats["placed"] > 0 and stats["probes"] >= stats["placed"]
+
+    # --out below a regular file can't be created: exit 1 with a message, no traceback
+    assert main(args + ["--out", str(blocker / "out")]) == 1
+    assert "error:" in capsys.readouterr().err
@@ -0,0 +1,61 @@
+import pytest
+from src.csv_import import CSVRowError, feed_courses, iter_classrooms, iter_courses, load_courses
+from src.scheduler import TimetableScheduler
+
+def test_registrar_exports_load_with_header_aliases():
+    courses = list(iter_courses("test_cases/routine.csv"))
+    assert len(courses) == 7
+    cs262 = next(c for c in courses if c["code"] == "CS262")
+    assert (cs262["lecture_hours"], cs262["tutorial_hours"], cs262["lab_hours"]) == (2, 0, 2)
+    assert (cs262["branch"], cs262["semester"], cs262["students"]) == ("CSE", "5", 170)
+
+    # test2.csv has no branch column and some short credit strings ("2", "2+1")
+    courses = list(iter_courses("test_cases/test2.csv", default_branch="cse"))
+    assert {c["branch"] for c in courses} == {"CSE"}
+    assert next(c for c in courses if c["code"] == "HS261")["tutorial_hours"] == 1
+
+    rooms = list(iter_classrooms("test_cases/room.csv"))
+    assert len(rooms) == 36
+    assert next(r for r in rooms if r["room_no"] == "C103")["capacity"] == 0
+
+def test_bad_rows_are_collected_not_fatal(tmp_path):
+    path = tmp_path / "courses.csv"
+    path.write_text("Course Code,Course Title,Credits (L-T-P-S-C),Semester,No of Student\n"
+                    "CS301,Networks,3-0-2-0-4,3,60\n"
+                    "CS302,Compilers,x-1,3,60\n"
+                    "CS303,Databases,3-0-0-0-3,3,many\n"
+                    "CS304,Graphics,3-0-0-0-3,3,40\n")
+    errors = []
+    rows = list(iter_courses(path, errors, default_branch="CSE"))
+    assert [r["code"] for r in rows] == ["CS301", "CS304"]
+    assert [e.line for e in errors] == [3, 4]
+    assert all(isinstance(e, CSVRowError) for e in errors)
+
+    reported = []
+    assert len(load_courses(path, on_error=reported.append)) == 2
+    assert len(reported) == 2
+
+def test_feed_courses_in_chunks():
+    scheduler = TimetableScheduler()
+    chunks = []
+    added = feed_courses(scheduler, iter_courses("test_cases/routine.csv"), chunk_size=3, on_chunk=chunks.append)
+    assert added == 7 and chunks == [3, 6, 7]
+    assert set(scheduler.courses) == {"CSE", "ECE"}
+    assert scheduler.courses["CSE"]["5"]["CS262"]["students"] == 170
+
+def test_short_credit_strings_and_errors_without_a_sink(tmp_path):
+    path = tmp_path / "courses.csv"
+    path.write_text("Course Code,Credits,Semester\n"
+                    "MA261,2,1\n"
+                    "HS261,2+1,1\n"
+                    "CS261,3-0-2-0-4,1\n")
+    # a bare number is a theory course's credits: that many lecture hours
+    hours = [(c["lecture_hours"], c["tutorial_hours"], c["lab_hours"]) for c in iter_courses(path)]
+    assert hours == [(2, 0, 0), (2, 1, 0), (3, 0, 2)]
+
+    path.write_text("Course Code,Credits,Semester\nCS301,3-0-0-0-3,3\nCS302,x-1,3\n")
+    rows = iter_courses(path)
+    assert next(rows)["code"] == "CS301"
+    with pytest.raises(CSVRowError) as caught:
+        next(rows)
+    assert caught.value.line == 3
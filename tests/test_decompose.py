@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+from src.decompose import components
+from src.scheduler import GenerationCancelled, TimetableScheduler
+
+
+def _campus():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C101", lecture_hours=3)
+    scheduler.add_course("CSE", "5", "CS501", "Compilers", "Prof A", "C102", lecture_hours=2)
+    scheduler.add_course("ECE", "3", "EC301", "Signals", "Prof B", "C201", lecture_hours=3)
+    scheduler.add_course("ECE", "5", "EC501", "VLSI", "Prof C", "C201", lecture_hours=2)
+    scheduler.add_course("DSAI", "1", "MA101", "Calculus", "Prof D", "D1", lecture_hours=3)
+    return scheduler
+
+
+def test_components_follow_shared_rooms_faculty_and_students():
+    scheduler = _campus()
+    # Prof A ties CSE 3 and 5, room C201 ties ECE 3 and 5, DSAI shares nothing
+    assert components(scheduler) == [[("CSE", "3"), ("CSE", "5")], [("ECE", "3"), ("ECE", "5")], [("DSAI", "1")]]
+
+    scheduler.set_enrollment({"S1": ["CS301", "MA101"], "S2": ["EC501"]})
+    assert components(scheduler) == [[("CSE", "3"), ("CSE", "5"), ("DSAI", "1")], [("ECE", "3"), ("ECE", "5")]]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_decomposed_run_places_everything(workers):
+    scheduler = _campus()
+    seen = []
+    timetable, unscheduled = scheduler.generate_timetable(
+        notify=False, solver="greedy", seed=3, decompose=True, workers=workers,
+        progress=lambda done, total, cohort: seen.append((done, total)))
+    assert unscheduled == []
+    assert sum(len(slots) for sems in timetable.values() for slots in sems.values()) == 10
+    assert scheduler.validate().ok
+    assert sorted(seen)[-1] == (5, 5) and len(seen) == 5
+
+    # merge order is fixed, so runs are reproducible whichever worker finishes first
+    again, _ = _campus().generate_timetable(notify=False, solver="greedy", seed=3, decompose=True, workers=workers)
+    assert again == timetable
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(GenerationCancelled):
+        _campus().generate_timetable(notify=False, decompose=True, workers=workers, cancel=cancel)
+
+
+def test_decompose_accepts_non_string_course_keys():
+    scheduler = TimetableScheduler({
+        "CSE": {3: {"CS301": {"name": "Networks", "faculty": "Prof A", "class_room": "C101", "lecture_hours": 3}}},
+        "ECE": {5: {"EC501": {"name": "VLSI", "faculty": "Prof B", "class_room": "C201", "lecture_hours": 3}}},
+    })
+    assert components(scheduler) == [[("CSE", 3)], [("ECE", 5)]]
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="greedy", decompose=True, workers=1)
+    assert unscheduled == [] and len(timetable["CSE"]["3"]) == len(timetable["ECE"]["5"]) == 2
@@ -0,0 +1,19 @@
+from src.scheduler import TimetableScheduler
+
+def test_explains_blocking_constraints():
+    scheduler = TimetableScheduler()
+    scheduler.set_faculty_unavailable("Prof A", days=["Mon", "Tue", "Wed", "Thu"])
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=3)
+    scheduler.add_course("CSE", "3", "CS302", "No Lab", "Prof B", "C205", lab_hours=2)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    explanations = {e.code: e for e in scheduler.explain_unscheduled()}
+    assert set(explanations) == {"CS301", "CS302"}
+
+    assert "no lab room" in explanations["CS302"].summary
+    e = explanations["CS301"]
+    assert e.candidates == 50
+    # Fri is blocked by its own placed lecture (same day, and overlapping for faculty)
+    assert e.reasons["faculty"] >= 40 and e.reasons["same_day"] == 10
+    assert [label for label, _ in e.blocking] == ["Prof A unavailable", "CS301's own sessions (one per day)"]
+    assert sum(n for _, n in e.blocking) == 50
+    assert e.summary.startswith("all 50 Lecture slots blocked")
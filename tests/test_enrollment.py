@@ -0,0 +1,118 @@
+from src.csv_import import iter_enrollments
+from src.enrollment import ConflictGraph
+from src.scheduler import TimetableScheduler
+from src.slots import SlotCatalogue
+from src.validation import validate_timetable
+
+
+def test_conflict_graph_from_enrollments(tmp_path):
+    path = tmp_path / "enrollment.csv"
+    path.write_text("Roll No,Course Code\n"
+                    "S1,CS301; MA201\n"
+                    "S2,CS301\n"
+                    "S2,EC310\n"
+                    "S3,MA201\n"
+                    ",CS301\n")
+    errors = []
+    graph = ConflictGraph.from_enrollments(iter_enrollments(str(path), errors))
+    assert len(errors) == 1
+    assert graph.students == 3 and len(graph) == 3
+    assert graph.conflicts("CS301", "MA201") and graph.conflicts("EC310", "CS301")
+    assert not graph.conflicts("MA201", "EC310") and not graph.conflicts("CS301", "CS301")
+    assert sorted(graph.neighbours("CS301")) == ["EC310", "MA201"]
+    assert graph.edges() == 2
+
+
+def _electives(enrollment):
+    # two overlapping lecture slots and both faculty only free on Friday: the two
+    # electives can only be placed in parallel
+    catalogue = SlotCatalogue({"Lecture": ["09:00-10:30", "09:30-11:00"]})
+    scheduler = TimetableScheduler(slots=catalogue)
+    for name in ("Prof A", "Prof B"):
+        scheduler.set_faculty_unavailable(name, days=["Mon", "Tue", "Wed", "Thu"])
+    scheduler.add_course("CSE", "5", "CS401", "Compilers", "Prof A", "C101", lecture_hours=1)
+    scheduler.add_course("CSE", "5", "CS402", "Graphics", "Prof B", "C102", lecture_hours=1)
+    if enrollment is not None:
+        scheduler.set_enrollment(enrollment)
+    return scheduler
+
+
+def test_enrollment_lets_disjoint_electives_overlap():
+    _, unscheduled = _electives(None).generate_timetable(notify=False, solver="greedy", seed=0)
+    assert len(unscheduled) == 1
+
+    scheduler = _electives({"S1": ["CS401"], "S2": ["CS402"]})
+    for solver in ("greedy", "exact"):
+        timetable, unscheduled = scheduler.generate_timetable(notify=False, solver=solver, seed=0)
+        assert unscheduled == []
+        assert {(day, code) for day, _, code in timetable["CSE"]["5"]} == {("Fri", "CS401"), ("Fri", "CS402")}
+        assert scheduler.validate().ok
+
+
+def test_shared_student_still_clashes():
+    scheduler = _electives({"S1": ["CS401", "CS402"]})
+    _, unscheduled = scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    assert len(unscheduled) == 1
+    (explanation,) = scheduler.explain_unscheduled()
+    assert explanation.reasons.get("students") == 2
+
+    # a timetable with both in parallel fails validation as a student clash
+    timetable = {"CSE": {"5": {("Fri", "09:00-10:30"): ("CS401", "Compilers", "Prof A", "Lecture", "C101"),
+                               ("Fri", "09:30-11:00"): ("CS402", "Graphics", "Prof B", "Lecture", "C102")}}}
+    report = validate_timetable(timetable, enrollment=scheduler.enrollment)
+    assert len(report.students) == 1 and not report.cohort
+    assert validate_timetable(timetable).cohort
+
+
+def test_removing_an_overlapping_elective_keeps_the_other_blocked():
+    scheduler = _electives({"S1": ["CS401"], "S2": ["CS402"]})
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    assert {code for _, _, code in scheduler.timetable["CSE"]["5"]} == {"CS401", "CS402"}
+    kept = next(iter(scheduler.timetable["CSE"]["5"].values()))[0]
+    gone = "CS402" if kept == "CS401" else "CS401"
+
+    scheduler.remove_course("CSE", "5", gone)
+    scheduler.set_faculty_unavailable("Prof C", days=["Mon", "Tue", "Wed", "Thu"])
+    scheduler.add_course("CSE", "5", "CS403", "Core", "Prof C", "C103", lecture_hours=1)
+    # both Friday slots overlap the remaining elective, which the core course clashes with
+    assert [entry[0] for entry in scheduler.timetable["CSE"]["5"].values()] == [kept]
+    assert scheduler.validate().cohort == []
+
+
+def test_disjoint_electives_share_a_slot_on_the_stock_grid():
+    scheduler = TimetableScheduler()
+    # both faculty are only free for the first lecture slot on Friday
+    for name in ("Prof A", "Prof B"):
+        scheduler.set_faculty_unavailable(name, days=["Mon", "Tue", "Wed", "Thu"])
+        scheduler.set_faculty_unavailable(name, days="Fri", window="10:30-18:30")
+    scheduler.add_course("CSE", "5", "CS401", "Compilers", "Prof A", "C101", lecture_hours=1)
+    scheduler.add_course("CSE", "5", "CS402", "Graphics", "Prof B", "C102", lecture_hours=1)
+    scheduler.set_enrollment({"S1": ["CS401"], "S2": ["CS402"]})
+    for solver in TimetableScheduler.SOLVERS:
+        timetable, unscheduled = scheduler.generate_timetable(notify=False, solver=solver, seed=0)
+        assert unscheduled == []
+        assert set(timetable["CSE"]["5"]) == {("Fri", "09:00-10:30", "CS401"), ("Fri", "09:00-10:30", "CS402")}
+        assert scheduler.validate().ok
+
+
+def test_elective_shared_by_branches_is_placed_once():
+    scheduler = TimetableScheduler()
+    for branch, room in (("CSE", "C101"), ("ECE", "C102")):
+        scheduler.add_course(branch, "5", f"{branch}501", "Core", f"Prof {branch}", room, lecture_hours=3)
+        scheduler.add_course(branch, "5", "CS450", "Machine Learning", "Prof M", "C301", lecture_hours=3)
+    scheduler.set_enrollment({"S1": ["CSE501", "CS450"], "S2": ["ECE501", "CS450"]})
+
+    def shared(branch):
+        return {k: e for k, e in scheduler.timetable[branch]["5"].items() if e[0] == "CS450"}
+
+    for solver in TimetableScheduler.SOLVERS:
+        _, unscheduled = scheduler.generate_timetable(notify=False, solver=solver, seed=0)
+        assert unscheduled == []
+        # the same two sessions (day, slot and room) in both timetables
+        assert len(shared("CSE")) == 2 and shared("CSE") == shared("ECE")
+        assert scheduler.validate().ok
+
+    # dropping it from one branch keeps it for the other
+    scheduler.remove_course("CSE", "5", "CS450")
+    assert shared("CSE") == {} and len(shared("ECE")) == 2
+    assert scheduler.unscheduled == [] and scheduler.validate().ok
@@ -0,0 +1,56 @@
+import csv
+import json
+import zipfile
+from src.export import export_timetable, render_timetable
+from src.utils import export_to_csv
+from src.views import TimetableViews
+
+TIMETABLE = {"CSE": {"3": {
+    ("Tue", "09:00-10:30"): ("CS301", "Networks", "Prof A; Prof B", "Lecture", "C205"),
+    ("Mon", "14:00-15:30"): ("CS302", "Compilers", ["Prof B"], "Lecture", "C204"),
+    ("Mon", "09:00-10:30"): ("CS301", "Networks", "Prof A; Prof B", "Lecture", "C205"),
+}}, "ECE": {"5": {
+    ("Mon", "10:45-12:15"): ("EC501", "VLSI", "Prof B", "Lecture", "C205"),
+}}}
+
+def test_views_are_sorted_and_indexed_once():
+    views = TimetableViews(TIMETABLE)
+    assert [(r[2], r[3]) for r in views.cohort("CSE", "3")] == [
+        ("Mon", "09:00-10:30"), ("Mon", "14:00-15:30"), ("Tue", "09:00-10:30")]
+    assert [r[4] for r in views.faculty("Prof B")] == ["CS301", "EC501", "CS302", "CS301"]
+    assert [r[4] for r in views.room("C205")] == ["CS301", "EC501", "CS301"]
+    assert len(views.master) == 4
+
+def test_export_formats_and_views(tmp_path):
+    paths = export_timetable(TIMETABLE, tmp_path, formats=("csv", "json", "ics"),
+                             views=("cohort", "faculty", "room", "master"), workers=4)
+    # 2 cohorts, 2 faculty, 2 rooms, 1 master sheet
+    assert len(paths) == 3 * (2 + 2 + 2 + 1)
+    with open(tmp_path / "faculty" / "Prof_A.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:3] == ["Branch", "Semester", "Day"] and len(rows) == 3
+    master = json.loads((tmp_path / "timetable_master.json").read_text())
+    assert master[0]["code"] == "CS301" and master[0]["day"] == "Mon"
+    ics = (tmp_path / "rooms" / "C205.ics").read_text()
+    assert ics.count("BEGIN:VEVENT") == 3 and "RRULE:FREQ=WEEKLY" in ics
+
+def test_zip_and_legacy_csv(tmp_path):
+    names = export_timetable(TIMETABLE, formats=("csv",), views=("cohort", "room"), zip_path=tmp_path / "out.zip")
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert sorted(archive.namelist()) == sorted(names)
+        assert "rooms/C204.csv" in names
+    paths = export_to_csv(TIMETABLE, tmp_path / "legacy")
+    with open(paths[0], newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["Day", "Slot", "Course Code", "Course Name", "Faculty", "Type", "Room"]
+    assert [r[0] for r in rows[1:]] == ["Mon", "Mon", "Tue"]
+
+def test_names_that_sanitize_alike_get_separate_files():
+    timetable = {"CSE": {"3": {
+        ("Mon", "09:00-10:30"): ("CS301", "Networks", "Dr. A/B", "Lecture", "C205"),
+        ("Tue", "09:00-10:30"): ("CS302", "Compilers", "Dr. A B", "Lecture", "c205"),
+    }}}
+    files = render_timetable(timetable, views=("faculty", "room"))
+    assert len(files) == 4
+    assert "faculty/Dr._A_B.csv" in files and "rooms/C205.csv" in files
+    assert sorted(text.count("\n") for name, text in files.items()) == [2, 2, 2, 2]
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import pytest
+from src.csv_import import CSVImportError, load_classrooms
+from src.scheduler import TimetableScheduler
+
+# generous budget for `import src.scheduler` in a fresh interpreter (measured ~30 ms)
+IMPORT_BUDGET_SECONDS = 0.5
+
+def test_core_imports_without_tk_within_budget():
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import src.scheduler, src.csv_import\n"
+        "print(time.perf_counter() - t, 'tkinter' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    elapsed, tk_loaded = out.stdout.split()
+    assert tk_loaded == "False"
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+def test_notify_callback_receives_summary():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=3, lab_hours=2)
+    calls = []
+    scheduler.generate_timetable(notify=lambda *args: calls.append(args))
+    (level, title, message), = calls
+    assert level == "warning" and "Networks (Lab)" in message
+
+def test_csv_errors_raise_or_go_to_callback(tmp_path):
+    path = tmp_path / "rooms.csv"
+    path.write_text("wrong,header\n1,2\n")
+    with pytest.raises(CSVImportError):
+        load_classrooms(path)
+    errors = []
+    assert load_classrooms(path, on_error=errors.append) == []
+    assert len(errors) == 1 and errors[0].startswith("Invalid Classroom CSV format!")
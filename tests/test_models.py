@@ -1,4 +1,4 @@
-from src.models import Course
+from src.models import Course, Interner
 
 def test_course_creation():
     course = Course("CS101", "Intro to CS", "Prof X", "C101", 3, "CSE", "1")
@@ -9,3 +9,15 @@ def test_course_creation():
     assert course.hours_per_week == 3
     assert course.branch == "CSE"
     assert course.semester == "1"
+
+def test_interner_and_slots():
+    interner = Interner(["C101", "C102"])
+    assert interner.id("C102") == 1
+    assert interner.id("L201") == 2
+    assert interner[2] == "L201" and len(interner) == 3
+    course = Course("CS101", "Intro to CS", "Prof X", "C101", 3, "CSE", "1")
+    try:
+        course.extra = 1
+        assert False, "Course should not take new attributes"
+    except AttributeError:
+        pass
@@ -0,0 +1,26 @@
+from src.occupancy import OccupancyIndex, slot_mask
+from src.scheduler import _intervals_overlap, _parse_slot_to_minutes
+from src.utils import SLOTS
+
+def test_slot_masks_match_interval_overlap():
+    for a in SLOTS:
+        for b in SLOTS:
+            expected = _intervals_overlap(*_parse_slot_to_minutes(a), *_parse_slot_to_minutes(b))
+            assert bool(slot_mask(a) & slot_mask(b)) == expected
+
+def test_mark_and_unmark():
+    index = OccupancyIndex()
+    index.mark("C205", "Mon", slot_mask("10:00-11:30"))
+    assert index.conflicts("C205", "Mon", slot_mask("11:00-12:30"))
+    assert not index.conflicts("C205", "Mon", slot_mask("11:30-13:00"))
+    assert not index.conflicts("C205", "Tue", slot_mask("10:00-11:30"))
+    index.unmark("C205", "Mon", slot_mask("10:00-11:30"))
+    assert not index.conflicts("C205", "Mon", slot_mask("11:00-12:30"))
+    assert len(index) == 0
+
+def test_ids_index_flat_masks():
+    index = OccupancyIndex()
+    kid = index.key_id(("CSE", "3"))
+    index.mark(("CSE", "3"), "Wed", slot_mask("09:00-10:30"))
+    assert index.masks[kid * index.n_days + index.day_ids["Wed"]] == slot_mask("09:00-10:30")
+    assert index.key_id(("CSE", "3")) == kid
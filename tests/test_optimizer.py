@@ -0,0 +1,42 @@
+from src.scheduler import TimetableScheduler
+from src.optimizer import LocalSearchOptimizer
+
+def _intervals_by(timetable, key_fn):
+    seen = {}
+    for branch, sems in timetable.items():
+        for sem, table in sems.items():
+            for (day, slot, _), entry in table.items():
+                s, e = slot.split("-")
+                seen.setdefault(key_fn(branch, sem, day, entry), []).append((s, e))
+    return seen
+
+def test_optimizer_improves_without_breaking_hard_constraints():
+    scheduler = TimetableScheduler()
+    for sem in ("3", "5"):
+        for i in range(5):
+            scheduler.add_course("CSE", sem, f"CS{sem}0{i}", f"Course {i}", f"Prof {i}",
+                                 f"C20{i}", lecture_hours=3, tutorial_hours=1)
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, seed=11)
+    sessions = sum(len(t) for t in timetable["CSE"].values())
+
+    report = scheduler.optimize(time_budget=0.5, seed=11)
+
+    assert report["after"] <= report["before"]
+    assert sum(len(t) for t in scheduler.timetable["CSE"].values()) == sessions
+    for key_fn in (lambda b, s, d, e: (e[4], d), lambda b, s, d, e: (b, s, d)):
+        for intervals in _intervals_by(scheduler.timetable, key_fn).values():
+            intervals.sort()
+            for (_, prev_end), (start, _) in zip(intervals, intervals[1:]):
+                assert prev_end <= start
+
+def test_objective_counts_faculty_back_to_back():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=3)
+    scheduler.add_course("CSE", "5", "CS501", "Software", "Prof A", "C204", lecture_hours=3)
+    scheduler.generate_timetable(notify=False, solver="greedy")
+    scheduler._adopt({"CSE": {
+        "3": {("Mon", "09:00-10:30"): ("CS301", "Networks", "Prof A", "Lecture", "C205")},
+        "5": {("Mon", "10:30-12:00"): ("CS501", "Software", "Prof A", "Lecture", "C204")},
+    }}, [])
+    optimizer = LocalSearchOptimizer(scheduler, weights={"gap": 0, "spread": 0}, time_budget=0)
+    assert optimizer.run()["before"] == LocalSearchOptimizer.DEFAULT_WEIGHTS["back_to_back"]
@@ -0,0 +1,27 @@
+from src.quality import cohort_gaps, room_spread, score_timetable
+from src.scheduler import TimetableScheduler
+from src.slots import SlotCatalogue
+
+def test_score_components():
+    timetable = {"CSE": {"3": {
+        ("Mon", "09:00-10:30"): ("CS301", "Networks", "Prof A", "Lecture", "C205"),
+        ("Mon", "14:00-15:30"): ("CS302", "Compilers", "Prof B", "Lecture", "C205"),
+        ("Tue", "09:00-10:30"): ("CS301", "Networks", "Prof A", "Lecture", "C204"),
+    }}}
+    assert cohort_gaps(timetable) == 14 * 60 - (10 * 60 + 30)
+    assert room_spread(timetable) == 1
+    assert score_timetable(timetable, [("CSE", "3", "Networks", "Lab")]) == (1, 210, 1)
+
+def test_score_counts_missing_sessions_on_the_scheduler_grid():
+    catalogue = SlotCatalogue({"Lecture": ["08:00-09:00", "12:00-13:00"]})
+    scheduler = TimetableScheduler(slots=catalogue)
+    scheduler.set_faculty_unavailable("Prof A", days=["Mon", "Tue", "Wed", "Thu"])
+    # 5 one-hour lectures, only Friday is free: one placed, four missing
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=5)
+    scheduler.add_course("CSE", "3", "CS302", "Compilers", "Prof B", "C205", lecture_hours=1)
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    assert len(unscheduled) == 1 and scheduler._missing_sessions() == 4
+
+    score = score_timetable(timetable, unscheduled, catalogue, scheduler._missing_sessions())
+    assert score[0] == 4
+    assert score[1] == cohort_gaps(timetable, catalogue)
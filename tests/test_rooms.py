@@ -0,0 +1,36 @@
+from src.rooms import RoomPool, room_kind
+from src.scheduler import TimetableScheduler
+
+ROOMS = [
+    {"room_no": "C004", "room_type": "auditorium", "capacity": 240},
+    {"room_no": "C101", "room_type": "classroom", "capacity": 96},
+    {"room_no": "C403", "room_type": "classroom", "capacity": 78},
+    {"room_no": "C002", "room_type": "large classroom", "capacity": 116},
+    {"room_no": "L106", "room_type": "software lab", "capacity": 40},
+    {"room_no": "C103", "room_type": "library", "capacity": 0},
+]
+
+def test_room_pool_orders_fitting_rooms_by_capacity():
+    pool = RoomPool(ROOMS)
+    assert room_kind("Hardware lab") == "lab"
+    assert room_kind("Library") is None
+    assert pool.candidates("class", 80) == ("C101", "C002", "C004")
+    assert pool.candidates("class", 500) == ("C004", "C002", "C101", "C403")
+    assert pool.candidates("lab", 30) == ("L106",)
+    assert len(pool) == 5
+
+def test_scheduler_picks_smallest_free_room_that_fits():
+    scheduler = TimetableScheduler()
+    scheduler.set_rooms(ROOMS)
+    for i in range(3):
+        scheduler.add_course("CSE", str(i + 1), f"CS{i}", f"Course {i}", f"Prof {i}", "", lecture_hours=3)
+        scheduler.courses["CSE"][str(i + 1)][f"CS{i}"]["students"] = 90
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="greedy")
+    assert unscheduled == []
+    used = {}
+    for sem, table in timetable["CSE"].items():
+        for (day, slot, _), entry in table.items():
+            assert entry[4] in ("C101", "C002", "C004")
+            used.setdefault((entry[4], day), []).append(slot)
+    # the smallest fitting room is used whenever it is free
+    assert any(room == "C101" for room, _ in used)
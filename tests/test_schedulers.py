@@ -1,3 +1,4 @@
+import pytest
 from src.scheduler import TimetableScheduler
 
 def _to_minutes(slot):
@@ -20,7 +21,7 @@ def test_scheduler_no_room_overlap():
     for branch in timetable:
         for sem in timetable[branch]:
             # scheduler stores (code, name, faculty, type, room)
-            for (day, slot), (_, _, _, _, room) in timetable[branch][sem].items():
+            for (day, slot, _), (_, _, _, _, room) in timetable[branch][sem].items():
                 s, e = _to_minutes(slot)
                 key = (room, day)
                 if key not in assignments:
@@ -31,3 +32,178 @@ def test_scheduler_no_room_overlap():
                 assignments[key].append((s, e))
 
     assert len(unscheduled) == 0
+
+def _dense_scheduler():
+    scheduler = TimetableScheduler()
+    for i in range(6):
+        scheduler.add_course("CSE", "3", f"CS30{i}", f"Course {i}", f"Prof {i}", "C205",
+                             lecture_hours=3, tutorial_hours=1)
+    scheduler.add_course("CSE", "3", "CS310", "Lab Course", "Prof L", "C205",
+                         lecture_hours=3, lab_hours=4, lab_room="L106")
+    return scheduler
+
+def test_greedy_solver_is_deterministic_per_seed():
+    first, unscheduled = _dense_scheduler().generate_timetable(notify=False, solver="greedy", seed=7)
+    second, _ = _dense_scheduler().generate_timetable(notify=False, solver="greedy", seed=7)
+    assert first == second
+    assert unscheduled == []
+    # 7 courses x 2 lectures, 6 tutorials, 2 labs
+    assert len(first["CSE"]["3"]) == 7 * 2 + 6 + 2
+
+def test_unknown_solver_rejected():
+    with pytest.raises(ValueError):
+        TimetableScheduler().generate_timetable(notify=False, solver="nope")
+
+def test_exact_solver_completes_dense_semester():
+    scheduler = _dense_scheduler()
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="exact", time_budget=5)
+    assert unscheduled == []
+    assert len(timetable["CSE"]["3"]) == 7 * 2 + 6 + 2
+
+def test_generate_best_keeps_a_complete_schedule():
+    scheduler = _dense_scheduler()
+    timetable, unscheduled = scheduler.generate_best(n_restarts=4, workers=1, seed=3)
+    assert unscheduled == []
+    assert scheduler.best_score[0] == 0
+    # occupancy is rebuilt for the adopted timetable
+    day, slot, _ = next(iter(timetable["CSE"]["3"]))
+    assert scheduler._branch_sem_conflicts("CSE", "3", day, slot)
+
+def test_generate_best_in_process_pool():
+    scheduler = _dense_scheduler()
+    _, unscheduled = scheduler.generate_best(n_restarts=3, workers=2, seed=1, solver="greedy")
+    assert unscheduled == []
+    assert scheduler.best_seed in (1, 2, 3)
+
+@pytest.mark.parametrize("solver", TimetableScheduler.SOLVERS)
+def test_faculty_never_double_booked(solver):
+    scheduler = TimetableScheduler()
+    for sem, room in (("3", "C205"), ("5", "C204")):
+        for i in range(4):
+            scheduler.add_course("CSE", sem, f"CS{sem}0{i}", f"Course {i}", "Prof A; Prof B",
+                                 f"{room}-{i}", lecture_hours=3)
+    scheduler.set_faculty_unavailable("Prof B", days=["Mon", "Tue"])
+    scheduler.set_faculty_unavailable("Prof A", window="14:00-18:30")
+    timetable, _ = scheduler.generate_timetable(notify=False, solver=solver, seed=5, time_budget=0.5)
+
+    busy = {}
+    for sem, table in timetable["CSE"].items():
+        for (day, slot, _) in table:
+            assert day not in ("Mon", "Tue")
+            s, e = _to_minutes(slot)
+            assert e <= 14 * 60
+            for (os, oe) in busy.get(day, []):
+                assert oe <= s or e <= os
+            busy.setdefault(day, []).append((s, e))
+
+def test_incremental_changes_keep_other_sessions_pinned():
+    scheduler = _dense_scheduler()
+    timetable, _ = scheduler.generate_timetable(notify=False, solver="greedy")
+    before = dict(timetable["CSE"]["3"])
+
+    scheduler.add_course("CSE", "3", "CS320", "New Course", "Prof N", "C206", lecture_hours=3)
+    after_add = timetable["CSE"]["3"]
+    assert sum(1 for e in after_add.values() if e[0] == "CS320") == 2
+    moved = [k for k, e in before.items() if after_add.get(k) != e]
+    assert len(moved) <= 2
+
+    scheduler.update_course("CSE", "3", "CS320", lecture_hours=1)
+    assert sum(1 for e in timetable["CSE"]["3"].values() if e[0] == "CS320") == 1
+
+    scheduler.remove_course("CSE", "3", "CS320")
+    assert all(e[0] != "CS320" for e in timetable["CSE"]["3"].values())
+    assert "CS320" not in scheduler.courses["CSE"]["3"]
+
+def test_incremental_add_repairs_by_moving_one_session():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Tut A", "Prof A", "C205", tutorial_hours=1)
+    scheduler.generate_timetable(notify=False, solver="greedy")
+    # fill every remaining tutorial slot of the cohort but one, all in the same room
+    for i in range(8):
+        scheduler.add_course("CSE", "3", f"CS31{i}", f"Tut {i}", f"Prof {i}", "C205", tutorial_hours=1)
+    assert scheduler.unscheduled == []
+    # the last free tutorial slot goes to a course whose faculty is blocked on that day
+    taken = {key[:2] for key in scheduler.timetable["CSE"]["3"]}
+    (free_day, free_slot), = {(d, s) for d in ("Mon", "Tue", "Wed", "Thu", "Fri")
+                               for s in TimetableScheduler.TYPE_POOLS["Tutorial"]} - taken
+    scheduler.set_faculty_unavailable("Prof Z", days=[free_day])
+    scheduler.add_course("CSE", "3", "CS399", "Tut Z", "Prof Z", "C205", tutorial_hours=1)
+    assert scheduler.unscheduled == []
+    assert len(scheduler.timetable["CSE"]["3"]) == 10
+
+def test_stats_are_opt_in_and_count_rejections(tmp_path):
+    scheduler = _dense_scheduler()
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=1)
+    assert scheduler.stats is None
+
+    scheduler.enable_stats(profile=str(tmp_path / "run.prof"))
+    scheduler.add_course("CSE", "3", "CS399", "No Room", "Prof Z", "", lab_hours=2)
+    timetable, _ = scheduler.generate_timetable(notify=False, solver="greedy", seed=1)
+    stats = scheduler.stats.as_dict()
+    assert stats["placed"] == len(timetable["CSE"]["3"])
+    assert stats["probes"] >= stats["placed"]
+    assert stats["rejections"]["no_room"] == 1
+    assert stats["rejections"]["same_day"] + stats["rejections"]["cohort"] > 0
+    assert set(stats["cohort_seconds"]) == {"CSE Sem-3"}
+    assert stats["pool_sizes"]["slots"]["Tutorial"] == 10
+    assert (tmp_path / "run.prof").exists()
+
+@pytest.mark.parametrize("solver", ["random", "greedy", "exact"])
+def test_progress_per_cohort_and_cooperative_cancel(solver):
+    import threading
+    from src.scheduler import GenerationCancelled
+    scheduler = TimetableScheduler()
+    for i, sem in enumerate(("1", "3", "5")):
+        scheduler.add_course("CSE", sem, f"CS{i}01", f"Course {i}", f"Prof {i}", f"C{i}", lecture_hours=3)
+    scheduler.add_course("ECE", "1", "EC101", "Circuits", "Prof E", "E1", lecture_hours=3)
+
+    events = []
+    scheduler.generate_timetable(notify=False, solver=solver, seed=0, progress=lambda *e: events.append(e))
+    assert [done for done, _, _ in events] == [1, 2, 3, 4]
+    assert {total for _, total, _ in events} == {4}
+    assert {cohort for _, _, cohort in events} == {"CSE Sem-1", "CSE Sem-3", "CSE Sem-5", "ECE Sem-1"}
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(GenerationCancelled):
+        scheduler.generate_timetable(notify=False, solver=solver, seed=0, cancel=cancel)
+    assert scheduler._cancel is None
+
+def test_unavailability_on_a_live_timetable_moves_sessions_and_survives_removal():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C101", lecture_hours=1)
+    scheduler.add_course("CSE", "3", "CS302", "Compilers", "Prof B", "C102", lecture_hours=1)
+    timetable, _ = scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    (day, _, _), = [k for k, e in timetable["CSE"]["3"].items() if e[0] == "CS301"]
+
+    # blocking Prof A for the day of CS301 moves it off that day
+    scheduler.set_faculty_unavailable("Prof A", days=[day])
+    assert [d for (d, _, _), e in timetable["CSE"]["3"].items() if e[0] == "CS301"] not in ([], [day])
+    assert scheduler.unscheduled == []
+
+    # removing and re-adding the course must not free the blocked window
+    scheduler.remove_course("CSE", "3", "CS301")
+    assert scheduler._faculty_conflicts("Prof A", day, "09:00-10:30")
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C101", lecture_hours=1)
+    scheduler.add_course("CSE", "3", "CS303", "Databases", "Prof A", "C103", lecture_hours=1)
+    assert all(d != day for (d, _, _), e in timetable["CSE"]["3"].items() if e[2] == "Prof A")
+    assert scheduler.validate().ok
+
+def test_rename_by_overwriting_courses_drops_old_unscheduled_entries():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C101", lecture_hours=3, lab_hours=2)
+    scheduler.add_course("CSE", "3", "CS302", "Compilers", "Prof B", "C102", lab_hours=2)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    assert sorted(scheduler.unscheduled) == [("CSE", "3", "Compilers", "Lab"), ("CSE", "3", "Networks", "Lab")]
+
+    # the caller overwrites the info (as the UI does), then asks for a re-place
+    courses = scheduler.courses["CSE"]["3"]
+    courses["CS301"] = dict(courses["CS301"], name="Computer Networks", lab_room="L1")
+    scheduler.update_course("CSE", "3", "CS301")
+    # nothing of CS302 was placed, so its old name has to be passed
+    courses["CS302"] = dict(courses["CS302"], name="Compiler Design", lab_room="L2")
+    scheduler.update_course("CSE", "3", "CS302", previous_name="Compilers")
+
+    assert scheduler.unscheduled == []
+    assert scheduler.explain_unscheduled() == []
+    assert {e[1] for e in scheduler.timetable["CSE"]["3"].values()} == {"Computer Networks", "Compiler Design"}
@@ -0,0 +1,83 @@
+import asyncio
+import json
+from src.service import LocalClient, SchedulingService
+
+COURSES = """Course Code,Course Name,Faculty Name,L-T-P-S-C,No. of Students Registered,Semester,Branch
+CS301,Networks,Prof A,3-0-2-0-4,60,3,CSE
+CS302,Compilers,"Prof B, Prof C",3-1-0-0-4,60,3,CSE
+EC501,VLSI,Prof D,3-0-0-0-3,40,5,ECE
+"""
+ROOMS = """Room No,Room Type,Room Capacity
+C101,Classroom,96
+C102,Classroom,60
+L106,Software lab,60
+"""
+
+
+def test_jobs_run_isolated_and_serve_results_and_exports():
+    async def scenario():
+        service = SchedulingService(workers=2)
+        client = LocalClient(service)
+        try:
+            status, job = await client.post("/jobs", {"courses_csv": COURSES, "rooms_csv": ROOMS, "seed": 1})
+            assert status == 202 and job["id"]
+            # a second job with different input must not see the first one's courses
+            _, other = await client.post("/jobs", {"courses": [
+                {"code": "MA101", "name": "Calculus", "faculty": "Prof M", "lecture_hours": 3,
+                 "semester": "1", "branch": "DSAI", "class_room": "D1"}]})
+
+            done = await client.wait(job["id"])
+            assert done["status"] == "done" and done["progress"]["done"] == done["progress"]["total"] == 2
+            assert (await client.wait(other["id"]))["sessions"] == 2
+
+            _, result = await client.get(f"/jobs/{job['id']}/result")
+            assert {r["code"] for r in result["timetable"]} == {"CS301", "CS302", "EC501"}
+            assert result["unscheduled"] == [] and result["validation"]["room"] == []
+
+            status, names = await client.get(f"/jobs/{job['id']}/exports?format=csv&format=ics&view=faculty")
+            assert status == 200 and "faculty/Prof_A.csv" in names and "faculty/Prof_A.ics" in names
+            status, data = await client.get(f"/jobs/{job['id']}/exports/faculty/Prof_A.csv?view=faculty")
+            assert status == 200 and data.startswith(b"Branch,Semester,Day")
+
+            assert (await client.get("/jobs/nope"))[0] == 404
+            assert (await client.post("/jobs", {"courses_csv": COURSES, "solver": "magic"}))[0] == 400
+            # bad course rows are refused up front, naming the field
+            for rows, field in (([{"x": 1}], "courses[0].code"), ("CS301", "courses"),
+                                ([{"code": "CS301"}, {"code": "CS302", "lecture_hours": "three"}],
+                                 "courses[1].lecture_hours"),
+                                ([{"code": "CS301", "faculty": {"name": "Prof A"}}], "courses[0].faculty")):
+                status, error = await client.post("/jobs", {"courses": rows})
+                assert status == 400 and error["error"].startswith(field)
+            assert (await client.delete(f"/jobs/{other['id']}"))[1]["status"] == "forgotten"
+            _, jobs = await client.get("/jobs")
+            assert [j["id"] for j in jobs] == [job["id"]]
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+def test_http_round_trip_on_localhost():
+    async def scenario():
+        service = SchedulingService(workers=1)
+        host, port = await service.start(port=0)
+        assert host == "127.0.0.1"
+        try:
+            body = json.dumps({"courses_csv": "Code,Semester\n"}).encode()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"POST /jobs HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                         b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            head, _, payload = response.partition(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 202 Accepted")
+            job = json.loads(payload)
+
+            # the CSV lacks required columns: the job fails with the import error
+            done = await LocalClient(service).wait(job["id"])
+            assert done["status"] == "failed" and "Missing column" in done["error"]
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,33 @@
+from src.scheduler import TimetableScheduler
+from src.scheduler import _intervals_overlap
+from src.slots import DEFAULT_CATALOGUE, SlotCatalogue
+from src.utils import SLOTS, parse_slot_to_minutes
+
+def test_overlap_table_matches_intervals():
+    cat = DEFAULT_CATALOGUE
+    assert len(cat) == len(set(SLOTS))
+    for a in SLOTS:
+        for b in SLOTS:
+            expected = _intervals_overlap(*parse_slot_to_minutes(a), *parse_slot_to_minutes(b))
+            assert bool(cat.overlap[cat.slot_id(a)][cat.slot_id(b)]) == expected
+            assert cat.overlaps(a, b) == expected
+
+def test_custom_grid_from_csv(tmp_path):
+    path = tmp_path / "grid.csv"
+    path.write_text("Type,Slot\nlecture,08:00-09:00\nLecture,09:00-10:00\nLab,08:00-10:00\n")
+    cat = SlotCatalogue.from_csv(path)
+    assert cat.pools["Lecture"] == ("08:00-09:00", "09:00-10:00")
+    assert cat.pools["Tutorial"] == ()
+    assert cat.overlaps("08:00-10:00", "09:00-10:00")
+    assert not cat.overlaps("08:00-09:00", "09:00-10:00")
+    assert cat.durations == {"Lecture": 1.0, "Lab": 2.0}
+    assert DEFAULT_CATALOGUE.durations == TimetableScheduler.TYPE_DURATION
+
+    scheduler = TimetableScheduler(slots=cat)
+    scheduler.add_course("CSE", "1", "CS101", "Intro", "Prof X", "C101", lecture_hours=3)
+    timetable, unscheduled = scheduler.generate_timetable(notify=False, solver="greedy")
+    assert not unscheduled
+    # 3 lecture hours on a grid of 1-hour lecture slots are 3 sessions
+    assert len(timetable["CSE"]["1"]) == 3
+    assert scheduler.validate().ok
+    assert {slot for _, slot, _ in timetable["CSE"]["1"]} <= set(cat.pools["Lecture"])
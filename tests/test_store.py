@@ -0,0 +1,44 @@
+from src.scheduler import TimetableScheduler
+from src.store import ScheduleStore
+
+def _scheduler():
+    scheduler = TimetableScheduler()
+    scheduler.set_rooms([{"room_no": "C101", "room_type": "classroom", "capacity": 120},
+                         {"room_no": "L1", "room_type": "lab", "capacity": 60}])
+    scheduler.set_faculty_unavailable("Prof A", days="Mon")
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A; Prof B", "", lecture_hours=3, lab_hours=2, students=90)
+    scheduler.add_course("ECE", "5", "EC501", "VLSI", "Prof B", "", lecture_hours=3, students=90)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=1)
+    return scheduler
+
+def test_save_load_round_trip(tmp_path):
+    scheduler = _scheduler()
+    with ScheduleStore(tmp_path / "term.db") as store:
+        store.save(scheduler)
+    with ScheduleStore(tmp_path / "term.db") as store:
+        loaded = store.load()
+    assert loaded.timetable == scheduler.timetable
+    assert loaded.courses["CSE"]["3"]["CS301"]["lab_hours"] == 2
+    assert loaded.faculty_unavailable == scheduler.faculty_unavailable
+    assert sorted(r["room_no"] for r in loaded.room_pool.as_rows()) == ["C101", "L1"]
+    # the restored scheduler is live: course edits are placed incrementally
+    loaded.add_course("ECE", "5", "EC502", "Signals", "Prof C", "", lecture_hours=3, students=60)
+    assert sum(1 for e in loaded.timetable["ECE"]["5"].values() if e[0] == "EC502") == 2
+
+def test_queries_and_snapshot_diff():
+    scheduler = _scheduler()
+    store = ScheduleStore()
+    store.save(scheduler)
+    store.snapshot("before", scheduler)
+    assert {r[4] for r in store.sessions(faculty="Prof B")} == {"CS301", "EC501"}
+    assert {r[4] for r in store.sessions(faculty="Prof A")} == {"CS301"}
+    assert all(r[8] == "L1" for r in store.sessions(room="L1"))
+    assert len(store.sessions(branch="ECE", sem=5)) == 2
+    days = [r[2] for r in store.sessions(branch="CSE")]
+    assert days == sorted(days, key=["Mon", "Tue", "Wed", "Thu", "Fri"].index)
+
+    scheduler.remove_course("ECE", "5", "EC501")
+    store.snapshot("after", scheduler)
+    diff = store.diff("before", "after")
+    assert diff["added"] == [] and {r[4] for r in diff["removed"]} == {"EC501"}
+    assert [name for name, _, _ in store.snapshots()] == ["current", "before", "after"]
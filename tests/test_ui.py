@@ -0,0 +1,45 @@
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+from src import ui
+from src.scheduler import TimetableScheduler
+
+
+class _Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def test_finish_generation_applies_removals_made_during_the_run(monkeypatch):
+    monkeypatch.setattr(ui.messagebox, "showinfo", lambda *a: None)
+    monkeypatch.setattr(ui.messagebox, "showwarning", lambda *a: None)
+    # no Tk window: only what _finish_generation touches
+    app = ui.TimetableApp.__new__(ui.TimetableApp)
+    app.progress_text, app.display_branch, app.display_sem = _Var(), _Var(), _Var()
+    app.courses = {"CSE": {"3": {}, "5": {}}, "ECE": {"5": {}}}
+    app.courses["CSE"]["3"]["CS301"] = {"name": "Networks", "faculty": "Prof A", "class_room": "C101",
+                                        "lecture_hours": 3}
+    app.courses["CSE"]["5"]["CS501"] = {"name": "Compilers", "faculty": "Prof B", "class_room": "C102",
+                                        "lecture_hours": 3}
+    app.courses["ECE"]["5"]["EC501"] = {"name": "VLSI", "faculty": "Prof C", "class_room": "C103",
+                                        "lecture_hours": 3}
+
+    snapshot = {b: {s: {c: dict(i) for c, i in by.items()} for s, by in sems.items()}
+                for b, sems in app.courses.items()}
+    scheduler = TimetableScheduler(snapshot)
+    result = scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    # while the worker ran: the only course of CSE Sem-5 and of ECE were removed
+    del app.courses["CSE"]["5"]
+    del app.courses["ECE"]
+
+    app._finish_generation(scheduler, snapshot, result)
+    assert app.scheduler is scheduler
+    assert set(scheduler.courses) == {"CSE"} and set(scheduler.courses["CSE"]) == {"3"}
+    assert set(scheduler.timetable) == {"CSE"} and list(scheduler.timetable["CSE"]) == ["3"]
@@ -11,3 +11,10 @@ def test_slots():
         eh, em = map(int, end.split(":"))
         assert 0 <= sh < 24 and 0 <= sm < 60
         assert 0 <= eh < 24 and 0 <= em < 60
+
+def test_split_faculty():
+    from src.utils import split_faculty
+    assert split_faculty("Dr. Sunil P V - Section A; Dr. Vivekraj - Section B") == ("Dr. Sunil P V", "Dr. Vivekraj")
+    assert split_faculty("Dr. Suvadip Hazra – Section A and B") == ("Dr. Suvadip Hazra",)
+    assert split_faculty(["Prof A", "Prof B, Prof A"]) == ("Prof A", "Prof B")
+    assert split_faculty("TBD") == ()
@@ -0,0 +1,53 @@
+import random
+import pytest
+from src import validation
+from src.scheduler import TimetableScheduler
+from src.validation import validate_timetable
+
+def _clashing_timetable():
+    return {"CSE": {
+        "3": {
+            ("Mon", "10:00-11:30"): ("CS301", "Networks", "Prof A", "Lecture", "C205"),
+            ("Mon", "11:00-12:30"): ("CS302", "Compilers", "Prof B", "Lecture", "C204"),
+        },
+        "5": {
+            ("Mon", "10:45-12:15"): ("CS501", "Software", "Prof A; Prof C", "Lecture", "C205"),
+            ("Tue", "10:45-12:15"): ("CS502", "Graphics", "Prof C", "Lecture", "C205"),
+        },
+    }}
+
+def test_reports_each_kind_of_conflict():
+    courses = {"CSE": {"3": {"CS301": {"lecture_hours": 3}}}}
+    report = validate_timetable(_clashing_timetable(), courses)
+    assert report.sessions == 4
+    assert [(key, day) for key, day, _, _ in report.room] == [("C205", "Mon")]
+    assert [(key, day) for key, day, _, _ in report.faculty] == [("Prof A", "Mon")]
+    assert [(key, day) for key, day, _, _ in report.cohort] == [(("CSE", "3"), "Mon")]
+    assert report.shortfall == [("CSE", "3", "CS301", "Lecture", 2, 1)]
+    assert not report.ok and len(report.lines()) == 4
+
+def test_sweep_fallback_matches(monkeypatch):
+    expected = validate_timetable(_clashing_timetable()).as_dict()
+    monkeypatch.setattr(validation, "NUMPY_MIN_SESSIONS", 0)
+    assert validate_timetable(_clashing_timetable()).as_dict() == expected
+
+def test_numpy_overlaps_match_the_sweep_on_random_rows():
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    for n in (0, 1, 2, 50, 500):
+        res = [rng.randrange(8) for _ in range(n)]
+        day = [rng.randrange(5) for _ in range(n)]
+        start = [rng.randrange(9 * 60, 18 * 60) for _ in range(n)]
+        end = [s + rng.choice((30, 60, 90, 120)) for s in start]
+        rows = (res, day, start, end, list(range(n)), 5)
+        assert sorted(validation._overlaps_numpy(*rows)) == sorted(validation._overlaps_sweep(*rows))
+
+def test_generated_timetable_validates():
+    scheduler = TimetableScheduler()
+    for i in range(6):
+        scheduler.add_course("CSE", "3", f"CS30{i}", f"Course {i}", f"Prof {i % 3}", "C205",
+                             lecture_hours=3, tutorial_hours=1)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=1)
+    report = scheduler.validate()
+    assert report.room == report.faculty == report.cohort == []
+    assert len(report.shortfall) == len(scheduler.unscheduled)
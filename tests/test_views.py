@@ -0,0 +1,52 @@
+import pytest
+from src.scheduler import TimetableScheduler
+from src.views import TimetableViews, text_widths, week_grid
+
+TIMETABLE = {"CSE": {"3": {
+    ("Tue", "09:00-10:30"): ("CS301", "Networks", "Prof A; Prof B", "Lecture", "C205"),
+    ("Mon", "14:00-15:30"): ("CS302", "Compilers", ["Prof B"], "Lecture", "C204"),
+    ("Mon", "09:00-10:30"): ("CS301", "Networks", "Prof A; Prof B", "Lecture", "C205"),
+}}, "ECE": {"5": {
+    ("Mon", "10:45-12:15"): ("EC501", "VLSI", "Prof B", "Lecture", "C205"),
+}}}
+
+def test_week_grid_and_widths():
+    views = TimetableViews(TIMETABLE)
+    columns, rows = week_grid(views.faculty("Prof B"), with_cohort=True)
+    assert columns == ["Day", "09:00-10:30", "10:45-12:15", "14:00-15:30"]
+    assert [r[0] for r in rows] == ["Mon", "Tue", "Wed", "Thu", "Fri"]
+    assert rows[0] == ["Mon", "CS301 Lecture (CSE Sem-3, C205)", "EC501 Lecture (ECE Sem-5, C205)",
+                       "CS302 Lecture (CSE Sem-3, C204)"]
+    assert rows[2][1:] == ["", "", ""]
+    assert text_widths(columns, rows) == [3, 31, 31, 31]
+
+def test_scheduler_version_tracks_timetable_changes():
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=3)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    version = scheduler.version
+    scheduler.add_course("CSE", "3", "CS302", "Compilers", "Prof B", "C204", lecture_hours=1)
+    assert scheduler.version > version
+
+def test_ui_render_cache_follows_scheduler_version():
+    pytest.importorskip("tkinter")
+    from src.ui import TimetableApp
+
+    scheduler = TimetableScheduler()
+    scheduler.add_course("CSE", "3", "CS301", "Networks", "Prof A", "C205", lecture_hours=3)
+    scheduler.generate_timetable(notify=False, solver="greedy", seed=0)
+    # the cache only needs these attributes, so no Tk window is created
+    app = TimetableApp.__new__(TimetableApp)
+    app.scheduler, app.timetable = scheduler, scheduler.timetable
+    app._views = app._views_version = None
+    app._render_cache = {}
+
+    first = app._rendered("List", ("CSE", "3"))
+    assert len(first[1]) == 2
+    assert app._rendered("List", ("CSE", "3")) is first
+    assert app._rendered("Faculty", "Prof B") is None
+
+    scheduler.add_course("CSE", "3", "CS302", "Compilers", "Prof B", "C204", lecture_hours=1)
+    again = app._rendered("List", ("CSE", "3"))
+    assert again is not first and len(again[1]) == 3
+    assert app._rendered("Faculty", "Prof B") is not None